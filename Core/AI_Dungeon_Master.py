@@ -14,10 +14,12 @@ import json
 import os
 import re
 import shutil
+import signal
 import subprocess
 import sys
+import threading
 import time
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
 
 from Core.Helpers import (
     infer_species_and_comm_style,
@@ -56,6 +58,10 @@ class GemmaError(RuntimeError):
     """Light wrapper for any Gemma/Ollama-specific issues."""
 
 
+class GemmaStreamInterrupted(GemmaError):
+    """A streamed reply failed after part of it was already handed out."""
+
+
 class GemmaClient:
     """Small helper around Ollama (CLI or HTTP) so we can retry and tag requests."""
 
@@ -66,11 +72,14 @@ class GemmaClient:
         retry_backoff: float = 1.15,
         timeout: int = 90,
         base_url: Optional[str] = None,
+        keep_alive: str = "30m",
     ):
         self.model = model
         self.max_retries = max_retries
         self.retry_backoff = retry_backoff
         self.timeout = timeout
+        # Keep the model (and its prompt-prefix KV cache) resident between turns.
+        self.keep_alive = keep_alive
 
         # Decide between CLI and HTTP mode.
         env_host = os.environ.get("OLLAMA_HOST", "").strip()
@@ -138,66 +147,183 @@ class GemmaClient:
                 f"Unable to reach Ollama at {self.base_url}. Install Ollama or set OLLAMA_HOST. ({exc})"
             ) from exc
 
-    def _run(self, prompt: str, tag: str) -> str:
-        """Invoke Ollama and return plain text output (with retries + spinner)."""
-        spinner = LoadingBar(f"{tag}…")
-        for attempt in range(1, self.max_retries + 1):
-            try:
-                spinner.start()
-                if not hasattr(self, "_ollama_cmd") or not self._ollama_cmd:
-                    # HTTP mode via Ollama REST API
-                    import urllib.request
-
-                    req = urllib.request.Request(
-                        (self.base_url if hasattr(self, "base_url") and self.base_url else "http://127.0.0.1:11434")
-                        + "/api/generate",
-                        data=json.dumps({
-                            "model": self.model,
-                            "prompt": prompt,
-                            "stream": False,
-                        }).encode("utf-8"),
-                        headers={"Content-Type": "application/json"},
-                        method="POST",
+    def _generate_request(self, prompt: str, stream: bool, fmt: Optional[Any] = None):
+        """Build the POST to Ollama's /api/generate shared by _run and stream_text."""
+        import urllib.request
+
+        body_fields = {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": stream,
+            "keep_alive": getattr(self, "keep_alive", "30m"),
+        }
+        if fmt is not None:
+            body_fields["format"] = fmt
+        return urllib.request.Request(
+            (self.base_url if hasattr(self, "base_url") and self.base_url else "http://127.0.0.1:11434")
+            + "/api/generate",
+            data=json.dumps(body_fields).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+
+    def _run(self, prompt: str, tag: str, fmt: Optional[Any] = None, spinner: bool = True) -> str:
+        """Invoke Ollama and return plain text output (with retries + spinner).
+
+        ``fmt`` is forwarded as Ollama's ``format`` field: a JSON schema (HTTP)
+        constrains decoding to that shape; the CLI only supports plain JSON mode.
+        Pass ``spinner=False`` for calls running in the background.
+        """
+        spinner = LoadingBar(f"{tag}…", enabled=spinner)
+        try:
+            for attempt in range(1, self.max_retries + 1):
+                try:
+                    spinner.start()
+                    if not hasattr(self, "_ollama_cmd") or not self._ollama_cmd:
+                        # HTTP mode via Ollama REST API
+                        import urllib.request
+
+                        req = self._generate_request(prompt, stream=False, fmt=fmt)
+                        with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+                            body = resp.read().decode("utf-8", errors="ignore")
+                        spinner.stop()
+                        try:
+                            payload = json.loads(body or "{}")
+                            text = (payload.get("response") or "").strip()
+                        except Exception:
+                            text = (body or "").strip()
+                        if not text:
+                            raise GemmaError("Empty output from model.")
+                        return text
+                    cmd = [self._ollama_cmd, "run", self.model]
+                    if fmt is not None:
+                        cmd += ["--format", "json"]
+                    result = subprocess.run(
+                        cmd + [prompt],
+                        capture_output=True,
+                        text=True,
+                        encoding="utf-8",
+                        errors="ignore",
+                        timeout=self.timeout,
                     )
-                    with urllib.request.urlopen(req, timeout=self.timeout) as resp:
-                        body = resp.read().decode("utf-8", errors="ignore")
                     spinner.stop()
-                    try:
-                        payload = json.loads(body or "{}")
-                        text = (payload.get("response") or "").strip()
-                    except Exception:
-                        text = (body or "").strip()
+                    text = (result.stdout or "").strip()
                     if not text:
                         raise GemmaError("Empty output from model.")
                     return text
-                result = subprocess.run(
+                except Exception as exc:
+                    spinner.stop()
+                    if attempt >= self.max_retries:
+                        raise GemmaError(f"{tag} failed after {attempt} attempts: {exc}") from exc
+                    # Exponential-ish backoff so we do not hammer Ollama after errors.
+                    time.sleep(self.retry_backoff ** attempt)
+        finally:
+            # Pool workers are not daemons; never leave a spinner running (e.g., Ctrl+C).
+            spinner.stop()
+
+    def text(self, prompt: str, tag: str, max_chars: Optional[int] = None, spinner: bool = True) -> str:
+        """Return truncated text (handy for short responses)."""
+        output = self._run(prompt, tag, spinner=spinner)
+        return output[:max_chars] if max_chars else output
+
+    def stream_text(self, prompt: str, tag: str, max_chars: Optional[int] = None) -> Iterator[str]:
+        """Yield the reply in pieces as Gemma produces them (Ollama ``stream``).
+
+        The spinner runs only until the first piece arrives. If the stream
+        fails before producing anything we fall back to one blocking ``text``
+        call, so callers always get the same content a normal call would.
+        A failure after the first piece raises GemmaStreamInterrupted: the
+        caller has already shown part of the paragraph and decides how to
+        recover. Errors from the fallback ``text`` call propagate unchanged.
+        The whole stream is bounded by ``self.timeout``, like ``_run``.
+        """
+        spinner = LoadingBar(f"{tag}…")
+        sent = 0
+        try:
+            spinner.start()
+            if not self._ollama_cmd:
+                import urllib.request
+
+                req = self._generate_request(prompt, stream=True)
+                # urlopen's timeout only bounds each socket read, so a reply
+                # that keeps trickling in needs its own overall deadline.
+                deadline = time.monotonic() + self.timeout
+                with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+                    # Ollama streams one JSON object per line.
+                    for raw in resp:
+                        if time.monotonic() > deadline:
+                            raise GemmaError(f"timed out after {self.timeout}s")
+                        line = raw.decode("utf-8", errors="ignore").strip()
+                        if not line:
+                            continue
+                        payload = json.loads(line)
+                        piece = payload.get("response") or ""
+                        if piece:
+                            if max_chars is not None:
+                                piece = piece[: max_chars - sent]
+                            spinner.stop()
+                            sent += len(piece)
+                            yield piece
+                        if payload.get("done") or (max_chars is not None and sent >= max_chars):
+                            break
+            else:
+                proc = subprocess.Popen(
                     [self._ollama_cmd, "run", self.model, prompt],
-                    capture_output=True,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
                     text=True,
                     encoding="utf-8",
                     errors="ignore",
-                    timeout=self.timeout,
+                    # Own process group, so the watchdog also stops any helper
+                    # the CLI spawned that still holds the pipe open.
+                    start_new_session=(os.name != "nt"),
                 )
-                spinner.stop()
-                text = (result.stdout or "").strip()
-                if not text:
-                    raise GemmaError("Empty output from model.")
-                return text
-            except Exception as exc:
-                spinner.stop()
-                if attempt >= self.max_retries:
-                    raise GemmaError(f"{tag} failed after {attempt} attempts: {exc}") from exc
-                # Exponential-ish backoff so we do not hammer Ollama after errors.
-                time.sleep(self.retry_backoff ** attempt)
 
-    def text(self, prompt: str, tag: str, max_chars: Optional[int] = None) -> str:
-        """Return truncated text (handy for short responses)."""
-        output = self._run(prompt, tag)
-        return output[:max_chars] if max_chars else output
-
-    def json(self, prompt: str, tag: str) -> Any:
-        """Return parsed JSON; raise if Gemma fails to produce a JSON object."""
-        raw = self._run(prompt, tag)
+                def _kill() -> None:
+                    try:
+                        if os.name != "nt":
+                            os.killpg(proc.pid, signal.SIGKILL)
+                        else:
+                            proc.kill()
+                    except OSError:
+                        pass
+
+                # A hung `ollama run` would block read() forever; kill it once
+                # the same budget _run gives subprocess.run has passed.
+                watchdog = threading.Timer(self.timeout, _kill)
+                watchdog.daemon = True
+                watchdog.start()
+                try:
+                    for piece in iter(lambda: proc.stdout.read(32), ""):
+                        if max_chars is not None:
+                            piece = piece[: max_chars - sent]
+                        spinner.stop()
+                        sent += len(piece)
+                        yield piece
+                        if max_chars is not None and sent >= max_chars:
+                            break
+                    else:
+                        if watchdog.finished.is_set():
+                            raise GemmaError(f"timed out after {self.timeout}s")
+                finally:
+                    watchdog.cancel()
+                    if proc.poll() is None:
+                        _kill()
+                    proc.wait()
+        except Exception as exc:
+            if sent:
+                raise GemmaStreamInterrupted(f"{tag} stream failed after {sent} chars: {exc}") from exc
+        finally:
+            spinner.stop()
+        if not sent:
+            yield self.text(prompt, tag, max_chars=max_chars)
+
+    def json(self, prompt: str, tag: str, schema: Optional[Dict[str, Any]] = None) -> Any:
+        """Return parsed JSON; raise if Gemma fails to produce a JSON object.
+
+        Pass ``schema`` to have Ollama constrain the output to that JSON schema.
+        """
+        raw = self._run(prompt, tag, fmt=schema)
         match = re.search(r"\{.*\}", raw, flags=re.S)
         if not match:
             raise GemmaError(f"No JSON object in output for {tag}.")
@@ -382,6 +508,12 @@ def world_journal_prompt(state: "GameState") -> str:
     return base
 
 
+# Fixed instructions shared by every turn narration request (kept byte-identical).
+TURN_NARRATION_PREAMBLE = """
+Rules: Do NOT restate numeric meters. Use past tense third-person prose. No mid-word hyphenation.
+"""
+
+
 def turn_narration_prompt(state: "GameState", last_event: str, goal_lock: bool) -> str:
     """Explain what kind of turn narration we want right now."""
     blueprint = state.blueprint
@@ -389,15 +521,15 @@ def turn_narration_prompt(state: "GameState", last_event: str, goal_lock: bool)
     recent = summarize_for_prompt("; ".join(state.history[-6:]), 420)
     focus = summarize_for_prompt((state.last_result_para + " " + state.last_situation_para), 320)
     lock = "Tightly advance toward the act goal." if goal_lock else "Keep to one clear beat."
-    return f"""
+    # Stable rules lead so the backend can reuse the cached prompt prefix.
+    return f"""{TURN_NARRATION_PREAMBLE}
 Write paragraph-length turn narration (2-3 sentences) for a {state.scenario_label} RPG.
 Act {state.act.index} goal "{plan.goal}" supports campaign "{blueprint.campaign_goal}".
 Pressure "{blueprint.pressure_name}" {state.pressure}/100; act progress {state.act.goal_progress}/100.
 Scene phase {state.scene_phase}; last outcome: {last_event}.
 Recent beats: {recent}
 Focus now on: {focus}
-
-Rules: {lock} Do NOT restate numeric meters. Use past tense third-person prose. No mid-word hyphenation.
+Beat rule: {lock}
 """
 
 
@@ -517,6 +649,15 @@ Rules: {focus} Do NOT write numeric meters. No second person; complete sentences
 """
 
 
+# Fixed instructions shared by every next-situation request (kept byte-identical).
+NEXT_SITUATION_PREAMBLE = """
+Rules:
+- If SUCCESS: advance logically (new room/route/clue/NPC) and follow the focus rule below.
+- If FAIL: evolve the obstacle/complication; hint a new angle; avoid repetition.
+- Do NOT restate numeric meters. Complete sentences; no mid-word hyphenation. Plain text only.
+"""
+
+
 def next_situation_prompt(
     state: "GameState",
     outcome: str,
@@ -535,7 +676,8 @@ def next_situation_prompt(
         if goal_lock and outcome == "success"
         else "Allow texture, but keep one clear focus; avoid unrelated new elements."
     )
-    return f"""
+    # Stable rules lead so the backend can reuse the cached prompt prefix.
+    return f"""{NEXT_SITUATION_PREAMBLE}
 Write a new situation paragraph (2–4 sentences) for a {state.scenario_label} RPG in {location}.
 - Act {state.act.index} goal: "{plan.goal}"
 - Campaign goal: "{blueprint.campaign_goal}"
@@ -544,11 +686,7 @@ Write a new situation paragraph (2–4 sentences) for a {state.scenario_label} R
 - Recent beats: {recent}
 - Player intent/result: {intent_text} -> {outcome.upper()}
 - Scene phase: {state.scene_phase}
-
-Rules:
-- If SUCCESS: advance logically (new room/route/clue/NPC); {lock_rule}
-- If FAIL: evolve the obstacle/complication; hint a new angle; avoid repetition.
-- Do NOT restate numeric meters. Complete sentences; no mid-word hyphenation. Plain text only.
+- Focus rule: {lock_rule}
 """
 
 
@@ -557,6 +695,7 @@ __all__ = [
     "set_extra_world_text",
     "get_extra_world_text",
     "GemmaError",
+    "GemmaStreamInterrupted",
     "GemmaClient",
     # Image helpers (importable by your image pipeline)
     "SAFE_WORDS",
@@ -566,6 +705,7 @@ __all__ = [
     # Narrative prompt builders
     "campaign_blueprint_prompt",
     "world_journal_prompt",
+    "TURN_NARRATION_PREAMBLE",
     "turn_narration_prompt",
     "recap_prompt",
     "talk_reply_prompt",
@@ -573,5 +713,6 @@ __all__ = [
     "combat_observe_prompt",
     "option_microplans_prompt",
     "custom_action_outcome_prompt",
+    "NEXT_SITUATION_PREAMBLE",
     "next_situation_prompt",
 ]
@@ -32,6 +32,7 @@ from Core.UI_Helpers import (
     draw_fog_with_flicker,
     load_image,
     parallax_cover,
+    render_text,
     ui_font,
 )
 
@@ -639,7 +640,7 @@ class CharacterCreationScreen:
         draw_9slice(self.virtual, details_rect, self.nine_slice, border=28)
 
         title_font = ui_font(28, scale)
-        self.virtual.blit(title_font.render("Characters", True, C_TEXT), (list_rect.x + 20, list_rect.y + 20))
+        self.virtual.blit(render_text(title_font, "Characters", C_TEXT), (list_rect.x + 20, list_rect.y + 20))
 
         entry_area = pygame.Rect(list_rect.x + 24, list_rect.y + 72, list_rect.w - 48, list_rect.h - 120)
         self._draw_character_list(entry_area, scale)
@@ -700,11 +701,11 @@ class CharacterCreationScreen:
             text_font = ui_font(22, scale)
             sub_font = ui_font(16, scale)
             name = entry[0]
-            self.virtual.blit(text_font.render(name, True, C_TEXT), (thumb_rect.right + 20, rect.y + 20))
+            self.virtual.blit(render_text(text_font, name, C_TEXT), (thumb_rect.right + 20, rect.y + 20))
             if entry[1] is not None:
                 total = sum(int(entry[1].metadata.get("special", {}).get(k, 0)) for k in self.special_keys)
                 meta_line = f"SPECIAL total {total} / {self.special_budget}"
-                self.virtual.blit(sub_font.render(meta_line, True, C_MUTED), (thumb_rect.right + 20, rect.y + 56))
+                self.virtual.blit(render_text(sub_font, meta_line, C_MUTED), (thumb_rect.right + 20, rect.y + 56))
 
         total_entries = len(entries)
         max_offset = max(0, total_entries - visible_rows)
@@ -728,7 +729,7 @@ class CharacterCreationScreen:
 
     def _draw_portrait_panel(self, rect: pygame.Rect, scale: float) -> None:
         header_font = ui_font(28, scale)
-        self.virtual.blit(header_font.render("Your Portrait", True, C_TEXT), (rect.x + 40, rect.y + 28))
+        self.virtual.blit(render_text(header_font, "Your Portrait", C_TEXT), (rect.x + 40, rect.y + 28))
 
         portrait_rect = pygame.Rect(rect.x + 40, rect.y + 80, rect.w - 80, 380)
         self._draw_portrait_preview(portrait_rect)
@@ -736,7 +737,7 @@ class CharacterCreationScreen:
         info_font = ui_font(18, scale)
         info_text = "Portraits for premade heroes stay locked. New heroes may regenerate once."
         for i, line in enumerate(self._wrap_text(info_text, 60)):
-            self.virtual.blit(info_font.render(line, True, C_MUTED), (rect.x + 40, portrait_rect.bottom + 20 + i * 22))
+            self.virtual.blit(render_text(info_font, line, C_MUTED), (rect.x + 40, portrait_rect.bottom + 20 + i * 22))
 
         confirm_rect = pygame.Rect(rect.x + 40, rect.bottom - 140, rect.w - 80, 68)
         back_rect = pygame.Rect(rect.x + 40, rect.bottom - 60, 280, 52)
@@ -747,7 +748,7 @@ class CharacterCreationScreen:
 
         if self.message:
             msg_font = ui_font(18, scale)
-            msg_surf = msg_font.render(self.message, True, C_WARN)
+            msg_surf = render_text(msg_font, self.message, C_WARN)
             msg_rect = msg_surf.get_rect(center=(confirm_rect.centerx, confirm_rect.y - 36))
             self.virtual.blit(msg_surf, msg_rect)
 
@@ -755,7 +756,7 @@ class CharacterCreationScreen:
         padding = 40
         y = rect.y + padding
         header_font = ui_font(26, scale)
-        self.virtual.blit(header_font.render("Character Details", True, C_TEXT), (rect.x + padding, y))
+        self.virtual.blit(render_text(header_font, "Character Details", C_TEXT), (rect.x + padding, y))
         y += 50
         field_width = rect.w - padding * 2
         field_height = 52
@@ -774,16 +775,16 @@ class CharacterCreationScreen:
         value = self.fields.get(key, "")
         focus = self._current_focus() == f"field:{key}"
         draw_input_frame(self.virtual, rect, active=focus, locked=locked, border=24)
-        self.virtual.blit(label_font.render(label, True, C_MUTED), (rect.x + 10, rect.y + 6))
+        self.virtual.blit(render_text(label_font, label, C_MUTED), (rect.x + 10, rect.y + 6))
         display = value if value else ("(locked)" if locked else "")
         color = C_TEXT if not locked else C_MUTED
-        self.virtual.blit(value_font.render(display, True, color), (rect.x + 10, rect.y + 26))
+        self.virtual.blit(render_text(value_font, display, color), (rect.x + 10, rect.y + 26))
         self.rects[("field", key)] = rect
 
     def _draw_special_grid(self, rect: pygame.Rect, scale: float) -> None:
         budget_text = f"SPECIAL Budget {self._special_total()}/{self.special_budget}"
         caption_font = ui_font(20, scale)
-        self.virtual.blit(caption_font.render(budget_text, True, C_TEXT), (rect.x, rect.y - 6))
+        self.virtual.blit(render_text(caption_font, budget_text, C_TEXT), (rect.x, rect.y - 6))
         row_h = 42
         for i, stat in enumerate(self.special_keys):
             row_rect = pygame.Rect(rect.x, rect.y + i * row_h, rect.w, row_h - 6)
@@ -792,9 +793,9 @@ class CharacterCreationScreen:
             focus = self._current_focus() == f"special:{stat}"
             pygame.draw.rect(self.virtual, (26, 26, 34), row_rect, border_radius=6)
             pygame.draw.rect(self.virtual, (110, 150, 220) if focus else (58, 58, 70), row_rect, 1, border_radius=6)
-            self.virtual.blit(label_font.render(stat, True, C_TEXT), (row_rect.x + 12, row_rect.y + 8))
+            self.virtual.blit(render_text(label_font, stat, C_TEXT), (row_rect.x + 12, row_rect.y + 8))
             value = str(self.special_values.get(stat, SPECIAL_MIN))
-            self.virtual.blit(value_font.render(value, True, C_ACCENT), (row_rect.x + 140, row_rect.y + 8))
+            self.virtual.blit(render_text(value_font, value, C_ACCENT), (row_rect.x + 140, row_rect.y + 8))
             inc_rect = pygame.Rect(row_rect.right - 88, row_rect.y + 6, 36, row_rect.h - 12)
             dec_rect = pygame.Rect(row_rect.right - 44, row_rect.y + 6, 36, row_rect.h - 12)
             self.rects[("special", stat, +1)] = inc_rect
@@ -805,7 +806,7 @@ class CharacterCreationScreen:
     def _draw_stepper(self, rect: pygame.Rect, text: str, active: bool, scale: float) -> None:
         draw_button_frame(self.virtual, rect, active=active, border=20)
         font = ui_font(20, scale)
-        surf = font.render(text, True, C_TEXT)
+        surf = render_text(font, text, C_TEXT)
         self.virtual.blit(surf, surf.get_rect(center=rect.center))
 
     def _draw_portrait_preview(self, rect: pygame.Rect) -> None:
@@ -816,13 +817,13 @@ class CharacterCreationScreen:
         else:
             hint_font = ui_font(18, 1.0)
             msg = "No portrait yet. One will be generated next."
-            self.virtual.blit(hint_font.render(msg, True, C_MUTED), (rect.x + 16, rect.y + rect.h // 2 - 10))
+            self.virtual.blit(render_text(hint_font, msg, C_MUTED), (rect.x + 16, rect.y + rect.h // 2 - 10))
         draw_image_frame(self.virtual, rect, border=34)
 
     def _draw_button(self, rect: pygame.Rect, label: str, focused: bool, scale: float, *, primary: bool = False) -> None:
         draw_button_frame(self.virtual, rect, active=focused, primary=primary, border=28)
         font = ui_font(24 if primary else 20, scale)
-        surf = font.render(label, True, C_TEXT)
+        surf = render_text(font, label, C_TEXT)
         self.virtual.blit(surf, surf.get_rect(center=rect.center))
 
     # ------------------------------ portrait regen ---------------------------
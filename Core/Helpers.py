@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import hashlib
 import random
 import re
 import textwrap
+from collections import OrderedDict
+from functools import lru_cache
 from typing import TYPE_CHECKING, Optional, Tuple
 
 if TYPE_CHECKING:
@@ -18,6 +21,11 @@ METER_LINE_RE = re.compile(
     + r")\s*:?\s*\d+\/100\.?\s*$",
     re.IGNORECASE,
 )
+# The cleanup patterns below run on every Gemma reply, so compile them once too.
+_HYPHEN_BREAK_RE = re.compile(r"(\w+)-\n(\w+)")
+_BLANK_LINES_RE = re.compile(r"\s+\n\s+")
+_MULTI_SPACE_RE = re.compile(r"\s{2,}")
+_WHITESPACE_RE = re.compile(r"\s+")
 
 
 # We wrap long text so it does not stretch across the terminal.
@@ -26,8 +34,14 @@ def wrap(text: str, width: int = 78) -> str:
     # If the text is empty, return an empty string right away.
     if not text:
         return ""
-    # textwrap handles the heavy lifting of inserting line breaks.
-    return "\n".join(textwrap.wrap(text, width))
+    # textwrap handles the heavy lifting; reuse one wrapper per width.
+    return "\n".join(_wrapper(width).wrap(text))
+
+
+@lru_cache(maxsize=8)
+def _wrapper(width: int) -> textwrap.TextWrapper:
+    """Build (once per width) the TextWrapper behind wrap()."""
+    return textwrap.TextWrapper(width)
 
 
 # We keep story prose tidy and easy to read.
@@ -36,13 +50,16 @@ def sanitize_prose(raw: str) -> str:
     if not raw:
         return ""
     # Drop any accidental meter-looking lines so the journal stays lore-focused.
-    lines = [line for line in raw.splitlines() if not METER_LINE_RE.match(line.strip())]
-    cleaned = "\n".join(lines).strip()
+    # Every meter line contains "/100", so most replies skip the per-line scan
+    # (a carriage return still needs splitlines() to normalize line endings).
+    if "/100" in raw or "\r" in raw:
+        raw = "\n".join(line for line in raw.splitlines() if not METER_LINE_RE.match(line.strip()))
+    cleaned = raw.strip()
     # Rejoin words that got split by hyphenated line breaks (e.g., "sugg-" + "estions").
-    cleaned = re.sub(r"(\w+)-\n(\w+)", r"\1\2", cleaned)
+    cleaned = _HYPHEN_BREAK_RE.sub(r"\1\2", cleaned)
     # Remove piles of blank lines or double spaces so the text flows smoothly.
-    cleaned = re.sub(r"\s+\n\s+", "\n", cleaned)
-    cleaned = re.sub(r"\s{2,}", " ", cleaned)
+    cleaned = _BLANK_LINES_RE.sub("\n", cleaned)
+    cleaned = _MULTI_SPACE_RE.sub(" ", cleaned)
     # Make sure the sentence ends with strong punctuation so it feels complete.
     if cleaned and cleaned[-1] not in ".!?…":
         cleaned += "."
@@ -53,7 +70,7 @@ def sanitize_prose(raw: str) -> str:
 def summarize_for_prompt(text: str, limit_chars: int = 500) -> str:
     """Shorten text for prompts while keeping the key idea."""
     # Collapse whitespace so the summary length is predictable.
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WHITESPACE_RE.sub(" ", text).strip()
     if not text:
         return "none"
     # Truncate and add an ellipsis when the text is longer than the limit.
@@ -141,6 +158,8 @@ def journal_add(state: "GameState", entry: str) -> None:
     setattr(state, "journal_entry_count", counter)
     formatted = f"Entry {counter}\n{entry}"
     state.journal.append(formatted)
+    # The UI keys its cached journal layout on this.
+    state.journal_version = getattr(state, "journal_version", 0) + 1
     try:
         # Append to the world journal file so players can browse the history.
         with open("world_journal.txt", "a", encoding="utf-8") as handle:
@@ -150,6 +169,10 @@ def journal_add(state: "GameState", entry: str) -> None:
         pass
 
 
+# How many recent situation -> lore line pairs we remember per game.
+LORE_CACHE_SIZE = 64
+
+
 # We call the model for a lore line and save the result inside the journal.
 def journal_lore_line(
     state: "GameState",
@@ -161,6 +184,20 @@ def journal_lore_line(
     try:
         # Fall back to the latest situation when no seed text is provided.
         situation = state.act.situation or seed or "The situation evolves."
+        # Near-identical situations (same opening) reuse the last lore line for
+        # them instead of paying for another Gemma call.
+        key = hashlib.blake2b(
+            " ".join(situation[:200].lower().split()).encode("utf-8"), digest_size=8
+        ).hexdigest()
+        cache = getattr(state, "_lore_cache", None)
+        if cache is None:
+            cache = OrderedDict()
+            setattr(state, "_lore_cache", cache)
+        cached = cache.get(key)
+        if cached:
+            cache.move_to_end(key)
+            journal_add(state, cached)
+            return
         # Build a short prompt that points the model at current story beats.
         prompt = (
             "Append ONE sentence to a world chronicle based on this situation and campaign nouns. "
@@ -174,6 +211,9 @@ def journal_lore_line(
         # Ask Gemma to craft the line, then sanitize it before saving.
         line = sanitize_prose(gemma.text(prompt, tag="Lore", max_chars=220))
         if line:
+            cache[key] = line
+            if len(cache) > LORE_CACHE_SIZE:
+                cache.popitem(last=False)
             journal_add(state, line)
     except Exception:
         # Any error (network, parsing, etc.) is ignored to keep the game running.
@@ -19,6 +19,7 @@ import ssl
 import subprocess
 import sys
 import time
+from functools import lru_cache
 from typing import TYPE_CHECKING, Callable, Optional
 from urllib import parse, request
 
@@ -284,6 +285,17 @@ def _ok_file(path: str, min_bytes: int = 2048) -> bool:
         return False
 
 
+@lru_cache(maxsize=4)
+def _verified_context(cafile: Optional[str] = None) -> ssl.SSLContext:
+    """Shared verifying context; loading the CA bundle once saves ms per download."""
+    return ssl.create_default_context(cafile=cafile) if cafile else ssl.create_default_context()
+
+
+@lru_cache(maxsize=1)
+def _unverified_context() -> ssl.SSLContext:
+    return ssl._create_unverified_context()
+
+
 def _sleep_with_jitter(base: float, attempt: int) -> None:
     time.sleep(base * attempt + random.uniform(0, base))
 
@@ -319,17 +331,14 @@ def download_image(
 
     for attempt in range(1, max_attempts + 1):
         try:
-            if certifi_module:
-                ctx = ssl.create_default_context(cafile=certifi_module.where())  # type: ignore[attr-defined]
-            else:
-                ctx = ssl.create_default_context()
-            _try(req, ctx)
+            cafile = certifi_module.where() if certifi_module else None  # type: ignore[attr-defined]
+            _try(req, _verified_context(cafile))
             return
         except Exception as e1:
             last_error = e1
             # One unverified retry per attempt (some endpoints have broken chains)
             try:
-                _try(req, ssl._create_unverified_context())
+                _try(req, _unverified_context())
                 return
             except Exception as e2:
                 last_error = e2
@@ -339,7 +348,7 @@ def download_image(
     if simplified_url:
         try:
             req2 = request.Request(simplified_url, headers={"User-Agent": "RP-GPT/1.1"})
-            _try(req2, ssl._create_unverified_context())
+            _try(req2, _unverified_context())
             return
         except Exception as e3:
             last_error = e3
@@ -31,6 +31,7 @@ from Core.UI_Helpers import (
     draw_button_frame,
     load_image,
     parallax_cover,
+    render_text,
     set_mode_resilient,
     set_ui_zoom,
     slice9,
@@ -191,7 +192,7 @@ class MainMenu:
             # Logo: fade in + gentle vertical drift + glow pulse
             drift = int(26 * (1.0 - ease_out_cubic(
                 min(max((t - T_REVEAL)/(T_FLARE - T_REVEAL + 1e-6),0.0),1.0))) * math.sin(t * 2.0))
-            title_surf = self.logo_font_big.render(title, True, C_TEXT)
+            title_surf = render_text(self.logo_font_big, title, C_TEXT)
             tx = (VIRTUAL_W - title_surf.get_width())//2
             ty = VIRTUAL_H//2 - title_surf.get_height()//2 - 12 + drift
 
@@ -213,7 +214,7 @@ class MainMenu:
             # Subtitle: typewriter after TYPE
             if t >= T_TYPE:
                 show = int(len(subtitle) * (1 - (1 - min((t - T_TYPE)/1.6, 1.0))**3))
-                sub = self.logo_font_small.render(subtitle[:show], True, C_MUTED)
+                sub = render_text(self.logo_font_small, subtitle[:show], C_MUTED)
                 self.virtual.blit(sub, ( (VIRTUAL_W - sub.get_width())//2, ty + title_surf.get_height() + 18 ))
 
             # White flare at FLARE
@@ -245,7 +246,7 @@ class MainMenu:
         draw_button_frame(self.virtual, rect, hovered=hovered, disabled=not active, primary=True, border=26)
         font = ui_font(20, 1.0)
         txt = f"[{hot}] {label}" if hot else label
-        s = font.render(txt, True, C_TEXT if active else C_MUTED)
+        s = render_text(font, txt, C_TEXT if active else C_MUTED)
         self.virtual.blit(s, (rect.x + 14, rect.y + (rect.h - s.get_height())//2))
         return hovered
 
@@ -281,8 +282,8 @@ class MainMenu:
             # Title panel
             panel = pygame.Rect( VIRTUAL_W//2 - 360, 120, 720, 160 )
             self.draw_panel(panel)
-            title = ui_font(36, 1.0).render("RP-GPT", True, C_TEXT)
-            sub   = ui_font(18, 1.0).render("AI-orchestrated adventures await.", True, C_MUTED)
+            title = render_text(ui_font(36, 1.0), "RP-GPT", C_TEXT)
+            sub   = render_text(ui_font(18, 1.0), "AI-orchestrated adventures await.", C_MUTED)
             self.virtual.blit(title, (panel.x + (panel.w-title.get_width())//2, panel.y+24))
             self.virtual.blit(sub,   (panel.x + (panel.w-sub.get_width())//2, panel.y+24+48))
 
@@ -373,13 +374,13 @@ class MainMenu:
             panel = pygame.Rect( VIRTUAL_W//2 - 420, 150, 840, 420 )
             self.draw_panel(panel)
             y = panel.y + 24
-            title = ui_font(28,1.0).render("Settings", True, C_TEXT)
+            title = render_text(ui_font(28,1.0), "Settings", C_TEXT)
             self.virtual.blit(title, (panel.x + 20, y)); y += 50
 
             def row(label, value, i):
                 col = C_ACCENT if i == idx else C_TEXT
-                s1 = ui_font(20,1.0).render(label, True, col)
-                s2 = ui_font(20,1.0).render(value, True, col)
+                s1 = render_text(ui_font(20,1.0), label, col)
+                s2 = render_text(ui_font(20,1.0), value, col)
                 self.virtual.blit(s1, (panel.x + 32, y))
                 self.virtual.blit(s2, (panel.right - 32 - s2.get_width(), y))
                 return s1.get_height()
@@ -830,23 +831,23 @@ class MainMenu:
                     self.virtual.blit(scaled, dst.topleft)
             else:
                 msg = "Portrait unavailable."
-                text = ui_font(22, 1.0).render(msg, True, C_ACCENT)
+                text = render_text(ui_font(22, 1.0), msg, C_ACCENT)
                 dst = text.get_rect(center=image_rect.center)
                 self.virtual.blit(text, dst.topleft)
                 if error_msg:
-                    err_surface = ui_font(18, 1.0).render("Press R to retry.", True, C_MUTED)
+                    err_surface = render_text(ui_font(18, 1.0), "Press R to retry.", C_MUTED)
                     err_rect = err_surface.get_rect(center=(image_rect.centerx, image_rect.centery + 40))
                     self.virtual.blit(err_surface, err_rect.topleft)
 
             info_y = panel.bottom - 140
-            prompt = ui_font(26,1.0).render("Continue with this character?", True, C_TEXT)
+            prompt = render_text(ui_font(26,1.0), "Continue with this character?", C_TEXT)
             self.virtual.blit(prompt, (panel.x + (panel.w - prompt.get_width())//2, info_y))
             info_y += 48
-            instruct = ui_font(20,1.0).render("[Enter] Continue   [Backspace] Recreate   [R] Regenerate portrait", True, C_MUTED)
+            instruct = render_text(ui_font(20,1.0), "[Enter] Continue   [Backspace] Recreate   [R] Regenerate portrait", C_MUTED)
             self.virtual.blit(instruct, (panel.x + (panel.w - instruct.get_width())//2, info_y))
             if error_msg:
                 info_y += 40
-                err = ui_font(18,1.0).render(error_msg, True, C_MUTED)
+                err = render_text(ui_font(18,1.0), error_msg, C_MUTED)
                 self.virtual.blit(err, (panel.x + (panel.w - err.get_width())//2, info_y))
 
             scaled = pygame.transform.smoothscale(self.virtual, (vp.w, vp.h))
@@ -895,9 +896,9 @@ class MainMenu:
             box = pygame.Rect(VIRTUAL_W//2-420, VIRTUAL_H//2-90, 840, 180)
             self.draw_panel(box)
             y = box.y + 18
-            title = ui_font(22,1.0).render(prompt, True, C_TEXT)
+            title = render_text(ui_font(22,1.0), prompt, C_TEXT)
             self.virtual.blit(title, (box.x + 16, y)); y += 52
-            val = ui_font(20,1.0).render(buf, True, C_ACCENT)
+            val = render_text(ui_font(20,1.0), buf, C_ACCENT)
             self.virtual.blit(val, (box.x + 16, y))
 
             scaled = pygame.transform.smoothscale(self.virtual, (vp.w, vp.h))
@@ -938,7 +939,7 @@ class MainMenu:
             box = pygame.Rect(VIRTUAL_W//2-420, VIRTUAL_H//2-160, 840, 320)
             self.draw_panel(box)
             y = box.y + 16
-            self.virtual.blit(ui_font(26,1.0).render(title, True, C_TEXT), (box.x+16, y)); y += 48
+            self.virtual.blit(render_text(ui_font(26,1.0), title, C_TEXT), (box.x+16, y)); y += 48
 
             choice_rects = []
             mouse_v = None
@@ -954,7 +955,7 @@ class MainMenu:
                 if hovered:
                     pygame.draw.rect(self.virtual, (60, 70, 90, 160), option_rect, border_radius=8)
                 col = C_ACCENT if i == idx else C_TEXT
-                self.virtual.blit(ui_font(20,1.0).render(ch, True, col), (box.x+28, y))
+                self.virtual.blit(render_text(ui_font(20,1.0), ch, col), (box.x+28, y))
                 choice_rects.append(option_rect)
                 y += 36
 
@@ -984,7 +985,7 @@ class MainMenu:
         )
         box = pygame.Rect(VIRTUAL_W//2-360, VIRTUAL_H//2-60, 720, 120)
         self.draw_panel(box)
-        s = ui_font(20,1.0).render(msg, True, C_TEXT)
+        s = render_text(ui_font(20,1.0), msg, C_TEXT)
         self.virtual.blit(s, (box.x + (box.w - s.get_width())//2, box.y + 40))
         scaled = pygame.transform.smoothscale(self.virtual, (vp.w, vp.h))
         screen.fill((0,0,0)); screen.blit(scaled, vp); pygame.display.flip()
@@ -1014,7 +1015,7 @@ class MainMenu:
             self.draw_panel(box)
             y = box.y + 24
             for line in msg.split("\n"):
-                s = ui_font(20,1.0).render(line, True, C_TEXT)
+                s = render_text(ui_font(20,1.0), line, C_TEXT)
                 self.virtual.blit(s, (box.x + 16, y)); y += 30
             scaled = pygame.transform.smoothscale(self.virtual, (vp.w, vp.h))
             screen.fill((0,0,0)); screen.blit(scaled, vp); pygame.display.flip()
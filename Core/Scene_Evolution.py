@@ -9,23 +9,25 @@ It does two simple things:
 1) scan_for_new_actor: After we get a new situation paragraph, we ask the model
    if a brand‑new character just entered. If yes, we add them to the scene.
 
-2) evolve_situation: Builds the next situation paragraph and a short narration,
-   updates small bits of state, and records a single journal line. This is the
-   "one place" we print the turn’s unified text (situation + narration).
+2) evolve_situation: Builds the next situation paragraph and a short narration
+   (the two Gemma calls overlap), updates small bits of state, and records a
+   single journal line. This is the "one place" we print the turn’s unified
+   text (situation + narration).
 
 Design details (plain language):
-- We import RP_GPT dynamically in functions via _core() so we can use shared
-  types (like Actor) without circular imports.
+- We import RP_GPT lazily via _core()/_bind() so we can use shared types
+  (like Actor) without circular imports.
 - We keep all text cleaning and journal calls exactly as before, so behavior
   matches the original implementation.
 """
 
 import random
 import re
+import sys
 from typing import Optional
 
 from Core.Helpers import (
-    wrap,
+    METER_LINE_RE,
     sanitize_prose,
     infer_species_and_comm_style,
     personality_roll,
@@ -34,12 +36,44 @@ from Core.Helpers import (
 )
 from Core.AI_Dungeon_Master import (
     GemmaClient,
+    GemmaStreamInterrupted,
     world_journal_prompt,
     next_situation_prompt,
     turn_narration_prompt,
     get_extra_world_text,
 )
 from Core.Choice_Handler import goal_lock_active
+from Core.Terminal_HUD import get_worker_pool
+
+
+# Word tokenizer for goal/situation matching, compiled once at import.
+_WORD_RE = re.compile(r"\w+")
+# Capitalized, name-like tokens; used to skip ActorScan when nobody new is named.
+_NAME_TOKEN_RE = re.compile(r"\b[A-Z][a-z]{2,}\b")
+# Everyday words that open sentences; capitalized but never a new arrival's name.
+# Anything else capitalized (sentence-opening or not) still triggers the scan.
+_COMMON_CAPS = frozenset("""
+the then there their these those this that they them you your yours yourself
+she her his him its our we who what when where why how which while with
+without within from into onto over under after before behind beyond above
+below across along around among against and but for nor yet not now here
+all any some each every one two both few many most more much other such
+just only still also even again soon once suddenly slowly somewhere something
+someone nothing nobody everyone everything inside outside near far
+let may might must should would could can will shall did does was were are
+has have had been being yes tonight today tomorrow meanwhile perhaps
+""".split())
+# Unnamed arrivals ("a wolf bursts from the trees") are lowercase; these nouns
+# still send the paragraph to ActorScan. Example tweak: add setting-specific
+# monsters here.
+_CREATURE_RE = re.compile(
+    r"\b(?:man|woman|men|women|child|boy|girl|stranger|figure|traveller|traveler|"
+    r"guard|soldier|bandit|thief|merchant|priest|knight|hunter|beggar|"
+    r"wolf|wolves|bear|hound|dog|rat|rats|spider|serpent|snake|boar|bird|crow|raven|"
+    r"beast|creature|monster|orc|goblin|troll|ogre|giant|ghoul|ghost|wraith|spirit|"
+    r"skeleton|zombie|undead|demon|dragon|drake|witch|wizard|mage|cultist)s?\b",
+    re.IGNORECASE,
+)
 
 
 def _core():
@@ -48,10 +82,75 @@ def _core():
     return core
 
 
+# RP_GPT names used per turn, bound once on first use (see Turn_And_Act_Flow._bind).
+_BOUND = False
+
+
+def _bind() -> None:
+    """Copy the RP_GPT names this module uses into module globals (one-shot)."""
+    global _BOUND, Actor, ensure_character_profile, make_actor_portrait_prompt, queue_image_event
+    if _BOUND:
+        return
+    core = _core()
+    Actor = core.Actor
+    ensure_character_profile = core.ensure_character_profile
+    make_actor_portrait_prompt = core.make_actor_portrait_prompt
+    queue_image_event = core.queue_image_event
+    _BOUND = True
+
+
 # =============================
 # ------ SCENE EVOLUTION ------
 # =============================
 
+# Fixed head of the ActorScan prompt; only the paragraph changes per turn, so
+# the backend can reuse its cached prefix.
+ACTOR_SCAN_PREAMBLE = """
+From the paragraph below, detect if a NEW character or creature has entered the scene.
+Return STRICT JSON ONLY like:
+{"introduced": true/false, "name": "string", "kind": "string", "role":"npc|enemy", "personality":"string"}
+"""
+
+# JSON schema handed to Ollama so ActorScan replies always parse on the first try.
+ACTOR_SCAN_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "introduced": {"type": "boolean"},
+        "name": {"type": "string", "maxLength": 40},
+        "kind": {"type": "string", "maxLength": 40},
+        "role": {"enum": ["npc", "enemy"]},
+        "personality": {"type": "string"},
+    },
+    "required": ["introduced"],
+}
+
+
+def _scene_name_index(state) -> dict:
+    """Map lowercased names of everyone in the scene (plus companions) to their Actor."""
+    index = {}
+    for a in list(state.act.actors) + list(getattr(state, "companions", []) or []):
+        index.setdefault(a.name.lower(), a)
+    return index
+
+
+def _mentions_unknown_name(state, text: str, index: Optional[dict] = None) -> bool:
+    """True if the paragraph may introduce someone we don't already know.
+
+    That is any capitalized word that isn't an everyday word, the player or
+    someone already in the scene, or any creature/person noun at all (unnamed
+    arrivals are lowercase).
+    """
+    player = getattr(state, "player", None)
+    known = set(_WORD_RE.findall(player.name.lower())) if player else set()
+    for name in (index if index is not None else _scene_name_index(state)):
+        known.update(_WORD_RE.findall(name))
+    for m in _NAME_TOKEN_RE.finditer(text):
+        word = m.group().lower()
+        if word not in known and word not in _COMMON_CAPS:
+            return True
+    return _CREATURE_RE.search(text) is not None
+
+
 def scan_for_new_actor(state, g: GemmaClient, situation_txt: str):
     """Ask the model if the new paragraph introduced a new character.
 
@@ -66,27 +165,31 @@ def scan_for_new_actor(state, g: GemmaClient, situation_txt: str):
             return
     except Exception:
         pass
-    core = _core()
-    Actor = core.Actor
+    # Cheap local precheck: no unfamiliar proper noun means no model round-trip.
+    index = _scene_name_index(state)
+    if not _mentions_unknown_name(state, situation_txt, index):
+        return
+    _bind()
 
     try:
-        prompt = f"""
-From the paragraph below, detect if a NEW character or creature has entered the scene.
-Return STRICT JSON ONLY like:
-{{"introduced": true/false, "name": "string", "kind": "string", "role":"npc|enemy", "personality":"string"}}
-Paragraph: {situation_txt}
-"""
-        j = g.json(prompt, tag="ActorScan")
+        prompt = f"{ACTOR_SCAN_PREAMBLE}Paragraph: {situation_txt}\n"
+        j = g.json(prompt, tag="ActorScan", schema=ACTOR_SCAN_SCHEMA)
         if not isinstance(j, dict) or not j.get("introduced"):
             return
 
-        # Basic safety defaults + short, readable strings
+        # Basic safety defaults + short, readable strings (the CLI path is not schema-bound)
         name = (j.get("name", "Stranger") or "Stranger").strip()[:40] or "Stranger"
         kind = (j.get("kind", "npc") or "npc").strip()[:40] or "npc"
         role = (j.get("role", "npc") or "npc").strip().lower()
         if role not in ("npc", "enemy"):
             role = "npc"
 
+        # Someone already here (e.g., a companion) is not a new arrival
+        existing = index.get(name.lower())
+        if existing is not None:
+            state.last_actor = existing
+            return
+
         # Set species/communication style and a loose personality archetype
         species, comm = infer_species_and_comm_style(kind)
 
@@ -108,7 +211,7 @@ Paragraph: {situation_txt}
         )
 
         try:
-            core.ensure_character_profile(new)
+            ensure_character_profile(new)
         except Exception:
             pass
 
@@ -119,8 +222,8 @@ Paragraph: {situation_txt}
 
         if not getattr(new, "portrait_path", None):
             try:
-                prompt = core.make_actor_portrait_prompt(new)
-                core.queue_image_event(
+                prompt = make_actor_portrait_prompt(new)
+                queue_image_event(
                     state,
                     "portrait",
                     prompt,
@@ -134,60 +237,150 @@ Paragraph: {situation_txt}
         return
 
 
-def evolve_situation(state, g: GemmaClient, outcome: str, intent: Optional[str] = None, action_text: Optional[str] = None):
-    """Advance the scene by asking the model for the new situation and narration.
+# A line longer than this can't be a meter line ("Pressure: 40/100"), so its
+# words are echoed as they arrive instead of waiting for the newline.
+_METER_LINE_MAX = 48
 
-    What we do in order:
-    1) Ask for the next situation paragraph and clean it.
-    2) If present, store it as the current situation and scan it for new actors.
-    3) Nudge act progress/pressure depending on success/failure.
-    4) Ask for a short narrative paragraph and print both paragraphs cleanly.
-    5) Update last_turn flags and add a small lore line to the journal.
+
+def _stream_wrapped(pieces, width: int = 78) -> str:
+    """Echo streamed text word-wrapped as it arrives and return the raw text.
+
+    Matches wrap(): whitespace (including newlines) collapses to single spaces.
+    The line-level part of sanitize_prose runs before anything is echoed
+    (meter lines dropped, words split by a hyphenated line break rejoined), so
+    the terminal shows the same words that end up in act.situation.
+    Ends with a blank line when anything was written.
     """
-    # Whether we should bias strongly toward the act goal this turn
-    goal_lock = goal_lock_active(state, last_success=(outcome == "success"))
+    out = sys.stdout
+    chunks = []
+    line = ""      # current line, minus any words already echoed
+    live = False   # current line is already past meter-line length
+    carry = ""     # "sugg" from a line that ended in "sugg-"
+    col = 0
 
-    # 1) Next situation paragraph
-    situation_txt = g.text(
-        next_situation_prompt(state, outcome, intent, goal_lock),
-        tag="Next situation",
-        max_chars=900,
-    ) or ""
-    situation_txt = sanitize_prose(situation_txt)
+    def emit(word: str) -> None:
+        nonlocal col
+        if col and col + 1 + len(word) > width:
+            out.write("\n")
+            col = 0
+        elif col:
+            out.write(" ")
+            col += 1
+        out.write(word)
+        col += len(word)
 
-    # 2) Store and scan for any new actor mentioned in the situation
-    if situation_txt:
-        state.act.situation = situation_txt
-        state.location_desc = state.act.situation.split(".")[0] if state.act.situation else state.location_desc
-        scan_for_new_actor(state, g, situation_txt)
+    def emit_line(text: str, at_line_start: bool, complete: bool) -> None:
+        nonlocal carry
+        if complete and at_line_start and METER_LINE_RE.match(text.strip()):
+            return
+        words = text.split()
+        if carry:
+            if words and at_line_start and _WORD_RE.match(text[:1]):
+                words[0] = carry + words[0]
+            else:
+                emit(carry + "-")
+            carry = ""
+        if complete and words and len(text) > 1 and text[-1] == "-" and _WORD_RE.match(text[-2]):
+            # Hold the fragment back; the next line may finish the word.
+            carry = words.pop()[:-1]
+        for word in words:
+            emit(word)
+
+    for piece in pieces:
+        chunks.append(piece)
+        line += piece.replace("\r", "\n")
+        while "\n" in line:
+            done, line = line.split("\n", 1)
+            emit_line(done, at_line_start=not live, complete=True)
+            live = False
+        # Echo up to the last whole word once the line can't be a meter line;
+        # the tail may still be growing.
+        if live or len(line.strip()) > _METER_LINE_MAX:
+            cut = max(line.rfind(" "), line.rfind("\t"))
+            if cut > 0:
+                emit_line(line[:cut], at_line_start=not live, complete=False)
+                line = line[cut:]
+                live = True
+        out.flush()
+    if line:
+        emit_line(line, at_line_start=not live, complete=True)
+    if carry:
+        emit(carry + "-")
+    if col:
+        out.write("\n\n")
+        out.flush()
+    return "".join(chunks)
 
-    # 3) Success pushes phase forward a little; failure slightly increases stall
+
+def _apply_outcome_updates(state, outcome: str) -> None:
+    """Success pushes phase forward a little; failure slightly increases stall."""
     if outcome == "success":
         state.scene_phase += 1
         state.stall_count = 0
-        # Gentle auto-progress if the situation text obviously relates to the goal
-        goal_terms = re.findall(r"\w+", state.blueprint.acts[state.act.index].goal.lower())
-        if any(t in state.act.situation.lower() for t in goal_terms):
-            state.act.goal_progress = min(100, state.act.goal_progress + random.randint(2, 4))
     else:
         state.stall_count = min(4, state.stall_count + 1)
 
-    # 4) Ask for a short turn narration paragraph and print both nicely
+
+def _goal_progress_nudge(state) -> None:
+    """Gentle auto-progress if the situation text obviously relates to the goal."""
+    goal_terms = getattr(state.act, "goal_terms", None)
+    if not goal_terms:
+        goal_terms = frozenset(_WORD_RE.findall(state.blueprint.acts[state.act.index].goal.lower()))
+        state.act.goal_terms = goal_terms
+    if any(m.group() in goal_terms for m in _WORD_RE.finditer(state.act.situation.lower())):
+        state.act.goal_progress = min(100, state.act.goal_progress + random.randint(2, 4))
+
+
+def evolve_situation(state, g: GemmaClient, outcome: str, intent: Optional[str] = None, action_text: Optional[str] = None):
+    """Advance the scene by asking the model for the new situation and narration.
+
+    What we do in order:
+    1) Build the situation prompt, then apply the cheap success/fail updates.
+    2) Send the narration request in the background (it does not need the new
+       situation text), so both Gemma calls overlap.
+    3) Stream the situation paragraph, store it, scan it for new actors, and
+       nudge act progress on success.
+    4) Print the narration paragraph once it is ready.
+    5) Update last_turn flags and add a small lore line to the journal.
+    """
+    # Whether we should bias strongly toward the act goal this turn
+    goal_lock = goal_lock_active(state, last_success=(outcome == "success"))
+
+    # 1) The situation prompt sees the pre-update phase, as it always has
+    situation_prompt = next_situation_prompt(state, outcome, intent, goal_lock)
+    _apply_outcome_updates(state, outcome)
+
+    # 2) Narration runs quietly on the shared pool while the situation streams
     last = state.history[-1] if state.history else "begin"
-    narration_para = g.text(
+    narration_future = get_worker_pool().submit(
+        g.text,
         turn_narration_prompt(state, last, goal_lock),
         tag="Turn",
         max_chars=700,
-    ) or ""
-    narration_para = sanitize_prose(narration_para)
-    # Print unified (we never reprint the action_text here to avoid duplication)
-    print()
+        spinner=False,
+    )
+
+    # 3) Next situation paragraph, echoed to the terminal while Gemma writes it
+    #    (we never reprint the action_text here to avoid duplication)
+    sys.stdout.write("\n")
+    try:
+        situation_txt = _stream_wrapped(g.stream_text(situation_prompt, tag="Next situation", max_chars=900))
+    except GemmaStreamInterrupted as exc:
+        # The stream broke mid-paragraph: say so, then fetch the whole reply
+        # the normal way (with retries) and print it fresh.
+        sys.stdout.write(f"\n\n[{exc}; retrying]\n\n")
+        situation_txt = _stream_wrapped([g.text(situation_prompt, tag="Next situation", max_chars=900)])
+    situation_txt = sanitize_prose(situation_txt)
     if situation_txt:
-        print(wrap(situation_txt))
-        print()
-    if narration_para:
-        print(wrap(narration_para))
-        print()
+        state.act.situation = situation_txt
+        state.location_desc = state.act.situation.split(".")[0] if state.act.situation else state.location_desc
+        scan_for_new_actor(state, g, situation_txt)
+    if outcome == "success":
+        _goal_progress_nudge(state)
+
+    # 4) Collect the narration paragraph and print it with the same wrapping
+    narration_para = sanitize_prose(narration_future.result() or "")
+    _stream_wrapped([narration_para])
 
     # 5) Update last-turn flags and add one lore line to the journal
     state.last_result_para = action_text or ""
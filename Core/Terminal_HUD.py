@@ -2,63 +2,121 @@
 
 from __future__ import annotations
 
-import itertools
 import os
 import sys
 import threading
 import time
 
-from typing import TYPE_CHECKING
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from RP_GPT import GameState
 
 
+# One long-lived worker pool for small background jobs (e.g. overlapped Gemma
+# calls), created on first use so importing this module stays cheap.
+_POOL: Optional[ThreadPoolExecutor] = None
+_POOL_LOCK = threading.Lock()
+# Spinners get their own single thread: only one is on screen at a time, and a
+# spinner must never sit queued behind slow jobs on the shared pool.
+_SPINNER_POOL: Optional[ThreadPoolExecutor] = None
+
+
+def get_worker_pool() -> ThreadPoolExecutor:
+    """Return the shared background ThreadPoolExecutor (created lazily)."""
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                _POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="rpgpt")
+    return _POOL
+
+
+def _spinner_pool() -> ThreadPoolExecutor:
+    global _SPINNER_POOL
+    if _SPINNER_POOL is None:
+        with _POOL_LOCK:
+            if _SPINNER_POOL is None:
+                _SPINNER_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rpgpt-spinner")
+    return _SPINNER_POOL
+
+
 class LoadingBar:
     """Small spinner we print while Gemma is busy responding."""
 
-    def __init__(self, label: str = "Thinking"):
+    def __init__(self, label: str = "Thinking", enabled: bool = True):
         # Remember what text to show (e.g., "Thinking…") and set up a stop flag.
+        # enabled=False keeps background calls from fighting the foreground line.
         self.label = label
         self._stop = threading.Event()
-        self._thread: threading.Thread | None = None
+        self._future: Future | None = None
         disable = os.environ.get("RP_GPT_DISABLE_SPINNER", "").lower()
-        self._enabled = sys.stdout.isatty() and disable not in {"1", "true", "yes"}
+        self._enabled = enabled and sys.stdout.isatty() and disable not in {"1", "true", "yes"}
 
     def start(self) -> None:
         """Begin printing a spinner in the console."""
         if not self._enabled:
             return
+        # Retries reuse the same bar, so re-arm the stop flag each start.
+        self._stop.clear()
 
         def run() -> None:
             # Cycle through a handful of Unicode spinner characters for flavor.
-            spinner = itertools.cycle("⠋⠙⠸⠴⠦⠇")
+            glyphs = "⠋⠙⠸⠴⠦⠇"
             width = 24  # Width of the progress bar we show.
+            # Pre-render every (glyph, fill) frame once so the loop only writes bytes.
+            encoding = getattr(sys.stdout, "encoding", None) or "utf-8"
+            frames = [
+                [
+                    f"\r{self.label} {glyph} |{'█' * fill}{' ' * (width - fill)}| ".encode(encoding, errors="replace")
+                    for fill in range(width + 1)
+                ]
+                for glyph in glyphs
+            ]
+            out = getattr(sys.stdout, "buffer", None)
+            sys.stdout.flush()  # Drain pending text before writing raw bytes underneath it.
             t0 = time.time()
+            tick = 0
             while not self._stop.is_set():
                 # Work out how much time has passed to fill the bar evenly.
                 elapsed = time.time() - t0
                 fill = int((elapsed * 10) % (width + 1))
-                bar = "█" * fill + " " * (width - fill)
+                frame = frames[tick % len(glyphs)][fill]
                 # Overwrite the previous line with the new spinner frame.
-                sys.stdout.write(f"\r{self.label} {next(spinner)} |{bar}| ")
-                sys.stdout.flush()
-                time.sleep(0.07)  # Yield briefly so we do not hog the CPU.
+                if out is not None:
+                    out.write(frame)
+                else:
+                    sys.stdout.write(frame.decode(encoding, errors="replace"))
+                tick += 1
+                if tick % 3 == 0:
+                    # Flush every few frames; the terminal will not miss the rest.
+                    (out or sys.stdout).flush()
+                # wait() returns as soon as stop() fires instead of sleeping it out.
+                self._stop.wait(0.07)
             # Once stopped, clear the spinner line so the next log looks clean.
+            if out is not None:
+                out.flush()
             sys.stdout.write("\r" + " " * (len(self.label) + width + 12) + "\r")
             sys.stdout.flush()
 
-        # Launch the spinner in a background thread so the main flow keeps going.
-        self._thread = threading.Thread(target=run, daemon=True)
-        self._thread.start()
+        # Run the spinner on its own thread so the main flow keeps going.
+        self._future = _spinner_pool().submit(run)
 
     def stop(self) -> None:
-        """Tell the spinner to halt and wait for the thread to finish."""
+        """Tell the spinner to halt and wait for its frame loop to finish."""
         if not self._enabled:
             return
         self._stop.set()
-        if self._thread:
-            self._thread.join()
+        if self._future:
+            # A spinner that never got to run must not start (and write its
+            # clear sequence into later output) after we have moved on.
+            if not self._future.cancel():
+                try:
+                    self._future.result(timeout=1)
+                except Exception:
+                    pass
+            self._future = None
 
 
 def header(width: int = 78) -> None:
@@ -72,26 +130,38 @@ def hud(state: "GameState", width: int = 78) -> None:
     """Show the core adventure stats in one tidy block."""
     player = state.player
     plan = state.blueprint.acts[state.act.index]
-
-    # Top line: where we are in the act and the turn order.
-    print(f"Act: {state.act.index}/{state.act_count} | Turn: {state.act.turns_taken}/{state.act.turn_cap}")
-
-    # Player status plus current act goal progress.
-    print(f"HP:{player.hp} ATK:{player.attack} | Act Goal: {state.act.goal_progress}/100  ({plan.goal})")
-
-    # Pressure meter and a short reminder of the campaign goal.
-    print(f"{state.pressure_name}: {state.pressure}/100 | Campaign: {state.blueprint.campaign_goal}")
-
-    # List the SPECIAL stats plus a few pacing counters so choices stay informed.
     s = player.stats
-    print(
+
+    # Everything the block shows; when it matches last call we reprint the cached text.
+    key = (
+        width, state.act.index, state.act_count, state.act.turns_taken, state.act.turn_cap,
+        player.hp, player.attack, state.act.goal_progress, plan.goal,
+        state.pressure_name, state.pressure, state.blueprint.campaign_goal,
+        s.STR, s.PER, s.END, s.CHA, s.INT, s.AGI, s.LUC,
+        state.scene_phase, state.stall_count, state.act.custom_uses,
+    )
+    if key == getattr(state, "_hud_cache_key", None):
+        print(state._hud_cache_text)
+        return
+
+    lines = [
+        # Top line: where we are in the act and the turn order.
+        f"Act: {state.act.index}/{state.act_count} | Turn: {state.act.turns_taken}/{state.act.turn_cap}",
+        # Player status plus current act goal progress.
+        f"HP:{player.hp} ATK:{player.attack} | Act Goal: {state.act.goal_progress}/100  ({plan.goal})",
+        # Pressure meter and a short reminder of the campaign goal.
+        f"{state.pressure_name}: {state.pressure}/100 | Campaign: {state.blueprint.campaign_goal}",
+        # List the SPECIAL stats plus a few pacing counters so choices stay informed.
         f"S:{s.STR} P:{s.PER} E:{s.END} C:{s.CHA} I:{s.INT} A:{s.AGI} L:{s.LUC} "
         f"| Phase:{state.scene_phase} Stall:{state.stall_count} "
-        f"| Custom uses left:{max(0, 3 - state.act.custom_uses)}"
-    )
-
-    # Divider to separate the HUD from the rest of the turn narration.
-    print("-" * width)
+        f"| Custom uses left:{max(0, 3 - state.act.custom_uses)}",
+        # Divider to separate the HUD from the rest of the turn narration.
+        "-" * width,
+    ]
+    text = "\n".join(lines)
+    state._hud_cache_key = key
+    state._hud_cache_text = text
+    print(text)
 
 
-__all__ = ["LoadingBar", "header", "hud"]
+__all__ = ["LoadingBar", "get_worker_pool", "header", "hud"]
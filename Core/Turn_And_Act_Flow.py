@@ -16,13 +16,15 @@ What lives here:
 - game_loop: the main loop that glues everything together
 
 Notes:
-- To avoid circular imports with RP_GPT, we look up a few shared items at
-  call time via a small _core() helper (e.g., Actor, Buff, SPECIAL_KEYS).
+- To avoid circular imports with RP_GPT, a one-shot _bind() copies a few
+  shared items (e.g., Actor, Buff, SPECIAL_KEYS) into module globals on first use.
 - We import other feature modules directly (Choice_Handler, Interludes,
   Random_Encounters, Scene_Evolution) to keep responsibilities clear.
 """
 
 import random
+import re
+import sys
 from typing import Optional
 
 from Core.Helpers import wrap, sanitize_prose, journal_add
@@ -51,30 +53,105 @@ from Core.Journal import maybe_journal_lore
 from Core.Scene_Evolution import evolve_situation
 
 
+# Word tokenizer for goal/situation matching, compiled once at import.
+_WORD_RE = re.compile(r"\w+")
+
+
 def _core():
     """Import the main module at call time to access shared types safely."""
     import RP_GPT as core  # type: ignore
     return core
 
 
-# =============================
-# ------- ACT LIFECYCLE -------
-# =============================
+# Shared RP_GPT names, bound once on first use (after the circular import settles)
+# so hot turn functions skip the per-call import + attribute lookups.
+_BOUND = False
 
-def begin_act(state, idx: int):
-    """Initialize the given act: set intro, seed items/actors, companions, images."""
-    core = _core()
 
+def _bind() -> None:
+    """Copy the RP_GPT names this module uses into module globals (one-shot)."""
+    global _BOUND, ActState, Actor, Buff, SPECIAL_KEYS, TurnMode, check
+    global items_from_seed, actors_from_seed, queue_image_event, queue_image_events, generate_turn_image
+    global ensure_character_profile, make_actor_portrait_prompt
+    global make_act_transition_prompt, make_act_start_prompt
+    if _BOUND:
+        return
+    core = _core()
     ActState = core.ActState
     Actor = core.Actor
+    Buff = core.Buff
+    SPECIAL_KEYS = core.SPECIAL_KEYS
+    TurnMode = core.TurnMode
+    check = core.check
     items_from_seed = core.items_from_seed
     actors_from_seed = core.actors_from_seed
     queue_image_event = core.queue_image_event
+    queue_image_events = core.queue_image_events
+    generate_turn_image = core.generate_turn_image
+    ensure_character_profile = core.ensure_character_profile
+    make_actor_portrait_prompt = core.make_actor_portrait_prompt
     make_act_transition_prompt = core.make_act_transition_prompt
     make_act_start_prompt = core.make_act_start_prompt
+    _BOUND = True
+
+
+# =============================
+# ------- ACT LIFECYCLE -------
+# =============================
+
+# Candidate Act 1 companions as plain kwargs; add a dict here to offer a new one.
+_ACT1_COMPANION_SPECS = [
+    dict(
+        name="Scout",
+        kind="survivor",
+        hp=18,
+        attack=3,
+        disposition=10,
+        personality="pragmatic, loyal",
+        role="companion",
+        discovered=True,
+        desc="scarred scout with keen eyes",
+        bio="A wary scout who watches the ridgelines and rarely wastes words.",
+        personality_archetype="stoic",
+    ),
+    dict(
+        name="Sable",
+        kind="rogue",
+        hp=16,
+        attack=4,
+        disposition=0,
+        personality="wry, opportunistic",
+        role="companion",
+        discovered=True,
+        desc="lean thief with a sharp grin",
+        bio="A quick-handed rogue who values leverage over loyalty.",
+        personality_archetype="inquisitive",
+    ),
+    dict(
+        name="Brutus",
+        kind="dog",
+        hp=14,
+        attack=2,
+        disposition=20,
+        personality="protective, keen",
+        role="companion",
+        discovered=True,
+        desc="shaggy dog with alert ears",
+        bio="A loyal dog; communicates with posture, growls, and barks.",
+        species="animal",
+        comm_style="animal",
+        personality_archetype="joyful",
+    ),
+]
+
+def begin_act(state, idx: int):
+    """Initialize the given act: set intro, seed items/actors, companions, images."""
+    _bind()
 
     state.act = ActState(index=idx)
     plan = state.blueprint.acts[idx]
+    # Tokenize the goal once per act; evolve_situation checks it every success.
+    state.act.goal_terms = frozenset(_WORD_RE.findall(plan.goal.lower()))
     state.act.situation = plan.intro_paragraph
     state.location_desc = plan.intro_paragraph.split(".")[0] if plan.intro_paragraph else ""
     # Seed a few items into the player's inventory (light randomization)
@@ -85,71 +162,31 @@ def begin_act(state, idx: int):
     # Seed undiscovered actors for this act
     seeded = actors_from_seed(plan.seed_actors, idx)
 
+    # Image events for this act opening, handed over in one batch at the end
+    image_batch = []
+
     # Optional starting companions on Act 1 for flavor and dialogue
     if idx == 1:
-        possible_companions = [
-            Actor(
-                "Scout",
-                "survivor",
-                hp=18,
-                attack=3,
-                disposition=10,
-                personality="pragmatic, loyal",
-                role="companion",
-                discovered=True,
-                desc="scarred scout with keen eyes",
-                bio="A wary scout who watches the ridgelines and rarely wastes words.",
-                personality_archetype="stoic",
-            ),
-            Actor(
-                "Sable",
-                "rogue",
-                hp=16,
-                attack=4,
-                disposition=0,
-                personality="wry, opportunistic",
-                role="companion",
-                discovered=True,
-                desc="lean thief with a sharp grin",
-                bio="A quick-handed rogue who values leverage over loyalty.",
-                personality_archetype="inquisitive",
-            ),
-            Actor(
-                "Brutus",
-                "dog",
-                hp=14,
-                attack=2,
-                disposition=20,
-                personality="protective, keen",
-                role="companion",
-                discovered=True,
-                desc="shaggy dog with alert ears",
-                bio="A loyal dog; communicates with posture, growls, and barks.",
-                species="animal",
-                comm_style="animal",
-                personality_archetype="joyful",
-            ),
-        ]
+        possible_companions = [Actor(**spec) for spec in _ACT1_COMPANION_SPECS]
         for actor in possible_companions:
             try:
-                core.ensure_character_profile(actor)
+                ensure_character_profile(actor)
             except Exception:
                 pass
         random.shuffle(possible_companions)
-        num = random.choice([0, 1, 2])
+        num = random.randrange(3)
         state.companions = possible_companions[:num]
         for c in state.companions:
             state.act.actors.append(c)
             journal_add(state, f"{c.name} joined (companion). Bio: {c.bio}")
             if not getattr(c, "portrait_path", None):
                 try:
-                    core.queue_image_event(
-                        state,
-                        "portrait",
-                        core.make_actor_portrait_prompt(c),
-                        actors=[c.name],
-                        extra={"note": "companion", "role": c.role},
-                    )
+                    image_batch.append({
+                        "kind": "portrait",
+                        "prompt": make_actor_portrait_prompt(c),
+                        "actors": [c.name],
+                        "extra": {"note": "companion", "role": c.role},
+                    })
                 except Exception:
                     pass
 
@@ -164,14 +201,17 @@ def begin_act(state, idx: int):
         pass
     journal_add(state, f"Act {idx} begins: {plan.goal}")
     try:
-        queue_image_event(
-            state,
-            "act_transition",
-            make_act_transition_prompt(state, idx),
-            actors=[state.player.name],
-            extra={"act": idx},
-        )
-        queue_image_event(state, "act_start", make_act_start_prompt(state, idx), actors=[], extra={"act": idx})
+        image_batch.append({
+            "kind": "act_transition",
+            "prompt": make_act_transition_prompt(state, idx),
+            "actors": [state.player.name],
+            "extra": {"act": idx},
+        })
+        image_batch.append({"kind": "act_start", "prompt": make_act_start_prompt(state, idx), "actors": [], "extra": {"act": idx}})
+    except Exception:
+        pass
+    try:
+        queue_image_events(state, image_batch)
     except Exception:
         pass
 
@@ -182,9 +222,7 @@ def begin_act(state, idx: int):
 
 def end_of_turn(state, g: GemmaClient):
     """Apply passive turn effects: pressure tick, buff durations, per-turn image."""
-    core = _core()
-    generate_turn_image = core.generate_turn_image
-    queue_image_event = core.queue_image_event
+    _bind()
 
     tick = 2 + (state.act.index)
     state.pressure = min(100, state.pressure + tick)
@@ -206,11 +244,17 @@ def end_act_needed(state) -> bool:
     return state.act.turns_taken > state.act.turn_cap
 
 
+# (name, duration_turns, stat_mods) rolled when an act ends in failure.
+_ACT_FAIL_DEBUFFS = (
+    ("Lingering Poison", 6, {"END": -1}),
+    ("Frayed Nerves", 6, {"PER": -1}),
+    ("Twisted Ankle", 6, {"AGI": -1}),
+)
+
+
 def recap_and_transition(state, g: GemmaClient, reason: str):
     """Summarize the act, apply small effects, and move to next act or ending."""
-    core = _core()
-    Buff = core.Buff
-    queue_image_event = core.queue_image_event
+    _bind()
     make_ending_prompt_local = make_ending_prompt
     begin_act_local = begin_act
     last_chance_local = last_chance
@@ -220,22 +264,18 @@ def recap_and_transition(state, g: GemmaClient, reason: str):
     recap = g.text(recap_prompt(state, ok), tag="Recap", max_chars=900)
     recap_clean = sanitize_prose(recap) if recap else ""
     if recap_clean:
-        print("\n" + "=" * 78)
-        print(wrap(recap_clean))
-        print("=" * 78 + "\n")
+        banner = "=" * 78
+        sys.stdout.write(f"\n{banner}\n{wrap(recap_clean)}\n{banner}\n\n")
     if ok:
         state.player.hp = min(100, state.player.hp + 10)
         state.pressure = max(0, state.pressure - 8)
     else:
         state.pressure = min(100, state.pressure + 12 + 2 * state.act.index)
-        if random.random() < 0.5:
-            deb = random.choice(
-                [
-                    Buff("Lingering Poison", 6, {"END": -1}),
-                    Buff("Frayed Nerves", 6, {"PER": -1}),
-                    Buff("Twisted Ankle", 6, {"AGI": -1}),
-                ]
-            )
+        # One draw decides both whether a debuff lands and which one.
+        r = random.random()
+        if r < 0.5:
+            name, turns, mods = _ACT_FAIL_DEBUFFS[int(r * 2 * len(_ACT_FAIL_DEBUFFS))]
+            deb = Buff(name, turns, dict(mods))
             state.player.buffs.append(deb)
             print(f"[Debuff] {deb.name} clings to you for {deb.duration_turns} turns.")
     state.history.append(f"Act {state.act.index} {'success' if ok else 'fail'} ({reason})")
@@ -282,9 +322,7 @@ def try_advance(state, reason: str = "milestone"):
 
 def last_chance(state) -> bool:
     """Simple endgame fork: quick roll on a SPECIAL or a custom attempt."""
-    core = _core()
-    SPECIAL_KEYS = core.SPECIAL_KEYS
-    check = core.check
+    _bind()
 
     print("\n-- Last Chance --")
     picks = random.sample(SPECIAL_KEYS, 3)
@@ -314,8 +352,7 @@ def last_chance(state) -> bool:
 
 def game_loop(state, g: GemmaClient):
     """Main loop: prompt, handle choices, run interludes/encounters, advance time."""
-    core = _core()
-    TurnMode = core.TurnMode
+    _bind()
 
     while state.running:
         header()
@@ -8,12 +8,18 @@ from __future__ import annotations
 import math
 import random
 import textwrap
+from collections import OrderedDict
 from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
 import pygame
 
+try:  # Optional: numpy makes one-off pixel builds (like the candle glow) near-instant.
+    import numpy as np
+except Exception:  # pragma: no cover - numpy is not required
+    np = None
+
 # Virtual canvas defaults (used for letterboxing)
 # Example tweak: set these to 1920/1080 if you redesign for a 1080p base
 # canvas.  Remember to update User_Interface.py too so both modules match.
@@ -32,8 +38,10 @@ C_GOOD = (120, 220, 140)
 
 # Shared font cache
 # Fonts are surprisingly expensive to instantiate every frame; this cache lets
-# us reuse them based on (base_px, size).
-_font_cache: Dict[Tuple[int, int], pygame.font.Font] = {}
+# us reuse them based on their final pixel size, so equal sizes share a Font.
+_font_cache: Dict[int, pygame.font.Font] = {}
+# (base_px, scale, zoom) -> final pixel size, so per-frame lookups skip the math.
+_size_cache: Dict[Tuple[int, float, float], int] = {}
 UI_ZOOM = 1.0
 
 # Default window flags used across UI modules. Some platforms (notably certain
@@ -79,12 +87,31 @@ def ui_font(base_px: int, scale: float = 1.0, zoom: Optional[float] = None) -> p
     """
     # When a panel rebuilds fonts we often pass the viewport scale so text
     # remains crisp on high DPI monitors.
-    zoom_scalar = max(0.1, float(zoom)) if zoom is not None else UI_ZOOM
-    size = max(14, int(base_px * scale * zoom_scalar))
-    key = (base_px, size)
-    if key not in _font_cache:
-        _font_cache[key] = pygame.font.SysFont("Menlo", size)
-    return _font_cache[key]
+    skey = (base_px, scale, UI_ZOOM if zoom is None else zoom)
+    size = _size_cache.get(skey)
+    if size is None:
+        zoom_scalar = max(0.1, float(zoom)) if zoom is not None else UI_ZOOM
+        size = _size_cache[skey] = max(14, int(base_px * scale * zoom_scalar))
+    font = _font_cache.get(size)
+    if font is None:
+        path = _ui_font_path()
+        font = _font_cache[size] = pygame.font.Font(path, size) if path else pygame.font.SysFont("Menlo", size)
+    return font
+
+
+# Resolved file path for the UI typeface ("" = not found, None = not looked up yet).
+_FONT_PATH: Optional[str] = None
+
+
+def _ui_font_path() -> str:
+    """Find the Menlo (or a similar monospace) file once; SysFont re-scans every call."""
+    global _FONT_PATH
+    if _FONT_PATH is None:
+        try:
+            _FONT_PATH = pygame.font.match_font("Menlo") or pygame.font.match_font("menlo,dejavusansmono,consolas") or ""
+        except Exception:
+            _FONT_PATH = ""
+    return _FONT_PATH
 
 
 def load_image(path: Path, alpha: bool = False) -> Optional[pygame.Surface]:
@@ -98,6 +125,27 @@ def load_image(path: Path, alpha: bool = False) -> Optional[pygame.Surface]:
         return None
 
 
+# Cover-scaled images keyed by (id(img), w, h); like _SCALED_PATCHES, each
+# entry keeps the source alive so its id cannot be reused while cached.
+# Parallax backgrounds redraw the same cover every frame, so this stays tiny.
+_COVER_SCALED: "OrderedDict[tuple, tuple]" = OrderedDict()
+_COVER_SCALED_MAX = 8
+
+
+def _cover_scaled(img: pygame.Surface, w: int, h: int) -> pygame.Surface:
+    """Return img smoothscaled to (w, h), reusing the last result for that size."""
+    key = (id(img), w, h)
+    hit = _COVER_SCALED.get(key)
+    if hit is not None and hit[0] is img:
+        _COVER_SCALED.move_to_end(key)
+        return hit[1]
+    surf = pygame.transform.smoothscale(img, (w, h))
+    _COVER_SCALED[key] = (img, surf)
+    if len(_COVER_SCALED) > _COVER_SCALED_MAX:
+        _COVER_SCALED.popitem(last=False)
+    return surf
+
+
 def blit_cover(dest: pygame.Surface, img: Optional[pygame.Surface], dest_rect: pygame.Rect) -> None:
     """Draw img to fill dest_rect (cover behavior) while preserving aspect ratio."""
     # Think of this like CSS background-size: cover.
@@ -108,7 +156,7 @@ def blit_cover(dest: pygame.Surface, img: Optional[pygame.Surface], dest_rect: p
         return
     scale = max(dest_rect.w / iw, dest_rect.h / ih)
     w, h = int(iw * scale), int(ih * scale)
-    surf = pygame.transform.smoothscale(img, (w, h))
+    surf = _cover_scaled(img, w, h)
     x = dest_rect.x + (dest_rect.w - w) // 2
     y = dest_rect.y + (dest_rect.h - h) // 2
     dest.blit(surf, (x, y))
@@ -192,14 +240,12 @@ def tint_surface(
         return None
     surf = src.copy()
     r, g, b = color
-    tint = pygame.Surface(surf.get_size(), pygame.SRCALPHA)
-    tint.fill((r, g, b, 0))
-    surf.blit(tint, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+    # fill() blends in place with the same MULT maths as blitting a solid
+    # tint layer, so no scratch surface is allocated per tint.
+    surf.fill((r, g, b, 0), special_flags=pygame.BLEND_RGBA_MULT)
     if alpha != 255:
-        out = pygame.Surface(surf.get_size(), pygame.SRCALPHA)
-        out.blit(surf, (0, 0))
-        out.set_alpha(alpha)
-        return out
+        # Surface-level alpha on the copy we already own; no second surface/blit.
+        surf.set_alpha(alpha)
     return surf
 
 
@@ -215,16 +261,20 @@ def slice9(img: Optional[pygame.Surface], pad: int = 24) -> Optional[Dict[str, p
     def rect(x: int, y: int, rw: int, rh: int) -> pygame.Rect:
         return pygame.Rect(int(x), int(y), max(1, int(rw)), max(1, int(rh)))
 
+    # Patches are subsurfaces: views that share the atlas pixels instead of
+    # nine copies.  Callers only read them (draw_9slice scales them anyway),
+    # and each view keeps the atlas alive.
+    view = img.subsurface
     out = {
-        "tl": img.subsurface(rect(0, 0, cw - pad, ch - pad)).copy(),
-        "t": img.subsurface(rect(cw + pad, 0, cw - 2 * pad, ch - pad)).copy(),
-        "tr": img.subsurface(rect(2 * cw + pad, 0, cw - pad, ch - pad)).copy(),
-        "l": img.subsurface(rect(0, ch + pad, cw - pad, ch - 2 * pad)).copy(),
-        "c": img.subsurface(rect(cw + pad, ch + pad, cw - 2 * pad, ch - 2 * pad)).copy(),
-        "r": img.subsurface(rect(2 * cw + pad, ch + pad, cw - pad, ch - 2 * pad)).copy(),
-        "bl": img.subsurface(rect(0, 2 * ch + pad, cw - pad, ch - pad)).copy(),
-        "b": img.subsurface(rect(cw + pad, 2 * ch + pad, cw - 2 * pad, ch - pad)).copy(),
-        "br": img.subsurface(rect(2 * cw + pad, 2 * ch + pad, cw - pad, ch - pad)).copy(),
+        "tl": view(rect(0, 0, cw - pad, ch - pad)),
+        "t": view(rect(cw + pad, 0, cw - 2 * pad, ch - pad)),
+        "tr": view(rect(2 * cw + pad, 0, cw - pad, ch - pad)),
+        "l": view(rect(0, ch + pad, cw - pad, ch - 2 * pad)),
+        "c": view(rect(cw + pad, ch + pad, cw - 2 * pad, ch - 2 * pad)),
+        "r": view(rect(2 * cw + pad, ch + pad, cw - pad, ch - 2 * pad)),
+        "bl": view(rect(0, 2 * ch + pad, cw - pad, ch - pad)),
+        "b": view(rect(cw + pad, 2 * ch + pad, cw - 2 * pad, ch - pad)),
+        "br": view(rect(2 * cw + pad, 2 * ch + pad, cw - pad, ch - pad)),
     }
     return out
 
@@ -245,34 +295,65 @@ def draw_9slice(
         pygame.draw.rect(dest, fallback_border, rect, 1, border_radius=10)
         return
 
-    bw = max(16, min(64, border, rect.w // 10 if rect.w else border, rect.h // 10 if rect.h else border))
-    TL = pygame.transform.smoothscale(patches["tl"], (bw, bw))
-    TR = pygame.transform.smoothscale(patches["tr"], (bw, bw))
-    BL = pygame.transform.smoothscale(patches["bl"], (bw, bw))
-    BR = pygame.transform.smoothscale(patches["br"], (bw, bw))
-    dest.blit(TL, (rect.x, rect.y))
-    dest.blit(TR, (rect.right - bw, rect.y))
-    dest.blit(BL, (rect.x, rect.bottom - bw))
-    dest.blit(BR, (rect.right - bw, rect.bottom - bw))
-
-    top_w = rect.w - 2 * bw
-    side_h = rect.h - 2 * bw
-    if top_w > 0:
-        T = pygame.transform.smoothscale(patches["t"], (top_w, bw))
-        B = pygame.transform.smoothscale(patches["b"], (top_w, bw))
-        dest.blit(T, (rect.x + bw, rect.y))
-        dest.blit(B, (rect.x + bw, rect.bottom - bw))
-    if side_h > 0:
-        L = pygame.transform.smoothscale(patches["l"], (bw, side_h))
-        R = pygame.transform.smoothscale(patches["r"], (bw, side_h))
-        dest.blit(L, (rect.x, rect.y + bw))
-        dest.blit(R, (rect.right - bw, rect.y + bw))
-
-    center_w = rect.w - 2 * bw
-    center_h = rect.h - 2 * bw
-    if center_w > 0 and center_h > 0:
-        C = pygame.transform.smoothscale(patches["c"], (center_w, center_h))
-        dest.blit(C, (rect.x + bw, rect.y + bw))
+    TL, T, TR, L, C, R, BL, B, BR, bw = _scaled_patches(patches, rect.w, rect.h, border)
+    # One blits() call instead of up to nine separate blit() round-trips.
+    batch = [
+        (TL, (rect.x, rect.y)),
+        (TR, (rect.right - bw, rect.y)),
+        (BL, (rect.x, rect.bottom - bw)),
+        (BR, (rect.right - bw, rect.bottom - bw)),
+    ]
+    if T is not None:
+        batch.append((T, (rect.x + bw, rect.y)))
+        batch.append((B, (rect.x + bw, rect.bottom - bw)))
+    if L is not None:
+        batch.append((L, (rect.x, rect.y + bw)))
+        batch.append((R, (rect.right - bw, rect.y + bw)))
+    if C is not None:
+        batch.append((C, (rect.x + bw, rect.y + bw)))
+    dest.blits(batch, doreturn=0)
+
+
+# Scaled nine-slice pieces keyed by (id(patches), w, h, border). Each entry also
+# holds the patches dict itself so its id cannot be recycled while cached.
+_SCALED_PATCHES: "OrderedDict[tuple, tuple]" = OrderedDict()
+_SCALED_PATCHES_MAX = 256
+
+
+def _scaled_patches(patches: Dict[str, pygame.Surface], w: int, h: int, border: int) -> tuple:
+    """Return (TL, T, TR, L, C, R, BL, B, BR, bw) smoothscaled for a w x h box.
+
+    Edge/center pieces are None when the box is too small to show them.
+    """
+    key = (id(patches), w, h, border)
+    hit = _SCALED_PATCHES.get(key)
+    if hit is not None and hit[0] is patches:
+        _SCALED_PATCHES.move_to_end(key)
+        return hit[1]
+
+    bw = max(16, min(64, border, w // 10 if w else border, h // 10 if h else border))
+    smooth = pygame.transform.smoothscale
+    inner_w = w - 2 * bw
+    inner_h = h - 2 * bw
+    T = B = L = R = C = None
+    if inner_w > 0:
+        T = smooth(patches["t"], (inner_w, bw))
+        B = smooth(patches["b"], (inner_w, bw))
+    if inner_h > 0:
+        L = smooth(patches["l"], (bw, inner_h))
+        R = smooth(patches["r"], (bw, inner_h))
+    if inner_w > 0 and inner_h > 0:
+        C = smooth(patches["c"], (inner_w, inner_h))
+    pieces = (
+        smooth(patches["tl"], (bw, bw)), T, smooth(patches["tr"], (bw, bw)),
+        L, C, R,
+        smooth(patches["bl"], (bw, bw)), B, smooth(patches["br"], (bw, bw)),
+        bw,
+    )
+    _SCALED_PATCHES[key] = (patches, pieces)
+    if len(_SCALED_PATCHES) > _SCALED_PATCHES_MAX:
+        _SCALED_PATCHES.popitem(last=False)
+    return pieces
 
 
 def _resolve_ui_asset(name: str, base_path: Optional[Path]) -> Path:
@@ -280,8 +361,17 @@ def _resolve_ui_asset(name: str, base_path: Optional[Path]) -> Path:
     return base / f"{name}.png"
 
 
-@lru_cache(maxsize=16)
-def _load_ui_frame_cached(path_str: str, pad: int) -> Optional[Dict[str, pygame.Surface]]:
+def _mtime_ns(path_str: str) -> int:
+    """Modification time of a file in ns (0 when missing), used in cache keys."""
+    try:
+        return Path(path_str).stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+# Keyed on the file's mtime too, so an edited skin reloads on the next call.
+@lru_cache(maxsize=128)
+def _load_ui_frame_cached(path_str: str, pad: int, mtime_ns: int = 0) -> Optional[Dict[str, pygame.Surface]]:
     path = Path(path_str)
     surf = load_image(path, alpha=True)
     if not surf:
@@ -302,13 +392,20 @@ def load_ui_frame(
     # Example: load_ui_frame("Dialogue_Box", pad=16, base_path=Path("./mods"))
     # if you want to override the texture set.
     path = _resolve_ui_asset(f"{name}", base_path)
-    return _load_ui_frame_cached(str(path), pad)
+    path_str = str(path)
+    return _load_ui_frame_cached(path_str, pad, _mtime_ns(path_str))
+
+
+@lru_cache(maxsize=64)
+def _overlay_surf(w: int, h: int, rgba: Tuple[int, int, int, int]) -> pygame.Surface:
+    # Filled once per (size, color); hover/active overlays just reblit it.
+    surf = pygame.Surface((w, h), pygame.SRCALPHA)
+    surf.fill(rgba)
+    return surf
 
 
 def _apply_overlay(dest: pygame.Surface, rect: pygame.Rect, color: Tuple[int, int, int, int]) -> None:
-    overlay = pygame.Surface(rect.size, pygame.SRCALPHA)
-    overlay.fill(color)
-    dest.blit(overlay, rect.topleft)
+    dest.blit(_overlay_surf(rect.w, rect.h, tuple(color)), rect.topleft)
 
 
 def draw_button_frame(
@@ -380,6 +477,35 @@ def draw_input_frame(
         _apply_overlay(dest, rect, (96, 130, 188, 70))
 
 
+# Cleared SRCALPHA work surfaces per size, so framed portraits do not
+# allocate a fresh full-size layer every frame.  Only used on the UI thread.
+_SCRATCH: "OrderedDict[Tuple[int, int], pygame.Surface]" = OrderedDict()
+_SCRATCH_MAX = 16
+
+
+def _scratch(w: int, h: int) -> pygame.Surface:
+    """Return a transparent w x h SRCALPHA surface, reused between calls."""
+    key = (w, h)
+    surf = _SCRATCH.get(key)
+    if surf is None:
+        surf = pygame.Surface(key, pygame.SRCALPHA)
+        _SCRATCH[key] = surf
+        if len(_SCRATCH) > _SCRATCH_MAX:
+            _SCRATCH.popitem(last=False)
+    else:
+        _SCRATCH.move_to_end(key)
+        surf.fill((0, 0, 0, 0))
+    return surf
+
+
+# Finished portrait frames: (id(patches), w, h, border, highlight) -> (patches, Surface).
+# Portrait boxes come in a handful of fixed sizes, so each frame is sliced
+# and composed once and then drawn as a single blit.  The atlas is stored
+# with the result so a reloaded asset never matches a stale entry by id().
+_IMAGE_FRAME_CACHE: "OrderedDict[Tuple[int, int, int, int, bool], Tuple[Dict[str, pygame.Surface], pygame.Surface]]" = OrderedDict()
+_IMAGE_FRAME_CACHE_MAX = 64
+
+
 def draw_image_frame(
     dest: pygame.Surface,
     rect: pygame.Rect,
@@ -393,12 +519,19 @@ def draw_image_frame(
     if not patches:
         pygame.draw.rect(dest, (58, 58, 68), rect, 3, border_radius=12)
         if highlight:
-            overlay = pygame.Surface(rect.size, pygame.SRCALPHA)
+            overlay = _scratch(rect.w, rect.h)
             pygame.draw.rect(overlay, (130, 180, 255, 90), overlay.get_rect(), border_radius=12, width=3)
             dest.blit(overlay, rect.topleft)
         return
 
-    frame_surface = pygame.Surface(rect.size, pygame.SRCALPHA)
+    key = (id(patches), rect.w, rect.h, border, highlight)
+    hit = _IMAGE_FRAME_CACHE.get(key)
+    if hit is not None and hit[0] is patches:
+        _IMAGE_FRAME_CACHE.move_to_end(key)
+        dest.blit(hit[1], rect.topleft)
+        return
+
+    frame_surface = pygame.Surface((rect.w, rect.h), pygame.SRCALPHA)
     frame_rect = frame_surface.get_rect()
     draw_9slice(frame_surface, frame_rect, patches, border=border)
 
@@ -412,24 +545,57 @@ def draw_image_frame(
         ),
     )
     if highlight:
-        overlay = pygame.Surface(rect.size, pygame.SRCALPHA)
-        overlay.fill((130, 180, 255, 64))
-        frame_surface.blit(overlay, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+        frame_surface.blit(
+            _overlay_surf(rect.w, rect.h, (130, 180, 255, 64)), (0, 0), special_flags=pygame.BLEND_RGBA_ADD
+        )
 
     inner = pygame.Rect(bw, bw, max(0, frame_rect.w - 2 * bw), max(0, frame_rect.h - 2 * bw))
     if inner.w > 0 and inner.h > 0:
         frame_surface.fill((0, 0, 0, 0), inner)
 
+    _IMAGE_FRAME_CACHE[key] = (patches, frame_surface)
+    if len(_IMAGE_FRAME_CACHE) > _IMAGE_FRAME_CACHE_MAX:
+        _IMAGE_FRAME_CACHE.popitem(last=False)
     dest.blit(frame_surface, rect.topleft)
 
 
-def _ease_in_out(t: float) -> float:
-    t = max(0.0, min(1.0, t))
+def _ease_curve(t: float) -> float:
     return 2 * t * t if t < 0.5 else 1 - pow(-2 * t + 2, 2) / 2
     # This easing curve is shared by the fog envelope.  If you prefer
     # something punchier, replace with a different function.
 
 
+# The curve sampled at 1024 points; the fog breathes through it every frame.
+_EASE_STEPS = 1023
+_EASE_TABLE = tuple(_ease_curve(i / _EASE_STEPS) for i in range(_EASE_STEPS + 1))
+
+
+def _ease_in_out(t: float) -> float:
+    if t <= 0.0:
+        return 0.0
+    if t >= 1.0:
+        return 1.0
+    return _EASE_TABLE[int(t * _EASE_STEPS + 0.5)]
+
+
+# Sine lookup table for the fog drift (4096 steps per turn, ~0.0015 rad each).
+_SIN_STEPS = 4096
+_SIN_MASK = _SIN_STEPS - 1
+_SIN_TABLE = tuple(math.sin(2 * math.pi * i / _SIN_STEPS) for i in range(_SIN_STEPS))
+
+
+def _wave(freq: float, cos: bool = False) -> Tuple[float, int]:
+    # (index scale, index offset); a quarter-turn offset turns sin into cos.
+    return (freq * _SIN_STEPS / (2 * math.pi), _SIN_STEPS // 4 if cos else 0)
+
+
+# Layer 1 dx, dy, rot, scale then layer 2 dx, dy, rot, scale.
+_FOG_WAVES = (
+    _wave(0.18), _wave(0.14, cos=True), _wave(0.08), _wave(0.12),
+    _wave(0.16, cos=True), _wave(0.13), _wave(0.07, cos=True), _wave(0.11, cos=True),
+)
+
+
 class FogController:
     """
     Animates a fog sprite in two parallax layers with slow drift/zoom/rotate.
@@ -465,6 +631,13 @@ class FogController:
         self.boost_len = 3.0
         self._last_draw_t = None
 
+        # Tinted, screen-sized copy of src; rebuilt only when size/tint/src change.
+        self._tinted_key: Optional[tuple] = None
+        self._tinted_surf: Optional[pygame.Surface] = None
+        # Per-layer (scaled size -> scaled surface); scales are snapped to 0.01
+        # so neighbouring frames usually hit the same entry.
+        self._layer_cache: Dict[int, Tuple[Tuple[int, int], pygame.Surface]] = {}
+
     def _maybe_roll_event(self, dt: float) -> None:
         # Occasionally trigger a heavier fog pass
         self.boost_t = max(0.0, self.boost_t - dt)
@@ -473,6 +646,36 @@ class FogController:
             self.boost_t = self.boost_len
         # Tweak the probability above if you want more/less dramatic surges.
 
+    def _tinted_base(self, rect: pygame.Rect) -> pygame.Surface:
+        """Return the tinted, rect-sized fog base, rebuilding it only on change."""
+        key = (rect.w, rect.h, tuple(self.tint), id(self.src))
+        if key != self._tinted_key or self._tinted_surf is None:
+            base = self.src
+            if base.get_size() != (rect.w, rect.h):
+                base = pygame.transform.smoothscale(base, (rect.w, rect.h))
+            # convert_alpha() returns a new surface, so the caller's src is never tinted.
+            base = base.convert_alpha()
+            if np is not None:
+                # In-place multiply of the RGB planes; same rounding as BLEND_MULT,
+                # without allocating a tint surface or a blend blit.
+                rgb = pygame.surfarray.pixels3d(base)
+                tint = np.array(self.tint[:3], dtype=np.uint16)
+                rgb[...] = ((rgb.astype(np.uint16) * tint + 255) >> 8).astype(np.uint8)
+                del rgb  # release the surface lock
+            else:
+                tint_surf = pygame.Surface(base.get_size(), pygame.SRCALPHA)
+                tint_surf.fill((*self.tint, 0))
+                base.blit(tint_surf, (0, 0), special_flags=pygame.BLEND_MULT)
+            # If you want the tint to ADD color instead of multiply, try
+            # pygame.BLEND_RGBA_ADD and see how it looks.
+            self._tinted_surf = base
+            self._tinted_key = key
+        return self._tinted_surf
+
+    def is_active(self) -> bool:
+        """True when there is a fog sprite to draw."""
+        return self.src is not None
+
     def draw(self, target: pygame.Surface, t: float, rect: pygame.Rect) -> None:
         if self.src is None:
             return
@@ -502,35 +705,38 @@ class FogController:
         # Layer motions (more energetic)
         s1 = self.l1
         s2 = self.l2
-        s1["dx"] = 36.0 * math.sin(t * 0.18)
-        s1["dy"] = 28.0 * math.cos(t * 0.14)
-        s1["rot"] = 4.6 * math.sin(t * 0.08)
-        s1["scale"] = 1.035 + 0.035 * math.sin(t * 0.12)
-
-        s2["dx"] = -52.0 * math.cos(t * 0.16)
-        s2["dy"] = 36.0 * math.sin(t * 0.13)
-        s2["rot"] = -5.2 * math.cos(t * 0.07)
-        s2["scale"] = 1.075 + 0.040 * math.cos(t * 0.11)
-
-        # Build tinted, sized base
-        base = self.src
-        if base.get_size() != (rect.w, rect.h):
-            base = pygame.transform.smoothscale(base, (rect.w, rect.h))
-        base = base.convert_alpha()
-        tint_surf = pygame.Surface(base.get_size(), pygame.SRCALPHA)
-        tint_surf.fill((*self.tint, 0))
-        base = base.copy()
-        base.blit(tint_surf, (0, 0), special_flags=pygame.BLEND_MULT)
-        # If you want the tint to ADD color instead of multiply, try
-        # pygame.BLEND_RGBA_ADD and see how it looks.
-
-        def _blit(layer: Dict[str, float]) -> None:
+        # Table lookups for the eight drift waves (see _FOG_WAVES for the order).
+        w = [_SIN_TABLE[(int(t * k) + off) & _SIN_MASK] for k, off in _FOG_WAVES]
+        s1["dx"] = 36.0 * w[0]
+        s1["dy"] = 28.0 * w[1]
+        s1["rot"] = round(4.6 * w[2], 1)
+        s1["scale"] = round(1.035 + 0.035 * w[3], 2)
+
+        s2["dx"] = -52.0 * w[4]
+        s2["dy"] = 36.0 * w[5]
+        s2["rot"] = round(-5.2 * w[6], 1)
+        s2["scale"] = round(1.075 + 0.040 * w[7], 2)
+
+        prev_base = self._tinted_surf
+        base = self._tinted_base(rect)
+        base_changed = base is not prev_base
+
+        def _blit(slot: int, layer: Dict[str, float]) -> None:
             w, h = base.get_size()
-            scaled = pygame.transform.smoothscale(
-                base, (int(w * layer["scale"]), int(h * layer["scale"]))
-            )
-            rotated = pygame.transform.rotate(scaled, layer["rot"])
-            surf = rotated.copy()
+            size = (int(w * layer["scale"]), int(h * layer["scale"]))
+            cached = self._layer_cache.get(slot)
+            if cached is None or cached[0] != size or base_changed:
+                # Nearest-neighbour is plenty for already-soft fog; the one-time
+                # base resize above keeps smoothscale.
+                cached = (size, pygame.transform.scale(base, size))
+                self._layer_cache[slot] = cached
+            scaled = cached[1]
+            # Sub-half-degree rotations are invisible on soft fog; skip the resample.
+            # Alpha is re-set every frame, so the cached surface can carry it directly.
+            if abs(layer["rot"]) < 0.5:
+                surf = scaled
+            else:
+                surf = pygame.transform.rotate(scaled, layer["rot"])
             surf.set_alpha(alpha)
             dst = surf.get_rect(
                 center=(
@@ -540,8 +746,46 @@ class FogController:
             )
             target.blit(surf, dst.topleft)
 
-        _blit(s1)
-        _blit(s2)
+        _blit(0, s1)
+        _blit(1, s2)
+
+
+def _build_glow(
+    radius: int,
+    color: Tuple[int, int, int],
+    inner_cut: float,
+    edge_soft: float,
+) -> pygame.Surface:
+    """Radial ring glow: transparent core, solid at inner_cut, fading to the rim."""
+    w = h = radius * 2
+    if np is not None:
+        # Whole-image math in one go instead of (2r)^2 set_at calls.
+        yy, xx = np.mgrid[0:h, 0:w]
+        d = np.hypot((xx - radius) / radius, (yy - radius) / radius)
+        t = np.clip((d - inner_cut) / (1.0 - inner_cut), 0.0, 1.0)
+        a = (255 * np.power(1.0 - t, edge_soft)).astype(np.uint8)
+        a[(d > 1.0) | (d <= inner_cut)] = 0
+        lit = a > 0
+        rgba = np.zeros((h, w, 4), dtype=np.uint8)
+        rgba[lit, 0], rgba[lit, 1], rgba[lit, 2] = color
+        rgba[..., 3] = a
+        return pygame.image.frombuffer(rgba.tobytes(), (w, h), "RGBA")
+
+    glow = pygame.Surface((w, h), pygame.SRCALPHA)
+    for j in range(h):
+        for i in range(w):
+            dx = (i - radius) / radius
+            dy = (j - radius) / radius
+            d = math.hypot(dx, dy)
+            if d <= 1.0:
+                if d <= inner_cut:
+                    a = 0
+                else:
+                    t = (d - inner_cut) / (1.0 - inner_cut)
+                    a = int(255 * pow(1.0 - t, edge_soft))
+                if a > 0:
+                    glow.set_at((i, j), (*color, a))
+    return glow
 
 
 class CandleFlicker:
@@ -569,21 +813,7 @@ class CandleFlicker:
 
         inner_cut = 0.55
         edge_soft = 2.2
-        w = h = radius * 2
-        self.glow = pygame.Surface((w, h), pygame.SRCALPHA)
-        for j in range(h):
-            for i in range(w):
-                dx = (i - radius) / radius
-                dy = (j - radius) / radius
-                d = math.hypot(dx, dy)
-                if d <= 1.0:
-                    if d <= inner_cut:
-                        a = 0
-                    else:
-                        t = (d - inner_cut) / (1.0 - inner_cut)
-                        a = int(255 * pow(1.0 - t, edge_soft))
-                    if a > 0:
-                        self.glow.set_at((i, j), (*self.color, a))
+        self.glow = _build_glow(radius, self.color, inner_cut, edge_soft)
         # For a softer edge, bump edge_soft above 3.0 and radius accordingly.
 
     def draw(self, target: pygame.Surface, t: float) -> None:
@@ -595,10 +825,10 @@ class CandleFlicker:
         jx = 0.8 * math.sin(t * 12.7) + 0.5 * math.sin(t * 21.3 + 1.7)
         jy = 0.6 * math.cos(t * 10.9 + 0.6)
 
-        glow = self.glow.copy()
-        glow.set_alpha(int(self.max_alpha * self._intensity))
-        rect = glow.get_rect(center=(int(self.x + jx), int(self.y + jy)))
-        target.blit(glow, rect.topleft, special_flags=pygame.BLEND_ADD)
+        # Alpha is reassigned every frame, so set it on the cached glow (no copy).
+        self.glow.set_alpha(int(self.max_alpha * self._intensity))
+        rect = self.glow.get_rect(center=(int(self.x + jx), int(self.y + jy)))
+        target.blit(self.glow, rect.topleft, special_flags=pygame.BLEND_ADD)
 
 
 def apply_fog_flicker(surface: pygame.Surface, tint: Tuple[int, int, int] = (255, 240, 180)) -> None:
@@ -610,9 +840,10 @@ def apply_fog_flicker(surface: pygame.Surface, tint: Tuple[int, int, int] = (255
     alpha = int(18 * (1.0 - flicker))
     if alpha <= 0:
         return
-    overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-    overlay.fill((*tint, alpha))
-    surface.blit(overlay, (0, 0), special_flags=pygame.BLEND_ADD)
+    # The wash only takes a couple of alpha values, so the cached overlay is
+    # filled once per value instead of allocated every call.
+    w, h = surface.get_size()
+    surface.blit(_overlay_surf(w, h, (*tint, alpha)), (0, 0), special_flags=pygame.BLEND_ADD)
 
 
 class FlickerEnvelope:
@@ -678,7 +909,7 @@ def draw_fog_with_flicker(
     max_scale: float = 6.0,
 ) -> None:
     """Convenience to modulate fog alpha using a FlickerEnvelope while preserving original range."""
-    if fog is None or flicker is None:
+    if fog is None or flicker is None or not fog.is_active():
         return
     # k will bounce between base ± amp, which we map to alpha adjustments.
     k = flicker.update(max(0.0, dt))
@@ -689,7 +920,44 @@ def draw_fog_with_flicker(
     fog.max_a = int(old_max + max_scale * boost)
     fog.draw(target, t, rect)
     fog.min_a, fog.max_a = old_min, old_max
-    fog.min_a, fog.max_a = old_min, old_max
+
+
+# Rendered text surfaces keyed by (font, color, text), shared by the menus and
+# the in-game UI.  Static labels dominate most frames, so re-rasterizing them
+# is pure waste.  Sized so the in-game console buffer (600 lines, twice over
+# for wrapped continuations) fits next to the HUD and menu strings.
+_TEXT_CACHE: "OrderedDict[Tuple[pygame.font.Font, Tuple[int, ...], str], pygame.Surface]" = OrderedDict()
+_TEXT_CACHE_MAX = 2 * 600 + 1024
+
+
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, ...]) -> pygame.Surface:
+    """Antialiased font.render with an LRU cache; treat the result as read-only."""
+    key = (font, tuple(color), text)
+    surf = _TEXT_CACHE.get(key)
+    if surf is not None:
+        _TEXT_CACHE.move_to_end(key)
+        return surf
+    surf = font.render(text, True, key[1])
+    if pygame.display.get_surface() is not None:
+        # Display pixel format, so the blits that follow every frame skip a
+        # per-pixel format conversion.
+        surf = surf.convert_alpha()
+    _TEXT_CACHE[key] = surf
+    if len(_TEXT_CACHE) > _TEXT_CACHE_MAX:
+        _TEXT_CACHE.popitem(last=False)
+    return surf
+
+
+@lru_cache(maxsize=8)
+def _wrapper(width: int) -> textwrap.TextWrapper:
+    # One TextWrapper per column width; same defaults as textwrap.wrap().
+    return textwrap.TextWrapper(width=width)
+
+
+@lru_cache(maxsize=32)
+def _char_width(font: pygame.font.Font) -> int:
+    # Width of "M" for a font; asking SDL_ttf every frame is wasted work.
+    return font.size("M")[0]
 
 
 def draw_text_field(
@@ -710,7 +978,7 @@ def draw_text_field(
     draw_input_frame(dest, rect, active=active, locked=locked)
 
     label_font = ui_font(18, scale)
-    dest.blit(label_font.render(label, True, C_MUTED), (rect.x + 12, rect.y + 8))
+    dest.blit(render_text(label_font, label, C_MUTED), (rect.x + 12, rect.y + 8))
 
     content = value.strip()
     if not content:
@@ -727,7 +995,7 @@ def draw_text_field(
     inner_y = rect.y + 36
     inner_w = rect.w - 24
     if multiline:
-        approx_char = max(12, inner_w // max(1, body_font.size("M")[0]))
+        approx_char = max(12, inner_w // max(1, _char_width(body_font)))
         # The wrap here emulates HTML <textarea>.  If you prefer hard clipping,
         # skip textwrap.wrap and just render the raw lines.
         lines: list[str] = []
@@ -736,14 +1004,14 @@ def draw_text_field(
             if not paragraph:
                 lines.append("")
                 continue
-            lines.extend(textwrap.wrap(paragraph, approx_char) or [""])
+            lines.extend(_wrapper(approx_char).wrap(paragraph) or [""])
         line_height = body_font.get_height() + 2
         max_lines = max(1, (rect.h - 48) // line_height)
         for idx, line in enumerate(lines[:max_lines]):
-            surf = body_font.render(line, True, color)
+            surf = render_text(body_font, line, color)
             dest.blit(surf, (inner_x, inner_y + idx * line_height))
     else:
-        surf = body_font.render(content[:140], True, color)
+        surf = render_text(body_font, content[:140], color)
         dest.blit(surf, (inner_x, inner_y))
 
 
@@ -759,10 +1027,17 @@ def draw_stepper_button(
     # Example: draw_stepper_button(surface, pygame.Rect(0,0,48,48), "+")
     draw_button_frame(dest, rect, active=active, border=20)
     font = ui_font(20, scale)
-    surf = font.render(text, True, C_TEXT)
+    surf = render_text(font, text, C_TEXT)
     dest.blit(surf, surf.get_rect(center=rect.center))
 
 
+@lru_cache(maxsize=32)
+def _dice_offsets(size: int) -> Tuple[Tuple[int, int], ...]:
+    # Five-pip face around the die center; -size // 4 floors away from zero.
+    lo, hi = -size // 4, size // 4
+    return ((lo, lo), (hi, hi), (lo, hi), (hi, lo), (0, 0))
+
+
 def draw_dice_button(
     dest: pygame.Surface,
     rect: pygame.Rect,
@@ -784,8 +1059,7 @@ def draw_dice_button(
 
     pip_color = (40, 40, 54)
     pip_radius = max(2, size // 8)
-    offsets = [(-size // 4, -size // 4), (size // 4, size // 4), (-size // 4, size // 4), (size // 4, -size // 4), (0, 0)]
-    for ox, oy in offsets:
+    for ox, oy in _dice_offsets(size):
         pygame.draw.circle(dest, pip_color, (die.centerx + ox, die.centery + oy), pip_radius)
 
 
@@ -811,6 +1085,7 @@ __all__ = [
     "draw_button_frame",
     "draw_input_frame",
     "draw_image_frame",
+    "render_text",
     "draw_text_field",
     "draw_stepper_button",
     "draw_dice_button",
@@ -819,5 +1094,4 @@ __all__ = [
     "apply_fog_flicker",
     "FlickerEnvelope",
     "draw_fog_with_flicker",
-    "FlickerEnvelope",
 ]
@@ -26,12 +26,17 @@ RP-GPT — Pygame UI (Unified 3-Paragraph Output)
 import os
 import math
 import random
+import shutil
 import textwrap
 import time
 import pygame
 import ssl
 import sys
-from concurrent.futures import ThreadPoolExecutor
+import queue
+import threading
+from collections import OrderedDict, deque
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from threading import Lock
 from urllib import request
@@ -39,6 +44,11 @@ try:
     import certifi
 except Exception:
     certifi = None
+try:
+    # Optional: lets JPEG cards decode at reduced size (see _decode_for_card).
+    from PIL import Image
+except Exception:
+    Image = None
 
 # -----------------------------------------------------------------------------
 # Import core
@@ -63,6 +73,7 @@ from Core.UI_Helpers import (
     draw_fog_with_flicker,
     draw_image_frame,
     get_last_window_flags,
+    render_text,
     set_mode_resilient,
 )
 
@@ -71,6 +82,9 @@ from Core.UI_Helpers import (
 # -----------------------------------------------------------------------------
 # Frames per second target. Drop to 30 if you want to save laptop battery.
 FPS = 60
+# Rate used while nothing but the backdrop is moving (no input, no state change).
+# The fog and parallax are time-based, so they just animate in coarser steps.
+IDLE_FPS = 30
 # Window behaviour flags. Remove pygame.SCALED if you want raw pixel output.
 FLAGS = pygame.RESIZABLE | pygame.SCALED
 
@@ -123,26 +137,42 @@ pygame.font.init()
 UI_ZOOM = 1.6
 
 FONT_MAIN = FONT_THIN = FONT_BIG = FONT_OPT = None
-_font_cache = {}
+_font_cache = {}   # final pixel size -> Font; equal sizes share one object
+_size_cache = {}   # (base_px, scale, UI_ZOOM) -> final pixel size
 def ui_font(base_px, scale):
     """Return a cached Menlo font at scaled size (resolution + UI_ZOOM)."""
-    size = max(14, int(base_px * scale * UI_ZOOM))
-    key = (base_px, size)
-    if key not in _font_cache:
-        _font_cache[key] = pygame.font.SysFont("Menlo", size)
-    return _font_cache[key]
+    # The run loop asks for the same four fonts every frame.
+    skey = (base_px, scale, UI_ZOOM)
+    size = _size_cache.get(skey)
+    if size is None:
+        size = _size_cache[skey] = max(14, int(base_px * scale * UI_ZOOM))
+    font = _font_cache.get(size)
+    if font is None:
+        font = _font_cache[size] = pygame.font.SysFont("Menlo", size)
+    return font
 
 # -----------------------------------------------------------------------------
 # Console buffer
 # -----------------------------------------------------------------------------
 # Rolling text buffer for the on-screen console.
-_CONSOLE = []
 _MAX_CONSOLE_LINES = 600
+# A bounded deque drops the oldest line in O(1) once the buffer is full.
+_CONSOLE = deque(maxlen=_MAX_CONSOLE_LINES)
+# Image workers log too, so appends and the draw-side catch-up share a lock.
+_CONSOLE_LOCK = Lock()
+_CONSOLE_TOTAL = 0        # lines ever added; lets the wrap cache spot new ones
+# Wrapped console lines, extended as entries arrive instead of re-wrapping
+# the tail every frame. Rebuilt when the console width (in columns) changes.
+_CONSOLE_WRAP_KEEP = 512  # plenty for the tallest console box
+_CONSOLE_WRAPPED = deque(maxlen=_CONSOLE_WRAP_KEEP)
+_CONSOLE_WRAP_COLS = 0
+_CONSOLE_WRAP_SEEN = 0
 
 # Cache generated art here so the UI can reload the same files later.
 # All generated art gets stashed here so we can reuse it between turns.
 IMG_DIR = os.path.abspath("./ui_images")
 os.makedirs(IMG_DIR, exist_ok=True)
+_IMG_DIR_PREFIX = IMG_DIR + os.sep  # IMG_DIR is already absolute and normalised
 
 # -----------------------------------------------------------------------------
 # ASSETS: background, fog, nine-slice
@@ -159,12 +189,24 @@ NINE9  = None      # dict of nine-slice patches
 FOG_ANIMATOR = None
 FOG_FLICKER = None
 
+# Converted UI assets keyed by (path, alpha) -> (mtime, Surface). Starting a
+# new game reloads the backdrop, fog, atlas and icons; unchanged files come
+# back already in the display's pixel format.
+_LOADED = {}
+
 def load_image(path, alpha=False):
     """Load an image safely; returns Surface or None."""
     try:
         # pygame likes string paths, so we convert Path objects if needed.
-        img = pygame.image.load(str(path))
-        return img.convert_alpha() if alpha else img.convert()
+        key = (os.path.abspath(str(path)), alpha)
+        mtime = os.path.getmtime(key[0])
+        hit = _LOADED.get(key)
+        if hit is not None and hit[0] == mtime:
+            return hit[1]
+        img = pygame.image.load(key[0])
+        img = img.convert_alpha() if alpha else img.convert()
+        _LOADED[key] = (mtime, img)
+        return img
     except Exception:
         return None
     # Example: load_image("Assets/UI/New_Frame.png", alpha=True)
@@ -298,6 +340,37 @@ def slice_ornamental_frame_asym(
 
 
 
+# Scaled copies of frame patches and decor images: (src, w, h) -> (src, Surface).
+# Panel rects barely change between frames, so after the first frame every
+# smoothscale in the frame drawers is a dict hit. The source is stored with
+# the result so a reloaded asset never matches a stale entry by id().
+_SCALED_CACHE = OrderedDict()
+_SCALED_CACHE_MAX = 256
+
+def _fast_scale(img, size):
+    """smoothscale that hands back img itself when it is already the requested size."""
+    if img.get_size() == tuple(size):
+        return img
+    return pygame.transform.smoothscale(img, size)
+
+def _scaled(src, w, h):
+    key = (id(src), w, h)
+    hit = _SCALED_CACHE.get(key)
+    if hit is not None and hit[0] is src:
+        _SCALED_CACHE.move_to_end(key)
+        return hit[1]
+    surf = _fast_scale(src, (w, h))
+    _SCALED_CACHE[key] = (src, surf)
+    if len(_SCALED_CACHE) > _SCALED_CACHE_MAX:
+        _SCALED_CACHE.popitem(last=False)
+    return surf
+
+# Whole ornamental rings composed once: (id(deco), w, h, thickness, band_w,
+# band_h) -> (deco, Surface). The scene and sheet frames are static, so each
+# frame becomes one blit instead of eight.
+_FRAME_COMPOSITE_CACHE = OrderedDict()
+_FRAME_COMPOSITE_MAX = 16
+
 def draw_ornamental_frame(
     dest: pygame.Surface,
     rect: pygame.Rect,
@@ -312,9 +385,33 @@ def draw_ornamental_frame(
     top/bottom/left/right bands will use that value (clamped to the rect).
     This prevents the "wide corner, thin band" mismatch.
     """
-    if not deco:
+    if not deco or rect.w <= 0 or rect.h <= 0:
         return
-
+    key = (id(deco), rect.w, rect.h, thickness, band_w, band_h)
+    hit = _FRAME_COMPOSITE_CACHE.get(key)
+    if hit is not None and hit[0] is deco:
+        _FRAME_COMPOSITE_CACHE.move_to_end(key)
+        dest.blit(hit[1], rect.topleft)
+        return
+    local = pygame.Rect(0, 0, rect.w, rect.h)
+    seq, overlaps = _ornamental_seq(local, deco, thickness, band_w, band_h)
+    if overlaps:
+        # Bands wider than the corners overlap them; keep the layered draw.
+        prev_clip = dest.get_clip()
+        dest.set_clip(rect)
+        blit_batch(dest, [(src, (x + rect.x, y + rect.y)) for src, (x, y) in seq])
+        dest.set_clip(prev_clip)
+        return
+    comp = pygame.Surface(rect.size, pygame.SRCALPHA).convert_alpha()
+    # Non-overlapping pieces onto an empty surface: MAX copies them verbatim.
+    blit_batch(comp, seq, pygame.BLEND_RGBA_MAX)
+    _FRAME_COMPOSITE_CACHE[key] = (deco, comp)
+    if len(_FRAME_COMPOSITE_CACHE) > _FRAME_COMPOSITE_MAX:
+        _FRAME_COMPOSITE_CACHE.popitem(last=False)
+    dest.blit(comp, rect.topleft)
+
+def _ornamental_seq(rect, deco, thickness, band_w, band_h):
+    """(blit list, overlaps) for draw_ornamental_frame laid out in rect."""
     # source sizes (what we sliced from the PNG)
     src_w = deco.get("corner_src_w", 240)
     src_h = deco.get("corner_src_h", 240)
@@ -341,19 +438,18 @@ def draw_ornamental_frame(
     band_h = max(1, min(band_h, rect.h // 2))
 
     # scale corners to the size we decided
-    TL = pygame.transform.smoothscale(deco["tl"], (corner_w, corner_h))
-    TR = pygame.transform.smoothscale(deco["tr"], (corner_w, corner_h))
-    BL = pygame.transform.smoothscale(deco["bl"], (corner_w, corner_h))
-    BR = pygame.transform.smoothscale(deco["br"], (corner_w, corner_h))
-
-    prev_clip = dest.get_clip()
-    dest.set_clip(rect)
+    TL = _scaled(deco["tl"], corner_w, corner_h)
+    TR = _scaled(deco["tr"], corner_w, corner_h)
+    BL = _scaled(deco["bl"], corner_w, corner_h)
+    BR = _scaled(deco["br"], corner_w, corner_h)
 
     # 4 corners
-    dest.blit(TL, (rect.x, rect.y))
-    dest.blit(TR, (rect.right - corner_w, rect.y))
-    dest.blit(BL, (rect.x, rect.bottom - corner_h))
-    dest.blit(BR, (rect.right - corner_w, rect.bottom - corner_h))
+    seq = [
+        (TL, (rect.x, rect.y)),
+        (TR, (rect.right - corner_w, rect.y)),
+        (BL, (rect.x, rect.bottom - corner_h)),
+        (BR, (rect.right - corner_w, rect.bottom - corner_h)),
+    ]
 
     # inner spans
     inner_w = rect.w - 2 * corner_w
@@ -361,19 +457,20 @@ def draw_ornamental_frame(
 
     # top / bottom
     if inner_w > 0:
-        top = pygame.transform.smoothscale(deco["t"], (inner_w, band_h))
-        bottom = pygame.transform.smoothscale(deco["b"], (inner_w, band_h))
-        dest.blit(top, (rect.x + corner_w, rect.y))
-        dest.blit(bottom, (rect.x + corner_w, rect.bottom - band_h))
+        top = _scaled(deco["t"], inner_w, band_h)
+        bottom = _scaled(deco["b"], inner_w, band_h)
+        seq.append((top, (rect.x + corner_w, rect.y)))
+        seq.append((bottom, (rect.x + corner_w, rect.bottom - band_h)))
 
     # left / right
     if inner_h > 0:
-        left = pygame.transform.smoothscale(deco["l"], (band_w, inner_h))
-        right = pygame.transform.smoothscale(deco["r"], (band_w, inner_h))
-        dest.blit(left, (rect.x, rect.y + corner_h))
-        dest.blit(right, (rect.right - band_w, rect.y + corner_h))
+        left = _scaled(deco["l"], band_w, inner_h)
+        right = _scaled(deco["r"], band_w, inner_h)
+        seq.append((left, (rect.x, rect.y + corner_h)))
+        seq.append((right, (rect.right - band_w, rect.y + corner_h)))
 
-    dest.set_clip(prev_clip)
+    # Top and left bands only meet when both are thicker than the corners.
+    return seq, band_w > corner_w and band_h > corner_h
 
 
 
@@ -406,34 +503,37 @@ def draw_ornamental_frame_asym(
     inner_h = rect.h - th - bh
     inner_h = max(1, inner_h)
 
-    TL = pygame.transform.smoothscale(deco["tl"], (cw, th))
-    TR = pygame.transform.smoothscale(deco["tr"], (cw, th))
-    BL = pygame.transform.smoothscale(deco["bl"], (cw, bh))
-    BR = pygame.transform.smoothscale(deco["br"], (cw, bh))
+    TL = _scaled(deco["tl"], cw, th)
+    TR = _scaled(deco["tr"], cw, th)
+    BL = _scaled(deco["bl"], cw, bh)
+    BR = _scaled(deco["br"], cw, bh)
 
     prev_clip = dest.get_clip()
     dest.set_clip(rect)
 
     # corners
-    dest.blit(TL, (rect.x, rect.y))
-    dest.blit(TR, (rect.right - cw, rect.y))
-    dest.blit(BL, (rect.x, rect.bottom - bh))
-    dest.blit(BR, (rect.right - cw, rect.bottom - bh))
+    seq = [
+        (TL, (rect.x, rect.y)),
+        (TR, (rect.right - cw, rect.y)),
+        (BL, (rect.x, rect.bottom - bh)),
+        (BR, (rect.right - cw, rect.bottom - bh)),
+    ]
 
     # top / bottom bands
     if inner_w > 0:
-        T = pygame.transform.smoothscale(deco["t"], (inner_w, th))
-        dest.blit(T, (rect.x + cw, rect.y))
-        B = pygame.transform.smoothscale(deco["b"], (inner_w, bh))
-        dest.blit(B, (rect.x + cw, rect.bottom - bh))
+        T = _scaled(deco["t"], inner_w, th)
+        seq.append((T, (rect.x + cw, rect.y)))
+        B = _scaled(deco["b"], inner_w, bh)
+        seq.append((B, (rect.x + cw, rect.bottom - bh)))
 
     # left / right bands
     if inner_h > 0:
-        L = pygame.transform.smoothscale(deco["l"], (cw, inner_h))
-        dest.blit(L, (rect.x, rect.y + th))
-        R = pygame.transform.smoothscale(deco["r"], (cw, inner_h))
-        dest.blit(R, (rect.right - cw, rect.y + th))
+        L = _scaled(deco["l"], cw, inner_h)
+        seq.append((L, (rect.x, rect.y + th)))
+        R = _scaled(deco["r"], cw, inner_h)
+        seq.append((R, (rect.right - cw, rect.y + th)))
 
+    blit_batch(dest, seq)
     dest.set_clip(prev_clip)
 
 
@@ -456,12 +556,15 @@ def blit_cover(dest, img, dest_rect):
     # "Cover" means we overscale a bit so the image fills the whole rect.
     scale = max(dest_rect.w / iw, dest_rect.h / ih)
     w, h = int(iw * scale), int(ih * scale)
-    surf = pygame.transform.smoothscale(img, (w, h))
+    surf = _fast_scale(img, (w, h))
     # center crop into dest_rect
     x = dest_rect.x + (dest_rect.w - w) // 2
     y = dest_rect.y + (dest_rect.h - h) // 2
     dest.blit(surf, (x, y))
 
+# (source image, dest size, cover-scaled Surface) for parallax_cover.
+_BG_SCALED = None
+
 def parallax_cover(dest, img, dest_rect, t_sec, amp_px=8):
     """
     Gentle background drift to keep the screen alive.
@@ -470,28 +573,25 @@ def parallax_cover(dest, img, dest_rect, t_sec, amp_px=8):
     # Example tweak: set amp_px=0 to freeze the backdrop entirely.
     if not img:
         return
+    global _BG_SCALED
+    iw, ih = img.get_width(), img.get_height()
+    if iw == 0 or ih == 0:
+        return
+    # The drift only moves the rect, never resizes it, so the cover-scaled
+    # backdrop is built once per (image, size) and each frame is a plain blit.
+    if _BG_SCALED is None or _BG_SCALED[0] is not img or _BG_SCALED[1] != dest_rect.size:
+        scale = max(dest_rect.w / iw, dest_rect.h / ih)
+        size = (int(iw * scale), int(ih * scale))
+        _BG_SCALED = (img, dest_rect.size, _fast_scale(img, size))
+    surf = _BG_SCALED[2]
     ox = int(amp_px * math.sin(t_sec * 0.15))
     # Different trig speeds creates a slow drifting loop.
     oy = int(amp_px * math.cos(t_sec * 0.10))
-    moved = dest_rect.move(ox, oy)
-    blit_cover(dest, img, moved)
-
-def tint_surface(src, color=(255,255,255), alpha=255):
-    """Multiply/tint an image and apply overall alpha."""
-    if not src:
-        return None
-    surf = src.copy()
-    r,g,b = color
-    tint = pygame.Surface(surf.get_size(), pygame.SRCALPHA)
-    tint.fill((r, g, b, 0))
-    surf.blit(tint, (0,0), special_flags=pygame.BLEND_RGBA_MULT)
-    if alpha != 255:
-        surf2 = pygame.Surface(surf.get_size(), pygame.SRCALPHA)
-        surf2.blit(surf, (0,0))
-        surf2.set_alpha(alpha)
-        return surf2
-    # Returning the tinted copy keeps the original surface untouched.
-    return surf
+    # Same placement as blit_cover(dest, img, dest_rect.move(ox, oy)).
+    dest.blit(surf, (
+        dest_rect.x + ox + (dest_rect.w - surf.get_width()) // 2,
+        dest_rect.y + oy + (dest_rect.h - surf.get_height()) // 2,
+    ))
 
 def slice9(img, pad=NINE_PAD):
     """
@@ -525,17 +625,24 @@ def slice9(img, pad=NINE_PAD):
     # Center trims padding on all sides
     c = clamp_rect(cw + pad, ch + pad, cw - 2 * pad, ch - 2 * pad)
 
+    # Opaque atlases get opaque patches: no per-pixel alpha means every later
+    # blit of the scaled patches takes the plain copy path instead of blending.
+    has_alpha = bool(img.get_flags() & pygame.SRCALPHA)
     out = {}
     for key, rect in (("tl", tl), ("t", t), ("tr", tr),
                       ("l", l), ("c", c), ("r", r),
                       ("bl", bl), ("b", b), ("br", br)):
         # We draw each patch into its own surface so scaling later is cleaner.
-        patch = pygame.Surface((rect.w, rect.h), pygame.SRCALPHA)
+        # Converting matches the display format so scaled copies blit fast.
+        if has_alpha:
+            patch = pygame.Surface((rect.w, rect.h), pygame.SRCALPHA).convert_alpha()
+        else:
+            patch = pygame.Surface((rect.w, rect.h)).convert()
         patch.blit(img, (0, 0), rect)
         out[key] = patch
     return out
 
-def draw_9slice(dest, rect, s9, *, fill_center=True):
+def draw_9slice(dest, rect, s9, *, fill_center=True, special_flags=0):
     """Draw nine-slice frame; optionally skip filling the center."""
     if not s9:
         pygame.draw.rect(dest, (22, 22, 28), rect, border_radius=10)
@@ -557,54 +664,85 @@ def draw_9slice(dest, rect, s9, *, fill_center=True):
 
     # Scale corners to fit desired border thickness
     # Using smoothscale keeps the stone corners crisp when resized.
-    TL = pygame.transform.smoothscale(tl, (bw, bw))
-    TR = pygame.transform.smoothscale(tr, (bw, bw))
-    BL = pygame.transform.smoothscale(bl, (bw, bw))
-    BR = pygame.transform.smoothscale(br, (bw, bw))
-
-    dest.blit(TL, (rect.x, rect.y))
-    dest.blit(TR, (rect.right - bw, rect.y))
-    dest.blit(BL, (rect.x, rect.bottom - bw))
-    dest.blit(BR, (rect.right - bw, rect.bottom - bw))
+    TL = _scaled(tl, bw, bw)
+    TR = _scaled(tr, bw, bw)
+    BL = _scaled(bl, bw, bw)
+    BR = _scaled(br, bw, bw)
+
+    seq = [
+        (TL, (rect.x, rect.y)),
+        (TR, (rect.right - bw, rect.y)),
+        (BL, (rect.x, rect.bottom - bw)),
+        (BR, (rect.right - bw, rect.bottom - bw)),
+    ]
 
     top_w = rect.w - 2 * bw
     side_h = rect.h - 2 * bw
     center_w = rect.w - 2 * bw
     center_h = rect.h - 2 * bw
 
-    T = pygame.transform.smoothscale(t, (top_w, bw)) if top_w > 0 else None
-    B = pygame.transform.smoothscale(b, (top_w, bw)) if top_w > 0 else None
-    L = pygame.transform.smoothscale(l, (bw, side_h)) if side_h > 0 else None
-    R = pygame.transform.smoothscale(r, (bw, side_h)) if side_h > 0 else None
+    T = _scaled(t, top_w, bw) if top_w > 0 else None
+    B = _scaled(b, top_w, bw) if top_w > 0 else None
+    L = _scaled(l, bw, side_h) if side_h > 0 else None
+    R = _scaled(r, bw, side_h) if side_h > 0 else None
 
     if T:
-        dest.blit(T, (rect.x + bw, rect.y))
+        seq.append((T, (rect.x + bw, rect.y)))
     if B:
-        dest.blit(B, (rect.x + bw, rect.bottom - bw))
+        seq.append((B, (rect.x + bw, rect.bottom - bw)))
     if L:
-        dest.blit(L, (rect.x, rect.y + bw))
+        seq.append((L, (rect.x, rect.y + bw)))
     if R:
-        dest.blit(R, (rect.right - bw, rect.y + bw))
+        seq.append((R, (rect.right - bw, rect.y + bw)))
 
     if fill_center and center_w > 0 and center_h > 0:
-        C = pygame.transform.smoothscale(c, (center_w, center_h))
-        dest.blit(C, (rect.x + bw, rect.y + bw))
+        C = _scaled(c, center_w, center_h)
+        seq.append((C, (rect.x + bw, rect.y + bw)))
+    # All nine patches go out in one batched call.
+    blit_batch(dest, seq, special_flags)
     # Example: draw_9slice(surface, rect, NINE9, fill_center=False) to draw a hollow border.
 
 # -----------------------------------------------------------------------------
 # TEXT/RENDER HELPERS
 # -----------------------------------------------------------------------------
 def add_console(text):
+    global _CONSOLE_TOTAL
     if not text:
         return
-    for line in text.split("\n"):
-        # Strip trailing spaces so the console looks tidy.
-        _CONSOLE.append(line.rstrip())
-    if len(_CONSOLE) > _MAX_CONSOLE_LINES:
-        del _CONSOLE[:len(_CONSOLE)-_MAX_CONSOLE_LINES]
+    lines = text.split("\n")
+    with _CONSOLE_LOCK:
+        for line in lines:
+            # Strip trailing spaces so the console looks tidy.
+            _CONSOLE.append(line.rstrip())
+        _CONSOLE_TOTAL += len(lines)
     # Example: call add_console("Debug: number is 7") to print in-game.
 
+# Advance width per font, probed once. Menlo is monospaced, so this turns a
+# pixel width into a column count for wrap_text.
+_FONT_ADV = {}
+
+def _char_w(font):
+    adv = _FONT_ADV.get(font)
+    if adv is None:
+        adv = _FONT_ADV[font] = max(1, font.size("M")[0])
+    return adv
+
+def _cols(font, width_px, pad=16, minimum=20):
+    """How many characters of `font` fit in width_px minus pad (at least `minimum`)."""
+    return max(minimum, (width_px - pad) // _char_w(font))
+
 def wrap_text(text, width_chars=90):
+    """Wrapped lines as a tuple; callers only iterate or index it."""
+    # Fast path: most console lines are one short line already. textwrap would
+    # only strip it (tabs and other control whitespace still take the full path).
+    if len(text) <= width_chars and text.isprintable():
+        return (text.strip(),)
+    # Panels re-wrap the same goal/situation text every frame; the cached tuple
+    # is handed out as-is, so a hit costs no copy either.
+    return _wrap_cached(text, width_chars)
+
+@lru_cache(maxsize=4096)
+def _wrap_cached(text, width_chars):
     lines = []
     for para in text.split("\n"):
         para = para.strip()
@@ -612,29 +750,130 @@ def wrap_text(text, width_chars=90):
             lines.append("")
             continue
         lines.extend(textwrap.wrap(para, width=width_chars))
-    return lines
+    return tuple(lines)
 
 def draw_text(surface, text, x, y, color=C_TEXT, font=None):
     font = font or FONT_MAIN
-    s = font.render(text, True, color)
+    s = render_text(font, text, color)
     surface.blit(s, (x, y))
     # Returning width/height lets callers stack lines without re-measuring.
     return s.get_width(), s.get_height()
 
-def button(surface, rect, label, hotkey=None, active=True, mouse_pos=None):
-    hovered = rect.collidepoint(mouse_pos) if mouse_pos else False
+# Printable ASCII glyph atlases keyed by (font, color): (atlas, {char: glyph}, advance).
+# Each glyph is a subsurface of the atlas, so a line is a list of plain
+# (source, dest) pairs that fblits can take.
+# The console font is monospaced, so a line is just one blit per character
+# out of one pre-rendered strip; no FreeType work for brand-new log lines.
+_GLYPH_ATLASES = {}
+_ATLAS_CHARS = "".join(chr(c) for c in range(32, 127))
+
+def _glyph_atlas(font, color):
+    key = (font, color)
+    atlas = _GLYPH_ATLASES.get(key)
+    if atlas is not None:
+        return atlas
+    adv = _char_w(font)
+    if any(font.size(ch)[0] != adv for ch in "il W.@"):
+        # Proportional font: whole-string rendering is the only faithful path.
+        _GLYPH_ATLASES[key] = False
+        return False
+    glyphs = [font.render(ch, True, color) for ch in _ATLAS_CHARS]
+    slot = max(g.get_width() for g in glyphs)
+    strip = pygame.Surface((slot * len(glyphs), font.get_height()), pygame.SRCALPHA).convert_alpha()
+    views = {}
+    for i, (ch, g) in enumerate(zip(_ATLAS_CHARS, glyphs)):
+        strip.blit(g, (i * slot, 0))
+        views[ch] = strip.subsurface(pygame.Rect(i * slot, 0, g.get_width(), g.get_height()))
+    atlas = (strip, views, adv)
+    _GLYPH_ATLASES[key] = atlas
+    return atlas
+
+def blit_batch(surface, seq, special_flags=0):
+    """Blit a list of (source, dest) pairs in one C call."""
+    if not seq:
+        return
+    # pygame-ce has fblits; classic pygame only offers blits().
+    fblits = getattr(surface, "fblits", None)
+    if fblits is not None:
+        fblits(seq, special_flags)
+    elif special_flags:
+        surface.blits([(src, dest, None, special_flags) for src, dest in seq], doreturn=0)
+    else:
+        surface.blits(seq, doreturn=0)
+
+def _atlas_blits(seq, text, x, y, color, font):
+    """Append the blits for one line to seq; glyph by glyph when the atlas allows."""
+    atlas = _glyph_atlas(font, color)
+    if not atlas or not text.isascii() or not text.isprintable():
+        seq.append((render_text(font, text, color), (x, y)))
+        return
+    _, views, adv = atlas
+    seq.extend((views[ch], (x + i * adv, y)) for i, ch in enumerate(text) if ch != " ")
+
+def draw_text_atlas(surface, text, x, y, color=C_TEXT, font=None):
+    """draw_text() for monospaced ASCII lines, blitted glyph by glyph from an atlas."""
+    font = font or FONT_MAIN
+    atlas = _glyph_atlas(font, color)
+    if not atlas or not text.isascii() or not text.isprintable():
+        return draw_text(surface, text, x, y, color, font)
+    seq = []
+    _atlas_blits(seq, text, x, y, color, font)
+    blit_batch(surface, seq)
+    return atlas[2] * len(text), atlas[0].get_height()
+
+# Pre-rendered button faces keyed by (label, hotkey, hovered, active, w, h, font).
+# Menus redraw the same few buttons every frame, so each state is built once.
+_BTN_CACHE = OrderedDict()
+_BTN_CACHE_MAX = 64
+
+def _button_face(label, hotkey, hovered, active, w, h):
+    key = (label, hotkey, hovered, active, w, h, FONT_MAIN)
+    face = _BTN_CACHE.get(key)
+    if face is not None:
+        _BTN_CACHE.move_to_end(key)
+        return face
+    face = pygame.Surface((w, h), pygame.SRCALPHA).convert_alpha()
     # subtle hover by drawing a faint strip
     if hovered:
-        pygame.draw.rect(surface, (50, 50, 58, 80), rect, border_radius=6)
+        pygame.draw.rect(face, (50, 50, 58, 80), face.get_rect(), border_radius=6)
     txt = f"{label}" if hotkey is None else f"[{hotkey}] {label}"
-    draw_text(surface, txt, rect.x+10, rect.y+6, C_TEXT if active else C_MUTED, FONT_MAIN)
+    draw_text(face, txt, 10, 6, C_TEXT if active else C_MUTED, FONT_MAIN)
+    _BTN_CACHE[key] = face
+    if len(_BTN_CACHE) > _BTN_CACHE_MAX:
+        _BTN_CACHE.popitem(last=False)
+    return face
+
+def button(surface, rect, label, hotkey=None, active=True, mouse_pos=None):
+    hovered = rect.collidepoint(mouse_pos) if mouse_pos else False
+    surface.blit(_button_face(label, hotkey, hovered, active, rect.w, rect.h), rect.topleft)
     return hovered
     # Idea: add a pygame.mixer.Sound.play() here if you want hover sound FX.
 
+# Baked panel backgrounds: (id(NINE9), w, h) -> (NINE9, Surface). The layout
+# only uses a handful of panel sizes, so each is composed once and then drawn
+# with a single blit instead of nine scaled patches.
+_PANEL_CACHE = OrderedDict()
+_PANEL_CACHE_MAX = 32
+
+def _baked_panel(w, h):
+    key = (id(NINE9), w, h)
+    hit = _PANEL_CACHE.get(key)
+    if hit is not None and hit[0] is NINE9:
+        _PANEL_CACHE.move_to_end(key)
+        return hit[1]
+    surf = pygame.Surface((w, h), pygame.SRCALPHA).convert_alpha()
+    # The patches never overlap, so MAX onto the empty surface copies them
+    # verbatim (a normal blit would premultiply their soft edges).
+    draw_9slice(surf, surf.get_rect(), NINE9, fill_center=True, special_flags=pygame.BLEND_RGBA_MAX)
+    _PANEL_CACHE[key] = (NINE9, surf)
+    if len(_PANEL_CACHE) > _PANEL_CACHE_MAX:
+        _PANEL_CACHE.popitem(last=False)
+    return surf
+
 def draw_panel(surface, rect):
     """Stone frame panel via nine-slice atlas (filled variant)."""
-    draw_9slice(surface, rect, NINE9, fill_center=True)
-    # To experiment with transparent panels, flip fill_center to False here.
+    surface.blit(_baked_panel(rect.w, rect.h), rect.topleft)
+    # To experiment with transparent panels, flip fill_center to False in _baked_panel.
 
 def draw_vertical_scrollbar(surface, container_rect, content_height, scroll, *, margin=8):
     """Render a slim scrollbar when content exceeds the view."""
@@ -668,7 +907,7 @@ def blit_decor_frame_stretched(dest, frame_img, target_rect):
     """
     if not frame_img:
         return
-    scaled = pygame.transform.smoothscale(frame_img, (target_rect.w, target_rect.h))
+    scaled = _scaled(frame_img, target_rect.w, target_rect.h)
     dest.blit(scaled, target_rect.topleft)
 
 
@@ -688,7 +927,7 @@ def blit_decor_frame_cover(dest, frame_img, target_rect):
     scale = max(target_rect.w / fw, target_rect.h / fh)
     new_w = int(fw * scale)
     new_h = int(fh * scale)
-    scaled = pygame.transform.smoothscale(frame_img, (new_w, new_h))
+    scaled = _scaled(frame_img, new_w, new_h)
 
     draw_x = target_rect.x + (target_rect.w - new_w) // 2
     draw_y = target_rect.y + (target_rect.h - new_h) // 2
@@ -715,7 +954,7 @@ def blit_decor_frame_fitted(dest, frame_img, target_rect):
     scale = min(target_rect.w / fw, target_rect.h / fh)
     new_w = int(fw * scale)
     new_h = int(fh * scale)
-    scaled = pygame.transform.smoothscale(frame_img, (new_w, new_h))
+    scaled = _scaled(frame_img, new_w, new_h)
     draw_x = target_rect.x + (target_rect.w - new_w) // 2
     draw_y = target_rect.y + (target_rect.h - new_h) // 2
     prev_clip = dest.get_clip()
@@ -726,20 +965,126 @@ def blit_decor_frame_fitted(dest, frame_img, target_rect):
 
 
 
+# Finished load_image_or_fill cards keyed by (path, W, H) -> (mtime, surface).
+# Portraits and the scene image are redrawn every frame; this way each one
+# is read and smoothscaled once, and again only when the file changes.
+_IMG_CACHE = OrderedDict()
+_IMG_CACHE_MAX = 128
+
 def load_image_or_fill(path, size):
     """Load an image and center it, never upscaling above requested size."""
     W, H = size
-    surf = pygame.Surface((W, H), pygame.SRCALPHA)
+    try:
+        mtime = os.path.getmtime(path) if path else None
+    except OSError:
+        mtime = None
+    key = (path, W, H)
+    hit = _IMG_CACHE.get(key)
+    if hit is not None and hit[0] == mtime:
+        _IMG_CACHE.move_to_end(key)
+        return hit[1]
+    surf = _build_image_card(path, W, H, mtime)
+    _IMG_CACHE[key] = (mtime, surf)
+    if len(_IMG_CACHE) > _IMG_CACHE_MAX:
+        _IMG_CACHE.popitem(last=False)
+    # Callers only blit the card; draw on a .copy() if you need to modify it.
+    return surf
+
+# Actor portrait cards keyed by (path, W, H) -> (mtime, surface). A portrait
+# can be regenerated in place (Character_Registry.update_character_portrait
+# copies over <folder>/portrait.<ext>), so the file is still checked, but at
+# most once per PORTRAIT_RECHECK_S per path: a card loop over every visible
+# actor is a dict lookup per card, and a new portrait shows up within a second.
+_PORTRAIT_CACHE = OrderedDict()
+_PORTRAIT_CACHE_MAX = 64
+_PORTRAIT_MTIMES = {}  # path -> (checked_at, mtime)
+PORTRAIT_RECHECK_S = 1.0
+
+def _portrait_mtime(path):
+    """The portrait file's mtime (None if missing), stat()ed at most once a second."""
+    if not path:
+        return None
+    now = time.monotonic()
+    hit = _PORTRAIT_MTIMES.get(path)
+    if hit is not None and now - hit[0] < PORTRAIT_RECHECK_S:
+        return hit[1]
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        mtime = None
+    if len(_PORTRAIT_MTIMES) > 4 * _PORTRAIT_CACHE_MAX:
+        _PORTRAIT_MTIMES.clear()
+    _PORTRAIT_MTIMES[path] = (now, mtime)
+    return mtime
+
+def get_portrait_scaled(path, size):
+    """load_image_or_fill() for actor portraits, with a throttled file check."""
+    key = (path, size[0], size[1])
+    mtime = _portrait_mtime(path)
+    hit = _PORTRAIT_CACHE.get(key)
+    if hit is not None and hit[0] == mtime:
+        _PORTRAIT_CACHE.move_to_end(key)
+        return hit[1]
+    surf = load_image_or_fill(path, size)
+    _PORTRAIT_CACHE[key] = (mtime, surf)
+    if len(_PORTRAIT_CACHE) > _PORTRAIT_CACHE_MAX:
+        _PORTRAIT_CACHE.popitem(last=False)
+    return surf
+
+def _draw_actor_cards(dest, cards, base_y, cols, card_w, card_h, gap, portrait_side, line_h,
+                      frame_pad=0, frame_border=28):
+    """Draw a grid of (actor, stats_line) cards onto dest.
+
+    Cards never overlap, so the grid is drawn layer by layer (backgrounds,
+    portraits, frames, text) and the portrait and text layers each go out in
+    one blit_batch() call instead of a blit per card per line.
+    """
+    portraits = []
+    texts = []
+    frames = []
+    for idx, (actor, stats_line) in enumerate(cards):
+        card = pygame.Rect(
+            (idx % cols) * (card_w + gap),
+            base_y + (idx // cols) * (card_h + gap),
+            card_w,
+            card_h,
+        )
+        pygame.draw.rect(dest, (34, 36, 44, 230), card, border_radius=12)
+        portrait_rect = pygame.Rect(card.x + 8, card.y + 8, portrait_side, portrait_side)
+        portrait = get_portrait_scaled(getattr(actor, "portrait_path", None), (portrait_side, portrait_side))
+        portraits.append((
+            portrait,
+            (
+                portrait_rect.x + (portrait_rect.w - portrait.get_width()) // 2,
+                portrait_rect.y + (portrait_rect.h - portrait.get_height()) // 2,
+            ),
+        ))
+        frames.append(portrait_rect.inflate(frame_pad, frame_pad))
+        text_y = portrait_rect.bottom + 6
+        texts.append((render_text(FONT_THIN, getattr(actor, "name", "Unknown"), C_TEXT), (card.x + 10, text_y)))
+        if stats_line:
+            texts.append((render_text(FONT_THIN, stats_line, C_MUTED), (card.x + 10, text_y + line_h)))
+    blit_batch(dest, portraits)
+    for frame_rect in frames:
+        draw_image_frame(dest, frame_rect, border=frame_border)
+    blit_batch(dest, texts)
+
+def _build_image_card(path, W, H, mtime):
+    # The card is fully opaque, so a display-format surface (no per-pixel
+    # alpha) blits on the fast path.
+    surf = pygame.Surface((W, H)).convert()
     # Dark placeholder with a subtle border so empty slots still look framed.
     # Tweak the fill color here if you prefer a brighter standby card.
     surf.fill((8, 8, 10))
     pygame.draw.rect(surf, (40, 40, 48), surf.get_rect(), 2, border_radius=8)
-    if not (path and os.path.exists(path)):
+    if mtime is None:
         draw_text(surf, "No image", 12, 8, C_MUTED, FONT_THIN)
         return surf
     try:
         # pygame handles JPG/PNG fine; convert() drops alpha for faster blits.
-        raw = pygame.image.load(path).convert()
+        # Fresh downloads were already decoded by the worker.
+        raw = _decoded_download(path, mtime) or _decode_for_card(path, W, H)
+        raw = raw.convert()
     except Exception:
         draw_text(surf, "Image load error", 12, 8, C_MUTED, FONT_THIN)
         return surf
@@ -751,37 +1096,126 @@ def load_image_or_fill(path, size):
     # If you want the art to hug the bottom instead, change the blit y-offset.
     return surf
 
+def _decode_for_card(path, W, H):
+    """Decode path for a W x H card; JPEGs much larger than the card decode scaled down."""
+    if Image is not None:
+        try:
+            with Image.open(path) as im:
+                # Image.open only reads the header; draft() then asks the JPEG
+                # decoder for a 1/2, 1/4 or 1/8 scale image no smaller than the card.
+                if im.format == "JPEG" and (im.width >= 2 * W or im.height >= 2 * H):
+                    im.draft("RGB", (W, H))
+                    im = im.convert("RGB")
+                    return pygame.image.frombuffer(im.tobytes(), im.size, "RGB")
+        except Exception:
+            pass
+    return pygame.image.load(path)
+
 # -----------------------------------------------------------------------------
 # Image fetching (UI side)
 # -----------------------------------------------------------------------------
+# Recent downloads decoded on the worker thread right after they land:
+# path -> (mtime, Surface). _build_image_card uses them instead of decoding
+# on the UI thread; the file stays as the on-disk cache.
+_DECODED = OrderedDict()
+_DECODED_MAX = 16
+_DECODED_LOCK = Lock()
+
+def _remember_download(out_path):
+    # Worker thread: decoding here keeps JPEG work off the UI thread too.
+    # The file was just written, so this read comes straight from the page cache.
+    try:
+        surf = pygame.image.load(out_path)
+        mtime = os.path.getmtime(out_path)
+    except Exception:
+        return
+    with _DECODED_LOCK:
+        _DECODED[out_path] = (mtime, surf)
+        if len(_DECODED) > _DECODED_MAX:
+            _DECODED.popitem(last=False)
+
+def _decoded_download(path, mtime):
+    with _DECODED_LOCK:
+        hit = _DECODED.get(path)
+    if hit is not None and hit[0] == mtime:
+        return hit[1]
+    return None
+
+# SSL contexts are built on first download and then shared; loading the CA
+# bundle (certifi's is ~350 KB of PEM) on every image was pure overhead.
+_SSL_CTX = None
+_SSL_CTX_UNVERIFIED = None
+
+def _ssl_context(verified=True):
+    global _SSL_CTX, _SSL_CTX_UNVERIFIED
+    if verified:
+        if _SSL_CTX is None:
+            if certifi:
+                _SSL_CTX = ssl.create_default_context(cafile=certifi.where())
+            else:
+                _SSL_CTX = ssl.create_default_context()
+        return _SSL_CTX
+    if _SSL_CTX_UNVERIFIED is None:
+        _SSL_CTX_UNVERIFIED = ssl._create_unverified_context()
+    return _SSL_CTX_UNVERIFIED
+
+# Refuse responses that announce more than this; generated JPEGs are far smaller.
+MAX_IMAGE_BYTES = 20 * 1024 * 1024
+
+class _ImageTooLarge(ValueError):
+    """The server announced an image bigger than MAX_IMAGE_BYTES."""
+
+def _fetch_to(req, out_path, timeout, ctx):
+    # Download next to the target and rename on success, so a failed or
+    # interrupted transfer never leaves a truncated .jpg in ui_images/.
+    tmp_path = f"{out_path}.part"
+    try:
+        with request.urlopen(req, timeout=timeout, context=ctx) as resp:
+            size = resp.headers.get("Content-Length")
+            if size and size.isdigit() and int(size) > MAX_IMAGE_BYTES:
+                raise _ImageTooLarge(f"image too large ({int(size)} bytes)")
+            # Stream in 64 KB chunks so the payload is never held in memory whole.
+            with open(tmp_path, "wb") as f:
+                shutil.copyfileobj(resp, f, 64 * 1024)
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    _remember_download(out_path)
+
 def _dl(url, out_path, timeout=35):
     req = request.Request(url, headers={"User-Agent": "RP-GPT-UI/1.0"})
     try:
-        if certifi:
-            ctx = ssl.create_default_context(cafile=certifi.where())
-        else:
-            ctx = ssl.create_default_context()
         # First pass: use verified SSL to keep things secure.
-        with request.urlopen(req, timeout=timeout, context=ctx) as resp, open(out_path, "wb") as f:
-            f.write(resp.read())
+        _fetch_to(req, out_path, timeout, _ssl_context())
         return True
+    except _ImageTooLarge as e:
+        # The server answered fine; retrying insecurely would fetch the same
+        # oversized payload again.
+        add_console(f"[Image] Download refused: {e}")
+        return False
     except Exception as e1:
         try:
-            ctx = ssl._create_unverified_context()
             # Second pass: fall back to an insecure context so dev boxes without
             # a full certificate store can still download the image.
-            with request.urlopen(req, timeout=timeout, context=ctx) as resp, open(out_path, "wb") as f:
-                f.write(resp.read())
+            _fetch_to(req, out_path, timeout, _ssl_context(verified=False))
             return True
         except Exception as e2:
             add_console(f"[Image] Download failed: {e1} / {e2}")
             return False
     # Tip: bump timeout to 60 if your image server is slow.
 
+# How many images may download at once (portrait, scene and NPC art often
+# queue together at act start). Downloads wait on the network, not the GIL.
+IMAGE_WORKERS = 4
+
 def _img_path(kind, act, turn):
-    ts = int(time.time()*1000)
-    fname = f"{kind}_A{act}_T{turn}_{ts}.jpg"
-    return os.path.join(IMG_DIR, fname)
+    # Integer nanoseconds -> milliseconds; same wall-clock stamp, no float math.
+    ts = time.time_ns() // 1_000_000
+    return f"{_IMG_DIR_PREFIX}{kind}_A{act}_T{turn}_{ts}.jpg"
     # Example output: player_portrait_A1_T3_1700000000000.jpg
 
 def fetch_image_for_event(evt):
@@ -892,22 +1326,120 @@ def layout_regions():  # returns (scene, situation, options, middle, right)
 
     return scene, sit, options, middle, right
 
+# Off-screen scroll surfaces keyed by panel name. Each scrolling list draws its
+# whole content onto one of these; keeping them around avoids allocating and
+# zero-filling a multi-megabyte SRCALPHA surface per panel per frame.
+_SCROLL_SURFACES = {}
+
+def _scroll_surface(name, w, h):
+    """A cleared (w, h) SRCALPHA surface for panel `name`, reused across frames."""
+    base = _SCROLL_SURFACES.get(name)
+    if base is None or base.get_width() < w or base.get_height() < h:
+        # Grow the height geometrically so a list that gains a row every turn
+        # doesn't reallocate every turn.
+        cap_w = w if base is None else max(w, base.get_width())
+        cap_h = h if base is None else max(h, base.get_height() * 2)
+        base = pygame.Surface((cap_w, cap_h), pygame.SRCALPHA)
+        _SCROLL_SURFACES[name] = base
+        return base.subsurface((0, 0, w, h))
+    view = base.subsurface((0, 0, w, h))
+    # Only the band this frame uses needs clearing.
+    view.fill((0, 0, 0, 0))
+    return view
+
+# The actor buckets shown in the status column, entities panel and sheet:
+# (key, {panel: (companions, characters, enemies)}). Every place that adds,
+# removes or kills an actor either appends to or reassigns state.act.actors /
+# state.companions, so the key holds those lists themselves plus their
+# lengths; turns_taken rebuilds once a turn as a safety net for in-place flag
+# flips. Draw code then reads ready-made lists instead of re-filtering per frame.
+_ACTOR_BUCKETS = None
+
+def _actor_buckets(state, panel="status"):
+    """(companions, characters, enemies) for the current act; treat as read-only.
+
+    The panels filter slightly differently: "status" leaves out anyone whose
+    role is "companion", while "entities" leaves out members of
+    state.companions (so a companion-role actor outside the party still shows
+    under Characters In Area there).
+    """
+    global _ACTOR_BUCKETS
+    act = getattr(state, "act", None)
+    act_actors = getattr(act, "actors", None) or []
+    companions_src = getattr(state, "companions", None) or []
+    key = (act, act_actors, len(act_actors), companions_src, len(companions_src),
+           getattr(act, "turns_taken", 0))
+    if _ACTOR_BUCKETS is not None:
+        old = _ACTOR_BUCKETS[0]
+        if (old[0] is key[0] and old[1] is key[1] and old[3] is key[3]
+                and old[2] == key[2] and old[4] == key[4] and old[5] == key[5]):
+            return _ACTOR_BUCKETS[1][panel]
+    companions = [c for c in companions_src if getattr(c, "alive", True)]
+    comp_ids = {id(c) for c in companions}
+    characters, enemies = [], []
+    area_characters, area_enemies = [], []
+    for actor in act_actors:
+        if not getattr(actor, "alive", True) or not getattr(actor, "discovered", True):
+            continue
+        role = getattr(actor, "role", "npc")
+        if role == "enemy":
+            enemies.append(actor)
+        elif role != "companion":
+            characters.append(actor)
+        if id(actor) not in comp_ids:
+            (area_enemies if role == "enemy" else area_characters).append(actor)
+    _ACTOR_BUCKETS = (key, {
+        "status": (companions, characters, enemies),
+        "entities": (companions, area_characters, area_enemies),
+    })
+    return _ACTOR_BUCKETS[1][panel]
+
 # -----------------------------------------------------------------------------
 # RIGHT PANEL: Status + Console (player summary + scrollable lists + console)
 # -----------------------------------------------------------------------------
-def draw_status_and_console(surface, rect, state, portrait_path=None, *, hotspots=None, mouse_vpos=None, show_sheet=False, scroll=0, regions=None):
-    # This column shows high-level progress plus the running console log.
-    # If you only want text logs, skip the stat sections inside the function.
-    draw_panel(surface, rect)
+@lru_cache(maxsize=8)
+def _status_layout(x, y, w, h):
+    """(inner, list_rect, console_rect) for the right panel; callers must not mutate them."""
+    rect = pygame.Rect(x, y, w, h)
     inner = rect.inflate(-24, -24)
-    if inner.w <= 0 or inner.h <= 0:
-        return 0
-
     lists_y = inner.y
     scroll_area_h = inner.bottom - lists_y - 140
     scroll_area_h = max(160, scroll_area_h)
     # Raise the 140 padding above to leave more space for the console box.
     list_rect = pygame.Rect(inner.x, lists_y, inner.w, scroll_area_h)
+    console_top = list_rect.bottom + 16
+    console_rect = pygame.Rect(inner.x, console_top, inner.w, rect.bottom - console_top - 16)
+    return inner, list_rect, console_rect
+
+# Rendered scroll-list content per panel: name -> (key, Surface, content height).
+# The key covers everything the list shows, so an unchanged list is one tuple
+# compare and a blit instead of a full text/grid redraw every frame.
+_PANEL_CONTENT = {}
+
+def _actor_stats(actors):
+    """The per-actor fields a card shows, for content keys."""
+    return tuple(
+        (a, getattr(a, "name", None), getattr(a, "hp", None), getattr(a, "attack", None),
+         getattr(a, "disposition", None), getattr(a, "portrait_path", None),
+         _portrait_mtime(getattr(a, "portrait_path", None)))
+        for a in actors
+    )
+
+def _status_content(state, list_rect):
+    """(scroll surface, content height) for the status list, redrawn only on change."""
+    companions, characters, enemies = _actor_buckets(state)
+    inventory = tuple(getattr(state.player, "inventory", []))
+    act = state.act
+    key = (
+        state, list_rect.w, list_rect.h, FONT_MAIN, FONT_THIN,
+        act.index, state.act_count, act.turns_taken, act.turn_cap, act.goal_progress,
+        state.pressure_name, state.pressure, state.blueprint,
+        _actor_stats(companions), _actor_stats(characters), _actor_stats(enemies), inventory,
+    )
+    cached = _PANEL_CONTENT.get("status")
+    if cached is not None and cached[0] == key:
+        return cached[1], cached[2]
+
     entries = []
     sy = 0
 
@@ -947,24 +1479,18 @@ def draw_status_and_console(surface, rect, state, portrait_path=None, *, hotspot
 
     plan = state.blueprint.acts[state.act.index]
     push("Campaign:", color=C_MUTED, spacing=20)
-    push_wrap(state.blueprint.campaign_goal, max(28, list_rect.w // 7), spacing=20)
+    push_wrap(state.blueprint.campaign_goal, _cols(FONT_THIN, list_rect.w, pad=0, minimum=28), spacing=20)
 
     sy += 10
     push("This Act Goal:", color=C_MUTED, spacing=20)
-    push_wrap(plan.goal, max(28, list_rect.w // 7), spacing=20)
+    push_wrap(plan.goal, _cols(FONT_THIN, list_rect.w, pad=0, minimum=28), spacing=20)
 
     sy += 16
     sections = [
-        ("Companions", [c for c in state.companions if getattr(c, "alive", True)]),
-        ("Characters In Area", [
-            a for a in getattr(state.act, "actors", [])
-            if getattr(a, "alive", True) and getattr(a, "discovered", True) and a.role not in ("companion", "enemy")
-        ]),
-        ("Enemies In Area", [
-            a for a in getattr(state.act, "actors", [])
-            if getattr(a, "alive", True) and getattr(a, "discovered", True) and a.role == "enemy"
-        ]),
-        ("Inventory", list(getattr(state.player, "inventory", []))),
+        ("Companions", companions),
+        ("Characters In Area", characters),
+        ("Enemies In Area", enemies),
+        ("Inventory", list(inventory)),
     ]
     line_h = max(18, int(FONT_THIN.get_height() * 1.1))
     for title, items in sections:
@@ -991,34 +1517,18 @@ def draw_status_and_console(surface, rect, state, portrait_path=None, *, hotspot
 
     content_h = max(sy + 12, list_rect.h)
     # Everything is drawn on a temporary surface so scrolling is painless.
-    scroll_surface = pygame.Surface((list_rect.w, content_h), pygame.SRCALPHA)
+    scroll_surface = _scroll_surface("status", list_rect.w, content_h)
+    # Text rows and actor grids never overlap, so all text goes out in one batch.
+    blit_batch(scroll_surface, [
+        (render_text(entry[2], entry[1], entry[3]), (0, entry[4]))
+        for entry in entries if entry[0] == "text"
+    ])
     for entry in entries:
         kind = entry[0]
-        if kind == "text":
-            _, text, font, color, y_pos = entry
-            draw_text(scroll_surface, text, 0, y_pos, color, font)
-        elif kind == "grid":
+        if kind == "grid":
             _, actors, base_y, cols, card_w, card_h, gap, portrait_side = entry
-            for idx, actor in enumerate(actors):
-                col = idx % cols
-                row = idx // cols
-                card_x = col * (card_w + gap)
-                card_y = base_y + row * (card_h + gap)
-                card = pygame.Rect(card_x, card_y, card_w, card_h)
-                pygame.draw.rect(scroll_surface, (34, 36, 44, 230), card, border_radius=12)
-                portrait_rect = pygame.Rect(card.x + 8, card.y + 8, portrait_side, portrait_side)
-                portrait = load_image_or_fill(getattr(actor, "portrait_path", None), (portrait_side, portrait_side))
-                scroll_surface.blit(
-                    portrait,
-                    (
-                        portrait_rect.x + (portrait_rect.w - portrait.get_width()) // 2,
-                        portrait_rect.y + (portrait_rect.h - portrait.get_height()) // 2,
-                    ),
-                )
-                draw_image_frame(scroll_surface, portrait_rect.inflate(10, 10), border=26)
-                text_y = portrait_rect.bottom + 6
-                draw_text(scroll_surface, getattr(actor, "name", "Unknown"), card.x + 10, text_y, C_TEXT, FONT_THIN)
-                text_y += line_h
+            cards = []
+            for actor in actors:
                 stats_bits = []
                 if hasattr(actor, "hp"):
                     stats_bits.append(f"HP {actor.hp}")
@@ -1027,9 +1537,21 @@ def draw_status_and_console(surface, rect, state, portrait_path=None, *, hotspot
                 if hasattr(actor, "disposition"):
                     stats_bits.append(f"DISP {actor.disposition}")
                 # Extend this list if your actor objects expose more fields.
-                if stats_bits:
-                    draw_text(scroll_surface, "  ".join(stats_bits), card.x + 10, text_y, C_MUTED, FONT_THIN)
+                cards.append((actor, "  ".join(stats_bits)))
+            _draw_actor_cards(scroll_surface, cards, base_y, cols, card_w, card_h, gap,
+                              portrait_side, line_h, frame_pad=10, frame_border=26)
+    _PANEL_CONTENT["status"] = (key, scroll_surface, sy)
+    return scroll_surface, sy
 
+def draw_status_and_console(surface, rect, state, portrait_path=None, *, hotspots=None, mouse_vpos=None, show_sheet=False, scroll=0, regions=None):
+    # This column shows high-level progress plus the running console log.
+    # If you only want text logs, skip the stat sections inside the function.
+    draw_panel(surface, rect)
+    inner, list_rect, console_rect = _status_layout(rect.x, rect.y, rect.w, rect.h)
+    if inner.w <= 0 or inner.h <= 0:
+        return 0
+    scroll_surface, sy = _status_content(state, list_rect)
+    content_h = max(sy + 12, list_rect.h)
     max_scroll = max(0, content_h - list_rect.h)
     scroll_value = max(0, min(scroll, max_scroll))
     if regions is not None:
@@ -1039,69 +1561,47 @@ def draw_status_and_console(surface, rect, state, portrait_path=None, *, hotspot
     surface.set_clip(None)
     draw_vertical_scrollbar(surface, list_rect, sy, scroll_value)
 
-    console_top = list_rect.bottom + 16
-    console_rect = pygame.Rect(inner.x, console_top, inner.w, rect.bottom - console_top - 16)
     if console_rect.h > 40:
         draw_panel(surface, console_rect)
         _draw_console(surface, console_rect)
     return scroll_value
 
+def _console_wrapped(max_cols):
+    """Wrapped console lines for this width, wrapping only entries added since last call."""
+    global _CONSOLE_WRAP_COLS, _CONSOLE_WRAP_SEEN
+    with _CONSOLE_LOCK:
+        if max_cols != _CONSOLE_WRAP_COLS:
+            _CONSOLE_WRAPPED.clear()
+            _CONSOLE_WRAP_COLS = max_cols
+            _CONSOLE_WRAP_SEEN = 0
+        new = _CONSOLE_TOTAL - _CONSOLE_WRAP_SEEN
+        if new:
+            # Reduce the 220 below if you want a shorter history, e.g. 120.
+            # Walk back from the newest entry so only the new lines are touched.
+            fresh = list(islice(reversed(_CONSOLE), min(new, 220)))
+            for line in reversed(fresh):
+                # Wrap long messages so they stay inside the frame.
+                _CONSOLE_WRAPPED.extend(wrap_text(line, width_chars=max_cols))
+            _CONSOLE_WRAP_SEEN = _CONSOLE_TOTAL
+    return _CONSOLE_WRAPPED
+
 def _draw_console(surface, rect):
     # Console shows the newest lines at the bottom like a chat window.
-    max_cols = max(20, (rect.w - 16) // 7)
-    # Reduce the slice below if you want a shorter history, e.g. [-120:].
-    wrapped = []
-    for line in _CONSOLE[-220:]:
-        # Wrap long messages so they stay inside the frame.
-        wrapped.extend(wrap_text(line, width_chars=max_cols))
+    max_cols = _cols(FONT_THIN, rect.w)
+    wrapped = _console_wrapped(max_cols)
     y = rect.y + 6
     line_h = max(16, int(FONT_THIN.get_height() * 1.0))
     vis = max(1, (rect.h - 10) // line_h)
-    for line in wrapped[-vis:]:
-        draw_text(surface, line, rect.x + 8, y, C_TEXT, FONT_THIN)
+    # Gather every visible glyph first so the whole console is one batched blit.
+    seq = []
+    # Only the UI thread touches the wrapped deque, so iterating it here is safe.
+    for line in islice(wrapped, max(0, len(wrapped) - vis), None):
+        _atlas_blits(seq, line, rect.x + 8, y, C_TEXT, FONT_THIN)
         y += line_h
+    blit_batch(surface, seq)
 
-def draw_world_entities_panel(surface, rect, state, scroll=0, *, regions=None):
-    # Middle column covers everyone nearby plus the player's inventory.
-    # Swap the section order below if you prefer enemies at the top.
-    draw_panel(surface, rect)
-    if regions is not None:
-        regions["mid_panel"] = rect.copy()
-
-    inner = rect.inflate(-24, -24)
-    inner = pygame.Rect(inner.x, inner.y, max(40, inner.w), max(40, inner.h))
-    view = pygame.Rect(inner.x, inner.y, inner.w, inner.h)
-    if view.w <= 0 or view.h <= 0:
-        return 0
-
-    # Split the actors into friendly, neutral, and hostile buckets.
-    companions = [c for c in getattr(state, "companions", []) if getattr(c, "alive", True)]
-    act = getattr(state, "act", None)
-    act_actors = list(getattr(act, "actors", [])) if act else []
-    comp_ids = {id(c) for c in companions}
-    characters = []
-    enemies = []
-    for actor in act_actors:
-        if id(actor) in comp_ids:
-            continue
-        if not getattr(actor, "alive", True):
-            continue
-        if not getattr(actor, "discovered", True):
-            continue
-        role = getattr(actor, "role", "npc")
-        if role == "enemy":
-            enemies.append(actor)
-        else:
-            characters.append(actor)
-
-    sections = [
-        ("Companions", companions),
-        ("Characters In Area", characters),
-        ("Enemies In Area", enemies),
-    ]
-    # Add extra tuples here if you invent new actor buckets.
-    inventory = list(getattr(getattr(state, "player", None), "inventory", []))
-
+def _entities_content(view, sections, inventory):
+    """(scroll surface, content bottom) for the world entities list."""
     cols = 3 if view.w > 0 else 1
     # Example tweak: lower cols to 2 for a chunkier card layout.
     gap = 12
@@ -1128,7 +1628,7 @@ def draw_world_entities_panel(surface, rect, state, scroll=0, *, regions=None):
     total_height += (max(1, len(inventory)) * line_h) + 12
 
     content_h = max(view.h, total_height + 12)
-    content = pygame.Surface((view.w, content_h), pygame.SRCALPHA)
+    content = _scroll_surface("entities", view.w, content_h)
     y = 0
 
     for title, grp in sections:
@@ -1138,31 +1638,14 @@ def draw_world_entities_panel(surface, rect, state, scroll=0, *, regions=None):
             draw_text(content, "(none)", 0, y, C_MUTED, FONT_THIN)
             y += line_h + spacer
             continue
-        for idx, actor in enumerate(grp):
-            col = idx % cols
-            row = idx // cols
-            card_x = col * (card_w + gap)
-            card_y = y + row * (card_h + gap)
-            card = pygame.Rect(card_x, card_y, card_w, card_h)
-            pygame.draw.rect(content, (34, 36, 44, 230), card, border_radius=12)
-            portrait_rect = pygame.Rect(card.x + 8, card.y + 8, portrait_side, portrait_side)
-            portrait = load_image_or_fill(getattr(actor, "portrait_path", None), (portrait_side, portrait_side))
-            content.blit(
-                portrait,
-                (
-                    portrait_rect.x + (portrait_rect.w - portrait.get_width()) // 2,
-                    portrait_rect.y + (portrait_rect.h - portrait.get_height()) // 2,
-                ),
-            )
-            draw_image_frame(content, portrait_rect, border=28)
-            text_y = portrait_rect.bottom + 6
-            draw_text(content, getattr(actor, "name", "Unknown"), card.x + 10, text_y, C_TEXT, FONT_THIN)
-            text_y += line_h
+        cards = []
+        for actor in grp:
             stats_line = f"HP {getattr(actor, 'hp', 0)}  ATK {getattr(actor, 'attack', 0)}"
             disp = getattr(actor, "disposition", None)
             if disp is not None:
                 stats_line += f"  DISP {disp}"
-            draw_text(content, stats_line, card.x + 10, text_y, C_MUTED, FONT_THIN)
+            cards.append((actor, stats_line))
+        _draw_actor_cards(content, cards, y, cols, card_w, card_h, gap, portrait_side, line_h)
         y += grid_height(len(grp)) + spacer
 
     draw_text(content, "Inventory", 0, y, C_ACCENT, FONT_MAIN)
@@ -1176,6 +1659,42 @@ def draw_world_entities_panel(surface, rect, state, scroll=0, *, regions=None):
         draw_text(content, "(empty)", 0, y, C_MUTED, FONT_THIN)
         y += line_h
     # You can insert crafting materials or currencies after this block.
+    return content, y
+
+def draw_world_entities_panel(surface, rect, state, scroll=0, *, regions=None):
+    # Middle column covers everyone nearby plus the player's inventory.
+    # Swap the section order below if you prefer enemies at the top.
+    draw_panel(surface, rect)
+    if regions is not None:
+        regions["mid_panel"] = rect.copy()
+
+    inner = rect.inflate(-24, -24)
+    inner = pygame.Rect(inner.x, inner.y, max(40, inner.w), max(40, inner.h))
+    view = pygame.Rect(inner.x, inner.y, inner.w, inner.h)
+    if view.w <= 0 or view.h <= 0:
+        return 0
+
+    # Split the actors into friendly, neutral, and hostile buckets.
+    companions, characters, enemies = _actor_buckets(state, "entities")
+
+    sections = [
+        ("Companions", companions),
+        ("Characters In Area", characters),
+        ("Enemies In Area", enemies),
+    ]
+    # Add extra tuples here if you invent new actor buckets.
+    inventory = list(getattr(getattr(state, "player", None), "inventory", []))
+
+    key = (
+        view.w, view.h, FONT_MAIN, FONT_THIN,
+        tuple((title, _actor_stats(grp)) for title, grp in sections), tuple(inventory),
+    )
+    cached = _PANEL_CONTENT.get("entities")
+    if cached is not None and cached[0] == key:
+        content, y = cached[1], cached[2]
+    else:
+        content, y = _entities_content(view, sections, inventory)
+        _PANEL_CONTENT["entities"] = (key, content, y)
 
     max_scroll = max(0, (y + 12) - view.h)
     scroll = max(0, min(scroll, max_scroll))
@@ -1189,15 +1708,20 @@ def draw_world_entities_panel(surface, rect, state, scroll=0, *, regions=None):
 # -----------------------------------------------------------------------------
 # Player Panel (middle column, player summary and quick actions)
 # -----------------------------------------------------------------------------
-def draw_player_panel(surface, rect, state, portrait_path=None, *, hotspots=None, mouse_vpos=None, show_sheet=False, button_icons=None):
+def _player_portrait_size(rect):
+    # slightly smaller portrait + a bit more horizontal breathing room
+    return min(200, max(148, (rect.w - 22) - 40))
+
+def draw_player_panel(surface, rect, state, portrait_path=None, *, hotspots=None, mouse_vpos=None, show_sheet=False, button_icons=None, portrait_surface=None):
+    # portrait_surface: a ready card of (size - 6)² (see Frontend._player_portrait_card)
+    # so the panel skips the per-frame lookup; otherwise we load it here.
     if rect.w <= 0 or rect.h <= 0:
         return
 
     draw_panel(surface, rect)
     inner = rect.inflate(-22, -22)
 
-    # slightly smaller portrait + a bit more horizontal breathing room
-    portrait_size = min(200, max(148, inner.w - 40))
+    portrait_size = _player_portrait_size(rect)
     portrait_rect = pygame.Rect(
         inner.x + (inner.w - portrait_size) // 2,
         inner.y + 2,
@@ -1209,7 +1733,7 @@ def draw_player_panel(surface, rect, state, portrait_path=None, *, hotspots=None
         or getattr(state, "player_portrait_path", None)
         or getattr(getattr(state, "player", None), "portrait_path", None)
     )
-    portrait = load_image_or_fill(src, (portrait_size - 6, portrait_size - 6))
+    portrait = portrait_surface or load_image_or_fill(src, (portrait_size - 6, portrait_size - 6))
     pygame.draw.rect(surface, (30, 34, 44, 230), portrait_rect, border_radius=12)
     surface.blit(
         portrait,
@@ -1231,8 +1755,8 @@ def draw_player_panel(surface, rect, state, portrait_path=None, *, hotspots=None
     hp_txt = f"HP {state.player.hp}"
     atk_txt = f"ATK {state.player.attack}"
     hp_color = C_GOOD if state.player.hp > 35 else C_WARN
-    hp_surf = FONT_MAIN.render(hp_txt, True, hp_color)
-    atk_surf = FONT_MAIN.render(atk_txt, True, C_TEXT)
+    hp_surf = render_text(FONT_MAIN, hp_txt, hp_color)
+    atk_surf = render_text(FONT_MAIN, atk_txt, C_TEXT)
 
     row_x = inner.x + 6
     surface.blit(hp_surf, (row_x, y))
@@ -1257,8 +1781,7 @@ def draw_player_panel(surface, rect, state, portrait_path=None, *, hotspots=None
     buffs = list(getattr(state.player, "buffs", []))
     if buffs:
         for buff in buffs[:3]:
-            mods = ", ".join(f"{k}{v:+d}" for k, v in buff.stat_mods.items())
-            draw_text(surface, f"{buff.name} ({mods}) {buff.duration_turns}t", inner.x + 8, y, C_TEXT, FONT_THIN)
+            draw_text(surface, buff.display_str, inner.x + 8, y, C_TEXT, FONT_THIN)
             y += line_h
         if len(buffs) > 3:
             draw_text(surface, "…", inner.x + 8, y, C_MUTED, FONT_THIN)
@@ -1306,7 +1829,8 @@ def draw_player_panel(surface, rect, state, portrait_path=None, *, hotspots=None
         if icon:
             pad = 5
             size = btn_size - pad * 2
-            icon_surf = pygame.transform.smoothscale(icon, (size, size))
+            # Buttons are a fixed size, so this is a _SCALED_CACHE hit after the first frame.
+            icon_surf = _scaled(icon, size, size)
             surface.blit(icon_surf, (btn_rect.x + pad, btn_rect.y + pad))
         else:
             draw_text(
@@ -1325,6 +1849,38 @@ def draw_player_panel(surface, rect, state, portrait_path=None, *, hotspots=None
 # -----------------------------------------------------------------------------
 # Overlay: Character Sheet / Inventory
 # -----------------------------------------------------------------------------
+# The rendered journal column: (state, key, Surface, content height). Rebuilt only
+# when journal_add bumps state.journal_version or the column size/font
+# changes, so an open sheet no longer re-wraps and re-draws every entry.
+_JOURNAL_SURF = None
+
+def _journal_surface(state, journal_inner, line_h):
+    global _JOURNAL_SURF
+    journal_entries = getattr(state, "journal", [])
+    key = (getattr(state, "journal_version", 0), len(journal_entries),
+           journal_inner.w, journal_inner.h, line_h, FONT_THIN)
+    if _JOURNAL_SURF is not None and _JOURNAL_SURF[0] is state and _JOURNAL_SURF[1] == key:
+        return _JOURNAL_SURF[2], _JOURNAL_SURF[3]
+    journal_surface_h = max(journal_inner.h, 160 + max(1, len(journal_entries)) * (line_h * 6))
+    # Journal uses a tall surface so we can scroll long entries up and down.
+    journal_surface = _scroll_surface("sheet:journal", max(40, journal_inner.w), journal_surface_h)
+    jy = 0
+    journal_wrap = _cols(FONT_THIN, journal_inner.w, pad=12, minimum=28)
+    seq = []
+    if journal_entries:
+        for entry in journal_entries:
+            for line in wrap_text(entry, journal_wrap):
+                seq.append((render_text(FONT_THIN, line, C_TEXT), (4, jy)))
+                jy += line_h
+            # Extra gap to visually separate journal entries.
+            jy += line_h // 2
+    else:
+        seq.append((render_text(FONT_THIN, "(no entries yet)", C_MUTED), (4, jy)))
+        jy += line_h
+    blit_batch(journal_surface, seq)
+    _JOURNAL_SURF = (state, key, journal_surface, max(jy, 1))
+    return journal_surface, _JOURNAL_SURF[3]
+
 def draw_character_sheet(surface, state, portrait_path=None, *, hotspots=None, mouse_vpos=None, scroll_offsets=None, regions=None):
     # Full-screen overlay with three columns: allies, bio, and journal.
     overlay = pygame.Surface((VIRTUAL_W, VIRTUAL_H), pygame.SRCALPHA)
@@ -1369,20 +1925,28 @@ def draw_character_sheet(surface, state, portrait_path=None, *, hotspots=None, m
     comp_inner.height = max(40, comp_inner.h)
     if regions is not None:
         regions["sheet:companions"] = comp_inner.copy()
-    companions = [c for c in getattr(state, "companions", []) if getattr(c, "alive", True)]
+    companions = _actor_buckets(state)[0]
     line_h = max(18, int(FONT_THIN.get_height() * 1.05))
     comp_portrait_size = min(120, max(72, comp_inner.w // 3 + 24))
     estimated_rows = max(1, len(companions))
     comp_surface_h = max(comp_inner.h, 120 + estimated_rows * (comp_portrait_size + 96))
     # Draw companions onto an off-screen surface so we can scroll easily.
-    comp_surface = pygame.Surface((max(40, comp_inner.w), comp_surface_h), pygame.SRCALPHA)
+    comp_surface = _scroll_surface("sheet:companions", max(40, comp_inner.w), comp_surface_h)
     cy = 0
+    # Cards are a fixed height, so the clamped scroll is known before drawing
+    # and cards scrolled fully out of the column can be skipped.
+    comp_row_stride = comp_portrait_size + 80 + 12
+    vis_top = max(0, min(comp_scroll, len(companions) * comp_row_stride - comp_inner.h))
+    vis_bottom = vis_top + comp_inner.h
     if companions:
         for comp in companions:
             # Each companion gets its own card with art and a short write-up.
             row_rect = pygame.Rect(0, cy, comp_inner.w, comp_portrait_size + 80)
+            if row_rect.bottom <= vis_top or row_rect.top >= vis_bottom:
+                cy = row_rect.bottom + 12
+                continue
             pygame.draw.rect(comp_surface, (30, 34, 44, 220), row_rect, border_radius=12)
-            portrait = load_image_or_fill(getattr(comp, "portrait_path", None), (comp_portrait_size, comp_portrait_size))
+            portrait = get_portrait_scaled(getattr(comp, "portrait_path", None), (comp_portrait_size, comp_portrait_size))
             portrait_box = pygame.Rect(row_rect.x + 12, row_rect.y + 12, comp_portrait_size, comp_portrait_size)
             comp_surface.blit(
                 portrait,
@@ -1403,7 +1967,7 @@ def draw_character_sheet(surface, state, portrait_path=None, *, hotspots=None, m
             desc = getattr(comp, "bio", "") or getattr(comp, "desc", "")
             if desc:
                 # Wrap the bio so it stays within the card width.
-                wrap_w = max(20, (comp_inner.w - comp_portrait_size - 40) // 7)
+                wrap_w = _cols(FONT_THIN, comp_inner.w - comp_portrait_size, pad=40)
                 for line in wrap_text(desc, wrap_w):
                     draw_text(comp_surface, line, text_x, text_y, C_TEXT, FONT_THIN)
                     text_y += line_h
@@ -1429,23 +1993,7 @@ def draw_character_sheet(surface, state, portrait_path=None, *, hotspots=None, m
     journal_inner.height = max(40, journal_inner.h)
     if regions is not None:
         regions["sheet:journal"] = journal_inner.copy()
-    journal_entries = list(getattr(state, "journal", []))
-    journal_surface_h = max(journal_inner.h, 160 + max(1, len(journal_entries)) * (line_h * 6))
-    # Journal uses a tall surface so we can scroll long entries up and down.
-    journal_surface = pygame.Surface((max(40, journal_inner.w), journal_surface_h), pygame.SRCALPHA)
-    jy = 0
-    journal_wrap = max(28, (journal_inner.w - 12) // 7)
-    if journal_entries:
-        for entry in journal_entries:
-            for line in wrap_text(entry, journal_wrap):
-                draw_text(journal_surface, line, 4, jy, C_TEXT, FONT_THIN)
-                jy += line_h
-            # Extra gap to visually separate journal entries.
-            jy += line_h // 2
-    else:
-        draw_text(journal_surface, "(no entries yet)", 4, jy, C_MUTED, FONT_THIN)
-        jy += line_h
-    journal_content_h = max(jy, 1)
+    journal_surface, journal_content_h = _journal_surface(state, journal_inner, line_h)
     journal_max_scroll = max(0, journal_content_h - journal_inner.h)
     # Same scroll clamp trick as the companions column.
     journal_scroll = max(0, min(journal_scroll, journal_max_scroll))
@@ -1522,7 +2070,7 @@ def draw_character_sheet(surface, state, portrait_path=None, *, hotspots=None, m
     if not bio_entries and getattr(state.player, "appearance", None):
         bio_entries.append(state.player.appearance)
     bio_text = "\n\n".join(bio_entries)
-    wrap_w = max(32, (center_inner.w - 24) // 7)
+    wrap_w = _cols(FONT_THIN, center_inner.w, pad=24, minimum=32)
     for line in wrap_text(bio_text, wrap_w):
         draw_text(surface, line, center_inner.x + 12, cy, C_TEXT, FONT_THIN)
         cy += line_h
@@ -1538,27 +2086,31 @@ def draw_situation(surface, rect, state):
     plan = state.blueprint.acts[state.act.index]
     text = state.combined_turn_text or state.act.situation or plan.intro_paragraph
     y = rect.y + 8
-    for line in wrap_text(text, max(50, (rect.w - 16)//7)):
-        draw_text(surface, line, rect.x + 12, y, C_TEXT, FONT_THIN)
+    seq = []
+    for line in wrap_text(text, _cols(FONT_THIN, rect.w, minimum=50)):
+        seq.append((render_text(FONT_THIN, line, C_TEXT), (rect.x + 12, y)))
         y += int(FONT_THIN.get_height() * 1.2)
         if y > rect.bottom - 18:
             break
+    blit_batch(surface, seq)
     # To always show full text, remove the break and let the scrollbar handle overflow.
 
 def draw_options_vertical(surface, rect, option_lines, mouse_vpos=None):
     # Action list sits under the story text. Each entry is keyboard-friendly.
     draw_panel(surface, rect)
     # Lower max_cols if you want shorter lines for a mobile-style layout.
-    max_cols = max(30, (rect.w - 24) // 7)
+    max_cols = _cols(FONT_OPT, rect.w, pad=24, minimum=30)
     y = rect.y + 12
     # Increase the spacing here if you prefer more breathing room.
     line_gap = max(18, int(FONT_OPT.get_height() * 1.1))
+    # Rows never overlap, so the text goes out in one batch after the hover strips.
+    seq = []
     # For numbered buttons, you can prepend emojis by editing prefix below.
     for hotkey, text in option_lines:
         prefix = f"[{hotkey}] "
         wrapped = wrap_text(text, max_cols - len(prefix))
         if not wrapped:
-            wrapped = [""]
+            wrapped = ("",)
 
         # hover strip for first line only
         row_rect = pygame.Rect(rect.x+10, y-2, rect.w-20, line_gap)
@@ -1567,23 +2119,51 @@ def draw_options_vertical(surface, rect, option_lines, mouse_vpos=None):
             # This translucent bar hints at the clickable hitbox.
             pygame.draw.rect(surface, (50,50,58,80), row_rect, border_radius=6)
 
-        draw_text(surface, prefix + wrapped[0], rect.x + 12, y, C_TEXT, FONT_OPT)
+        seq.append((render_text(FONT_OPT, prefix + wrapped[0], C_TEXT), (rect.x + 12, y)))
         y += line_gap
         for cont in wrapped[1:]:
-            draw_text(surface, " " * len(prefix) + cont, rect.x + 12, y, C_TEXT, FONT_OPT)
+            seq.append((render_text(FONT_OPT, " " * len(prefix) + cont, C_TEXT), (rect.x + 12, y)))
             y += line_gap
+    blit_batch(surface, seq)
 
 # -----------------------------------------------------------------------------
 # MENUS / INPUT DIALOGS (drawn on virtual)
 # -----------------------------------------------------------------------------
+# The only event types the game screens react to. Everything else (mouse
+# motion fires hundreds of times a second) is blocked at the SDL queue so it
+# is never copied into Python lists; hover still reads pygame.mouse.get_pos().
+UI_EVENT_TYPES = (
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.TEXTINPUT,  # SDL2 fills KEYDOWN.unicode from these; typing needs them
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEWHEEL,
+    pygame.VIDEORESIZE,
+)
+
+def _limit_event_types():
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(list(UI_EVENT_TYPES))
+
+# Modal dialogs only animate the fog, so they idle at a gentler rate than the
+# main loop. Input still wakes them immediately.
+MODAL_FPS = 30
+
+def _wait_events(timeout_ms):
+    """Sleep until an event arrives (or timeout_ms passes); return all pending events."""
+    first = pygame.event.wait(timeout_ms)
+    if first.type == pygame.NOEVENT:
+        return []
+    return [first] + pygame.event.get()
+
 def input_dialog(screen, prompt, maxlen=120):
     # Simple text entry box rendered on the virtual canvas.
     clock = pygame.time.Clock()
     buffer = ""
     while True:
-        clock.tick(FPS)
-        dt = clock.get_time()/1000.0
-        for e in pygame.event.get():
+        events = _wait_events(1000 // MODAL_FPS)
+        dt = clock.tick(FPS)/1000.0
+        for e in events:
             if e.type == pygame.QUIT:
                 return ""
             if e.type == pygame.KEYDOWN:
@@ -1635,9 +2215,9 @@ def menu_dialog(screen, title, options):
     clock = pygame.time.Clock()
     idx = 0
     while True:
-        clock.tick(FPS)
-        dt = clock.get_time()/1000.0
-        for e in pygame.event.get():
+        events = _wait_events(1000 // MODAL_FPS)
+        dt = clock.tick(FPS)/1000.0
+        for e in events:
             if e.type == pygame.QUIT:
                 return -1
             if e.type == pygame.KEYDOWN:
@@ -1666,7 +2246,9 @@ def menu_dialog(screen, title, options):
         base_y = 120
         mouse_v = None
         vp, _ = compute_viewport(*screen.get_size())
+        # Poll the mouse once per frame and hand the result to every button.
         sp = pygame.mouse.get_pos()
+        pressed = pygame.mouse.get_pressed()[0]
         mv = screen_to_virtual(sp[0], sp[1], vp)
         if mv:
             mouse_v = mv
@@ -1674,7 +2256,7 @@ def menu_dialog(screen, title, options):
         for i, label in enumerate(options):
             rect = pygame.Rect(40, base_y+i*52, 420, 40)
             hovered = button(virtual, rect, label, None, True, mouse_pos=mouse_v)
-            if hovered and pygame.mouse.get_pressed()[0]:
+            if hovered and pressed:
                 return i
             if i == idx:
                 # Outline the keyboard-selected option.
@@ -1689,6 +2271,9 @@ def menu_dialog(screen, title, options):
 # -----------------------------------------------------------------------------
 # MONKEY PATCHES (combat overlay)
 # -----------------------------------------------------------------------------
+COMBAT_MENU_LINES = ("  [1] Attack", "  [2] Use Item", "  [3] Parley (talk)",
+                     "  [4] Sneak away (AGI)", "  [5] Observe weakness", "  [0] Back")
+
 def ui_combat_turn(state, enemy, g):
     try:
         # Ask the image pipeline for a fresh combat illustration if possible.
@@ -1704,8 +2289,11 @@ def ui_combat_turn(state, enemy, g):
     selection = None
     # Keep looping until the player taps one of the hotkeys.
     while selection is None:
+        # The overlay is static, so only redraw when something happens
+        # (the timeout still repaints now and then, e.g. after a resize).
+        events = _wait_events(250)
         clock.tick(FPS)
-        for e in pygame.event.get():
+        for e in events:
             if e.type == pygame.QUIT:
                 return True
             if e.type == pygame.KEYDOWN:
@@ -1723,8 +2311,7 @@ def ui_combat_turn(state, enemy, g):
         y = box.y + 16
         draw_text(virtual, f"-- COMBAT with {enemy.name} (HP {enemy.hp}, ATK {enemy.attack}) --",
                   box.x+16, y, font=FONT_BIG); y += 34
-        for line in ["  [1] Attack", "  [2] Use Item", "  [3] Parley (talk)",
-                     "  [4] Sneak away (AGI)", "  [5] Observe weakness", "  [0] Back"]:
+        for line in COMBAT_MENU_LINES:
             draw_text(virtual, line, box.x+16, y, font=FONT_MAIN); y += 28
 
         vp, _ = compute_viewport(*screen.get_size())
@@ -1842,6 +2429,41 @@ def start_music():
 # -----------------------------------------------------------------------------
 # FRONTEND
 # -----------------------------------------------------------------------------
+# Baseline verbs under the special options; always shown, even if specials fail.
+BASE_OPTION_LINES = (
+    ("4", "Observe the area carefully"),
+    ("5", "Attack (enter combat)"),
+    ("6", "Talk to a discovered actor"),
+    ("7", "Use (inventory/environment)"),
+    ("8", "Custom action (SPECIAL; limited uses per act)"),
+    ("0", "End Turn (wait)"),
+)
+
+def _prewarm_text_cache():
+    """Render the fixed HUD labels (and the console glyph atlas) before frame one."""
+    # Costs a few ms at startup; saves the first-frame hitch of rasterizing
+    # every label at once. Add strings here when you add static labels.
+    muted_thin = ("Campaign:", "This Act Goal:", "Companions", "Characters In Area",
+                  "Enemies In Area", "Inventory", "(none)", "(empty)", "Buffs / Debuffs:")
+    for text in muted_thin:
+        render_text(FONT_THIN, text, C_MUTED)
+    for text in ("Sheet", "Info", "Camp", "Opts"):
+        render_text(FONT_THIN, text, C_TEXT)
+    for key, label in BASE_OPTION_LINES:
+        render_text(FONT_OPT, f"[{key}] {label}", C_TEXT)
+    for line in COMBAT_MENU_LINES:
+        render_text(FONT_MAIN, line, C_TEXT)
+    _glyph_atlas(FONT_THIN, C_TEXT)
+
+def _prewarm_panels(layout):
+    """Bake the nine-slice backgrounds for the fixed layout before frame one."""
+    # The virtual canvas never resizes, so these are the only panel sizes the
+    # main screen uses; window resizes only change the final scale pass.
+    _, sit_r, opts_r, mid_r, right_r = layout
+    for rect in (sit_r, opts_r, mid_r, right_r, _status_layout(*right_r)[2]):
+        if rect.w > 0 and rect.h > 0:
+            _baked_panel(rect.w, rect.h)
+
 def _extract_option_desc(opt, state, g):
     # Options can be tuples, dicts, or simple strings; find something readable.
     try:
@@ -1866,6 +2488,7 @@ class Frontend:
         self.screen_flags = get_last_window_flags()
         pygame.display.set_caption("RP-GPT6 — Pygame UI")
         virtual = pygame.Surface((VIRTUAL_W, VIRTUAL_H)).convert_alpha()
+        _limit_event_types()
         # Change 1280x900 above to match your preferred window size.
 
         # per-frame fonts
@@ -1874,6 +2497,7 @@ class Frontend:
         FONT_MAIN = ui_font(18, scale); FONT_THIN = ui_font(16, scale)
         FONT_BIG  = ui_font(26, scale); FONT_OPT  = ui_font(16, scale)
         # Try different base pixel sizes if you swap to another typeface.
+        _prewarm_text_cache()
 
         # Load UI assets; missing files simply fall back to plain panels.
         BG_IMG = load_image(BG_PATH, alpha=False)
@@ -1927,10 +2551,9 @@ class Frontend:
         self.clock = pygame.time.Clock()
         self.running = True
         self.paused = False
-        self._image_executor = ThreadPoolExecutor(max_workers=2)
-        self._image_lock = Lock()
+        self._start_image_workers()
         self.t0 = time.time()
-        # Increase max_workers if you expect multiple images per turn.
+        # Raise IMAGE_WORKERS if you expect many images per turn.
 
         # Splash some banner text into the terminal for quick debugging.
         print("="*78); print("RP-GPT6 — UI".center(78)); print("="*78)
@@ -1970,6 +2593,9 @@ class Frontend:
         self.ui_hotspots = {}
         self.ui_regions = {}
         self.last_viewport = pygame.Rect(0, 0, VIRTUAL_W, VIRTUAL_H)
+        # Panels live on the fixed virtual canvas, so the layout never changes.
+        self._layout = layout_regions()
+        _prewarm_panels(self._layout)
         self.show_character_sheet = False
         self.mid_panel_scroll = 0
         self.right_panel_scroll = 0
@@ -2022,31 +2648,70 @@ class Frontend:
             pass
         return p
 
-    def _fetch_and_store_image(self, evt, initial=False):
-        # Spawned on a worker thread; downloads an image and updates paths.
-        if not getattr(self.state, "images_enabled", True):
-            return
-        try:
-            path = fetch_image_for_event(evt)
-        except Exception as exc:
-            add_console(f"[Image] Error fetching {evt.kind}: {exc}")
-            return
-        if not path:
+    def _start_image_workers(self):
+        # Downloads run on daemon threads fed by _img_in; finished (evt, path,
+        # initial, seq) tuples come back on _img_out and the UI thread applies
+        # them, so the render loop never waits on HTTP.
+        self._img_in = queue.Queue()
+        self._img_out = queue.Queue()
+        self._image_seq = 0        # submission order of image events
+        self._image_applied = {}   # slot ("main"/"portrait") -> newest seq shown
+        self._img_threads = [
+            threading.Thread(target=self._img_worker, name=f"rpgpt-img-{i}", daemon=True)
+            for i in range(IMAGE_WORKERS)
+        ]
+        for th in self._img_threads:
+            th.start()
+
+    def _stop_image_workers(self):
+        # One sentinel per worker; downloads in flight finish on their own.
+        for _ in getattr(self, "_img_threads", ()):
+            self._img_in.put(None)
+
+    def _img_worker(self):
+        # Worker thread: fetch until the sentinel arrives.
+        while True:
+            job = self._img_in.get()
+            if job is None:
+                return
+            evt, initial, seq = job
+            if not getattr(self.state, "images_enabled", True):
+                continue
+            try:
+                path = fetch_image_for_event(evt)
+            except Exception as exc:
+                add_console(f"[Image] Error fetching {evt.kind}: {exc}")
+                continue
+            if path:
+                self._img_out.put((evt, path, initial, seq))
+
+    def _store_image(self, evt, path, initial=False, seq=0):
+        # Runs on the UI thread once a download has finished.
+        slot = "portrait" if evt.kind in ("player_portrait",) else "main"
+        # Downloads run side by side, so a slow older image must not
+        # replace a newer one that already landed in the same slot.
+        if seq < self._image_applied.get(slot, 0):
             return
-        with self._image_lock:
-            if evt.kind in ("player_portrait",):
-                self.player_portrait_path = path
-                setattr(self.state, "player_portrait_path", path)
-                setattr(self.state, "last_portrait_path", path)
-            else:
-                self.last_main_image_path = path
-                self.state.last_image_path = path
+        self._image_applied[slot] = seq
+        if slot == "portrait":
+            self.player_portrait_path = path
+            setattr(self.state, "player_portrait_path", path)
+            setattr(self.state, "last_portrait_path", path)
+        else:
+            self.last_main_image_path = path
+            self.state.last_image_path = path
         # Hook: store the filename on evt if you want to cache per-scene art.
         if initial:
             add_console(f"[Image] {evt.kind} prepared.")
 
     def _process_image_events(self, initial=False):
-        # Drain the queue and hand each image fetch to the thread pool.
+        # Apply finished downloads, then hand new events to the workers.
+        while True:
+            try:
+                done = self._img_out.get_nowait()
+            except queue.Empty:
+                break
+            self._store_image(*done)
         if not getattr(self.state, "images_enabled", True):
             self.state.image_events.clear()
             return
@@ -2055,8 +2720,9 @@ class Frontend:
         if not events:
             return
         for evt in events:
-            self._image_executor.submit(self._fetch_and_store_image, evt, initial)
-        # To debug prompts without downloads, comment out the submit() line.
+            self._image_seq += 1
+            self._img_in.put((evt, initial, self._image_seq))
+        # To debug prompts without downloads, comment out the put() line.
 
     def _handle_hotspot_click(self, pos) -> bool:
         # Convert the click to virtual coordinates and trigger matching handler.
@@ -2151,6 +2817,21 @@ class Frontend:
             draw_image_frame(virtual, img_frame, border=30)
         # Remove the branch above if you prefer the plain stone frame.
 
+    def _player_portrait_card(self, rect):
+        # Built once per (portrait path, size); a new download changes the
+        # path, which is the only time the card needs rebuilding.
+        side = _player_portrait_size(rect) - 6
+        src = (
+            self.player_portrait_path
+            or getattr(self.state, "player_portrait_path", None)
+            or getattr(getattr(self.state, "player", None), "portrait_path", None)
+        )
+        key = (src, side)
+        if key != getattr(self, "_portrait_card_key", None):
+            self._portrait_card = load_image_or_fill(src, (side, side))
+            self._portrait_card_key = key
+        return self._portrait_card
+
     def _draw_options(self, rect, mouse_vpos=None):
         # Build the action list on demand so it always reflects latest state.
         if not self.last_explore_options:
@@ -2178,14 +2859,7 @@ class Frontend:
             opt_lines.extend([("1","Option 1"), ("2","Option 2"), ("3","Option 3")])
 
         # Baseline verbs always exist, even if specials are missing.
-        opt_lines.extend([
-            ("4", "Observe the area carefully"),
-            ("5", "Attack (enter combat)"),
-            ("6", "Talk to a discovered actor"),
-            ("7", "Use (inventory/environment)"),
-            ("8", "Custom action (SPECIAL; limited uses per act)"),
-            ("0", "End Turn (wait)")
-        ])
+        opt_lines.extend(BASE_OPTION_LINES)
         if getattr(self.state, "passive_bystanders", []):
             opt_lines.append(("9", "Leave quietly (bystander nearby)"))
 
@@ -2196,11 +2870,29 @@ class Frontend:
         """Legacy stub: the game now drops straight into play."""
         return
 
+    def _frame_fingerprint(self, mouse_vpos):
+        """Cheap tuple of everything the panels show; equal tuples mean an idle frame."""
+        st = self.state
+        return (
+            st.player.hp,
+            st.act.index,
+            st.act.turns_taken,
+            st.act.goal_progress,
+            st.pressure,
+            _CONSOLE_TOTAL,
+            self.last_main_image_path,
+            self.player_portrait_path,
+            id(self.last_explore_options),
+            self.show_character_sheet,
+            self.right_panel_scroll,
+            mouse_vpos,
+        )
+
     def run(self):
         # Main game loop: handle input, render virtual canvas, blit to window.
         try:
             while self.running:
-                self.clock.tick(FPS)
+                self.clock.tick(IDLE_FPS if getattr(self, "_idle", False) else FPS)
                 dt = self.clock.get_time()/1000.0
 
                 # viewport + scaling + per-frame fonts
@@ -2218,7 +2910,8 @@ class Frontend:
                     mouse_vpos = mv
 
                 # Handle window/input events before drawing.
-                for e in pygame.event.get():
+                events = pygame.event.get()
+                for e in events:
                     if e.type == pygame.QUIT:
                         # Window close button.
                         self.running = False
@@ -2227,6 +2920,7 @@ class Frontend:
                         base_flags = getattr(self, "screen_flags", FLAGS)
                         self.screen = set_mode_resilient(e.size, base_flags)
                         self.screen_flags = get_last_window_flags()
+                        self._presented_vp = None  # new surface: repaint the bars
                     elif e.type == pygame.KEYDOWN:
                         # Keyboard drives most actions.
                         if self.show_character_sheet:
@@ -2249,11 +2943,7 @@ class Frontend:
                             continue
                     elif e.type == pygame.MOUSEWHEEL:
                         # Scroll the panel under the pointer.
-                        vp_rect = self.last_viewport
-                        if not vp_rect:
-                            continue
-                        mx, my = pygame.mouse.get_pos()
-                        virt = screen_to_virtual(mx, my, vp_rect)
+                        virt = mouse_vpos  # polled once at the top of the frame
                         if not virt:
                             continue
                         scroll_delta = e.y * 60
@@ -2308,6 +2998,19 @@ class Frontend:
 
                 self._process_image_events()
 
+                # The backdrop animates, so every frame still draws; an unchanged
+                # fingerprint with no input only drops the loop to IDLE_FPS.
+                fp = self._frame_fingerprint(mouse_vpos)
+                self._idle = not events and fp == getattr(self, "_last_fp", None)
+                self._last_fp = fp
+
+                # Nothing is on screen while the window is minimised (or squashed
+                # to zero size), so skip drawing and presenting until it returns.
+                if not pygame.display.get_active() or vp.w <= 0 or vp.h <= 0:
+                    self._idle = True
+                    self._presented_vp = None  # repaint everything on restore
+                    continue
+
                 # ----- DRAW FRAME (to virtual) -----
                 virtual.fill((0,0,0,0))
 
@@ -2327,7 +3030,7 @@ class Frontend:
                     )
 
                 # 3) UI panels
-                scene_r, sit_r, opts_r, mid_r, right_r = layout_regions()
+                scene_r, sit_r, opts_r, mid_r, right_r = self._layout
                 self._draw_image_panel(scene_r)
                 draw_situation(virtual, sit_r, self.state)
                 self._draw_options(opts_r, mouse_vpos)
@@ -2340,6 +3043,7 @@ class Frontend:
                     mouse_vpos=mouse_vpos,
                     show_sheet=self.show_character_sheet,
                     button_icons=getattr(self, "button_icons", None),
+                    portrait_surface=self._player_portrait_card(mid_r),
                 )
                 self.right_panel_scroll = draw_status_and_console(
                     virtual,
@@ -2392,10 +3096,20 @@ class Frontend:
 
                 # ----- SCALE & PRESENT -----
                 # Convert the virtual canvas to the real window size.
-                scaled = pygame.transform.smoothscale(virtual, (vp.w, vp.h))
-                self.screen.fill((0,0,0))
-                self.screen.blit(scaled, vp)
-                pygame.display.flip()
+                # Fog and parallax move every frame, so the viewport is always
+                # dirty; the letterbox bars around it only change on resize.
+                if vp.size == virtual.get_size():
+                    scaled = virtual  # 1:1 window, nothing to resample
+                else:
+                    scaled = pygame.transform.smoothscale(virtual, (vp.w, vp.h))
+                if vp != getattr(self, "_presented_vp", None):
+                    self.screen.fill((0,0,0))
+                    self.screen.blit(scaled, vp)
+                    pygame.display.flip()
+                    self._presented_vp = vp
+                else:
+                    self.screen.blit(scaled, vp)
+                    pygame.display.update(vp)
 
                 endmsg = self.state.is_game_over()
                 if endmsg:
@@ -2405,7 +3119,7 @@ class Frontend:
                     pygame.time.wait(1200)
                     self.running = False
         finally:
-            self._image_executor.shutdown(wait=False)
+            self._stop_image_workers()
             pygame.quit()
 
     def handle_action(self, key):
@@ -2456,6 +3170,7 @@ def launch_ui_game_prepared(state, g, text_zoom=1.25, window_size=(1280,900), mu
     active_flags = get_last_window_flags()
     pygame.display.set_caption("RP-GPT6 — Pygame UI")
     virtual = pygame.Surface((VIRTUAL_W, VIRTUAL_H)).convert_alpha()
+    _limit_event_types()
     # Change window_size or text_zoom here for a kiosk build of the game.
 
     # Fonts for first frame
@@ -2463,6 +3178,7 @@ def launch_ui_game_prepared(state, g, text_zoom=1.25, window_size=(1280,900), mu
     global FONT_MAIN, FONT_THIN, FONT_BIG, FONT_OPT
     FONT_MAIN = ui_font(18, scale); FONT_THIN = ui_font(16, scale)
     FONT_BIG  = ui_font(26, scale); FONT_OPT  = ui_font(16, scale)
+    _prewarm_text_cache()
 
     # Load UI assets (already in __init__, duplicated here for the alt path)
     global BG_IMG, FOG_IMG, NINE9
@@ -2494,8 +3210,7 @@ def launch_ui_game_prepared(state, g, text_zoom=1.25, window_size=(1280,900), mu
     fe.clock = pygame.time.Clock()
     fe.running = True
     fe.paused = False
-    fe._image_executor = ThreadPoolExecutor(max_workers=2)
-    fe._image_lock = Lock()
+    fe._start_image_workers()
     fe.t0 = time.time()
     # Mirror the defaults __init__ would have set.
     fe.g = g
@@ -2536,6 +3251,8 @@ def launch_ui_game_prepared(state, g, text_zoom=1.25, window_size=(1280,900), mu
     fe.ui_hotspots = {}
     fe.ui_regions = {}
     fe.last_viewport = pygame.Rect(0, 0, VIRTUAL_W, VIRTUAL_H)
+    fe._layout = layout_regions()
+    _prewarm_panels(fe._layout)
     fe.show_character_sheet = False
     fe.mid_panel_scroll = 0
     fe.right_panel_scroll = 0
@@ -2554,5 +3271,5 @@ def launch_ui_game_prepared(state, g, text_zoom=1.25, window_size=(1280,900), mu
     try:
         fe.run()          # jump straight into the adventure loop
     finally:
-        fe._image_executor.shutdown(wait=False)
+        fe._stop_image_workers()
         pygame.quit()
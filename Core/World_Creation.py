@@ -30,6 +30,7 @@ from Core.UI_Helpers import (
     draw_fog_with_flicker,
     load_image,
     parallax_cover,
+    render_text,
     ui_font,
 )
 
@@ -726,11 +727,11 @@ class WorldCreationScreen:
 
         if self.message:
             msg_font = ui_font(18, scale)
-            self.virtual.blit(msg_font.render(self.message[:220], True, C_ACCENT), (details_panel.x, details_panel.bottom + 16))
+            self.virtual.blit(render_text(msg_font, self.message[:220], C_ACCENT), (details_panel.x, details_panel.bottom + 16))
 
         if self.pending_roll:
             roll_font = ui_font(16, scale)
-            text = roll_font.render("Rolling...", True, C_MUTED)
+            text = render_text(roll_font, "Rolling...", C_MUTED)
             self.virtual.blit(text, (details_panel.right - text.get_width() - 12, details_panel.bottom + 12))
 
         if self.screen:
@@ -748,7 +749,7 @@ class WorldCreationScreen:
         return None
 
     def _draw_world_list(self, rect: pygame.Rect, scale: float) -> None:
-        header = ui_font(26, scale).render("Worlds", True, C_TEXT)
+        header = render_text(ui_font(26, scale), "Worlds", C_TEXT)
         self.virtual.blit(header, (rect.x + 24, rect.y + 18))
         entries = ["Create New World"] + [summary.name for summary in self.saved_worlds]
         row_h = 86
@@ -777,7 +778,7 @@ class WorldCreationScreen:
                 border_radius=10,
             )
             font = ui_font(20, scale)
-            self.virtual.blit(font.render(name, True, C_TEXT), (row.x + 18, row.y + 22))
+            self.virtual.blit(render_text(font, name, C_TEXT), (row.x + 18, row.y + 22))
             self.rects[("list", index)] = row
 
         total_entries = len(entries)
@@ -809,7 +810,7 @@ class WorldCreationScreen:
             self.virtual.blit(surface, image_rect.topleft)
         else:
             hint_font = ui_font(20, 1.0)
-            text = hint_font.render("World portrait will be generated after creation.", True, C_MUTED)
+            text = render_text(hint_font, "World portrait will be generated after creation.", C_MUTED)
             self.virtual.blit(text, text.get_rect(center=image_rect.center))
         draw_image_frame(self.virtual, image_rect, border=34)
         button_y = min(rect.bottom - button_h - bottom_margin, image_rect.bottom + button_gap)
@@ -846,12 +847,12 @@ class WorldCreationScreen:
                 r.h,
             )
 
-        title = ui_font(28, scale).render("World Blueprint", True, C_TEXT)
+        title = render_text(ui_font(28, scale), "World Blueprint", C_TEXT)
         surf.blit(title, (x, y))
         y += 48
 
         hint_font = ui_font(16, scale)
-        note = hint_font.render("Acts and turns per act stay as configured.", True, C_MUTED)
+        note = render_text(hint_font, "Acts and turns per act stay as configured.", C_MUTED)
         surf.blit(note, (x, y))
         y += note.get_height() + gap
 
@@ -973,9 +974,9 @@ class WorldCreationScreen:
         )
         label_font = ui_font(18, scale)
         value_font = ui_font(22, scale)
-        surface.blit(label_font.render(label, True, C_MUTED), (rect.x + 16, rect.y + 10))
+        surface.blit(render_text(label_font, label, C_MUTED), (rect.x + 16, rect.y + 10))
         value = str(self.numbers.get(key, 0))
-        surface.blit(value_font.render(value, True, C_TEXT), (rect.x + 16, rect.y + 36))
+        surface.blit(render_text(value_font, value, C_TEXT), (rect.x + 16, rect.y + 36))
         minus_rect = pygame.Rect(rect.right - 118, rect.y + 12, 44, rect.h - 24)
         plus_rect = pygame.Rect(rect.right - 64, rect.y + 12, 44, rect.h - 24)
         draw_stepper_button(surface, minus_rect, "-", scale=scale, active=active)
@@ -995,7 +996,7 @@ class WorldCreationScreen:
     ) -> None:
         draw_button_frame(self.virtual, rect, active=focused, primary=primary, border=28)
         font = ui_font(24 if primary else 20, scale)
-        surf = font.render(label, True, C_TEXT)
+        surf = render_text(font, label, C_TEXT)
         self.virtual.blit(surf, surf.get_rect(center=rect.center))
 
     # ---------------------------------------------------------------- utility
@@ -37,6 +37,7 @@ from Core.UI_Helpers import (
     draw_text_field,
     load_image,
     parallax_cover,
+    render_text,
     ui_font,
 )
 from Core.Image_Gen import make_actor_portrait_prompt, pollinations_url, download_image
@@ -134,7 +135,7 @@ def _list_roster_entries() -> Dict[str, List[RosterEntry]]:
 def _draw_button(surface: pygame.Surface, rect: pygame.Rect, label: str, focused: bool, primary: bool = False, scale: float = 1.0) -> None:
     draw_button_frame(surface, rect, active=focused, primary=primary, border=26)
     font = ui_font(22 if primary else 18, scale)
-    surf = font.render(label, True, C_TEXT)
+    surf = render_text(font, label, C_TEXT)
     surface.blit(surf, surf.get_rect(center=rect.center))
 
 
@@ -278,7 +279,7 @@ class WorldRosterScreen:
             pygame.display.flip()
 
     def _draw_left(self, rect: pygame.Rect) -> None:
-        title = ui_font(24, 1.0).render("World Roster", True, C_TEXT)
+        title = render_text(ui_font(24, 1.0), "World Roster", C_TEXT)
         self.virtual.blit(title, (rect.x + 20, rect.y + 14))
 
         y = rect.y + 54
@@ -288,7 +289,7 @@ class WorldRosterScreen:
         idx = 0
         for label, role in sections:
             sec_font = ui_font(18, 1.0)
-            self.virtual.blit(sec_font.render(label, True, C_MUTED), (rect.x + 20, y))
+            self.virtual.blit(render_text(sec_font, label, C_MUTED), (rect.x + 20, y))
             y += 24
             entries = self.entries.get(role, [])
             for i, ent in enumerate(entries):
@@ -303,8 +304,8 @@ class WorldRosterScreen:
                 pygame.draw.rect(self.virtual, (120, 170, 230) if selected else (72, 72, 88), row, 2, border_radius=8)
                 name_font = ui_font(18, 1.0)
                 name = f"[x] {ent.name}" if selected else f"[ ] {ent.name}"
-                self.virtual.blit(name_font.render(name, True, C_TEXT), (row.x + 12, row.y + 8))
-                sub = ui_font(14, 1.0).render(ent.metadata.get("kind", "").title(), True, C_MUTED)
+                self.virtual.blit(render_text(name_font, name, C_TEXT), (row.x + 12, row.y + 8))
+                sub = render_text(ui_font(14, 1.0), ent.metadata.get("kind", "").title(), C_MUTED)
                 self.virtual.blit(sub, (row.x + 12, row.y + 32))
                 self.rects[("entry", role, i)] = row
                 if ent.portrait_path:
@@ -328,7 +329,7 @@ class WorldRosterScreen:
             pygame.draw.rect(self.virtual, (90, 120, 170, 220), knob, border_radius=2)
 
     def _draw_mid(self, rect: pygame.Rect) -> None:
-        hdr = ui_font(22, 1.0).render("Preview", True, C_TEXT)
+        hdr = render_text(ui_font(22, 1.0), "Preview", C_TEXT)
         self.virtual.blit(hdr, (rect.x + 20, rect.y + 10))
         inner = pygame.Rect(rect.x + 20, rect.y + 48, rect.w - 40, rect.h - 128)
         pygame.draw.rect(self.virtual, (24, 24, 32, 220), inner, border_radius=12)
@@ -353,7 +354,7 @@ class WorldRosterScreen:
 
     def _draw_right(self, rect: pygame.Rect) -> None:
         padding = 22
-        hdr = ui_font(24, 1.0).render("Character Info", True, C_TEXT)
+        hdr = render_text(ui_font(24, 1.0), "Character Info", C_TEXT)
         self.virtual.blit(hdr, (rect.x + padding, rect.y + padding))
 
         # toggle (fixed at top)
@@ -361,7 +362,7 @@ class WorldRosterScreen:
         label = "Allow random characters during play" if self.allow_random else "Only use preselected characters"
         pygame.draw.rect(self.virtual, (30, 30, 40, 220), toggle_rect, border_radius=8)
         pygame.draw.rect(self.virtual, (110, 150, 220), toggle_rect, 1, border_radius=8)
-        self.virtual.blit(ui_font(18,1.0).render(label, True, C_TEXT), (toggle_rect.x + 12, toggle_rect.y + 10))
+        self.virtual.blit(render_text(ui_font(18,1.0), label, C_TEXT), (toggle_rect.x + 12, toggle_rect.y + 10))
         self.rects[("toggle", "random")] = toggle_rect
 
         # scrollable view below
@@ -475,7 +476,7 @@ class WorldRosterScreen:
 
     def _draw_new_character_form(self, rect: pygame.Rect, y: int) -> None:
         padding = 22
-        self.virtual.blit(ui_font(20,1.0).render("Create New Character", True, C_ACCENT), (rect.x + padding, y))
+        self.virtual.blit(render_text(ui_font(20,1.0), "Create New Character", C_ACCENT), (rect.x + padding, y))
         y += 36
         keys = [
             ("name", "Name"),
@@ -154,7 +154,7 @@ from __future__ import annotations
 import json, random, re, sys
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Dict, List, Optional, Tuple, Any, Literal
+from typing import Dict, FrozenSet, List, Optional, Tuple, Any, Literal
 
 from Core.Music import init_music
 from Core.Helpers import (
@@ -297,6 +297,17 @@ class Stats:
 @dataclass
 class Buff:
     name:str; duration_turns:int; stat_mods:Dict[str,int]=field(default_factory=dict)
+    # (name, duration_turns, stat_mods, label) memo behind display_str; assign a new
+    # stat_mods dict rather than editing it in place so the label refreshes.
+    _display:Optional[tuple]=field(default=None, init=False, repr=False, compare=False)
+    @property
+    def display_str(self)->str:
+        """'Name (STR+1, AGI-2) 3t' as shown in the player panel."""
+        d=self._display
+        if d is None or d[0]!=self.name or d[1]!=self.duration_turns or d[2] is not self.stat_mods:
+            mods=", ".join(f"{k}{v:+d}" for k,v in self.stat_mods.items())
+            d=self._display=(self.name,self.duration_turns,self.stat_mods,f"{self.name} ({mods}) {self.duration_turns}t")
+        return d[3]
 
 @dataclass
 class Item:
@@ -359,6 +370,7 @@ class ActState:
     undiscovered:List[Actor]=field(default_factory=list)
     last_outcome:Optional[str]=None
     custom_uses:int=0
+    goal_terms:FrozenSet[str]=frozenset()  # lowercased words of the act goal, set once in begin_act
 
 @dataclass
 class ImageEvent:
@@ -368,19 +380,24 @@ class ImageEvent:
     extra: Dict[str, Any] = field(default_factory=dict)
 
 def queue_image_event(state:'GameState', kind:str, prompt:str, actors:Optional[List[str]]=None, extra:Optional[Dict[str,Any]]=None):
-    evt = ImageEvent(
-        kind=kind,
-        act_index=state.act.index if state and state.act else 1,
-        turn_index=state.act.turns_taken if state and state.act else 1,
-        prompt=prompt, actors=list(actors or []), extra=dict(extra or {})
-    )
-    state.image_events.append(evt)
+    queue_image_events(state, [{"kind":kind, "prompt":prompt, "actors":actors, "extra":extra}])
+
+def queue_image_events(state:'GameState', events:List[Dict[str,Any]]):
+    """Queue several image events at once; the jsonl log is opened a single time."""
+    act_index = state.act.index if state and state.act else 1
+    turn_index = state.act.turns_taken if state and state.act else 1
+    batch = [ImageEvent(
+        kind=e["kind"], act_index=act_index, turn_index=turn_index,
+        prompt=e["prompt"], actors=list(e.get("actors") or []), extra=dict(e.get("extra") or {})
+    ) for e in events]
+    if not batch: return
+    state.image_events.extend(batch)
     try:
         with open("./image_events.jsonl","a",encoding="utf-8") as f:
-            f.write(json.dumps({
+            f.write("".join(json.dumps({
                 "kind":evt.kind,"act_index":evt.act_index,"turn_index":evt.turn_index,
                 "prompt":evt.prompt,"actors":evt.actors,"extra":evt.extra
-            })+"\n")
+            })+"\n" for evt in batch))
     except Exception:
         pass
 
@@ -415,6 +432,7 @@ class GameState:
     # NEW: World Journal
     journal:List[str]=field(default_factory=list)
     journal_entry_count:int=0
+    journal_version:int=0   # bumped by journal_add on every new entry
     player_bio_entries:List[str]=field(default_factory=list)
     # NEW: per-turn flags
     rested_this_turn:bool=False
@@ -587,6 +605,7 @@ def begin_act(state:GameState, idx:int):
     actual_idx = idx if idx in acts else max(acts.keys())
     plan = acts[actual_idx]
     state.act = ActState(index=actual_idx)
+    state.act.goal_terms = frozenset(re.findall(r"\w+", plan.goal.lower()))
     if state.turns_per_act_override:
         state.act.turn_cap = state.turns_per_act_override
     state.act.situation=plan.intro_paragraph